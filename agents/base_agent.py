@@ -1,14 +1,22 @@
+import asyncio
+import functools
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-from langchain.agents import Tool, AgentExecutor, LLMSingleActionAgent
-from langchain.chains import LLMChain
-from langchain.llms import BaseLLM
-from langchain.prompts import StringPromptTemplate
+from time import time
+from typing import TYPE_CHECKING, List, Dict, Optional
 from src.blockchain.core import Blockchain
-from src.utils.crypto import hash_data, sign_data
+from src.blockchain.records import Transaction
+from src.utils.crypto import hash_data, sign_data, signed_payload
+from src.utils.metrics import timed
+from src.utils.signatures import DEFAULT_SCHEME, get_backend
 
-class AgentPromptTemplate(StringPromptTemplate, ABC):
-    template: str = """
+# langchain is imported when the first agent with an LLM builds its
+# executor, so headless agents (validators, signers) never load it
+if TYPE_CHECKING:
+    from langchain.agents import AgentExecutor, Tool
+    from langchain.llms import BaseLLM
+
+AGENT_PROMPT = """
     You are {agent_name}, a blockchain-enabled AI agent. 
     Your purpose: {agent_purpose}
     
@@ -27,23 +35,39 @@ class AgentPromptTemplate(StringPromptTemplate, ABC):
     Task: {input}
     {agent_scratchpad}"""
 
-    def format(self, **kwargs) -> str:
-        kwargs["tools"] = "\n".join(
-            [f"{tool.name}: {tool.description}" for tool in kwargs["tools"]]
-        )
-        kwargs["block_height"] = kwargs["blockchain"].chain[-1]["index"]
-        kwargs["pending_txs"] = len(kwargs["blockchain"].pending_transactions)
-        return self.template.format(**kwargs)
+@functools.lru_cache(maxsize=None)
+def _prompt_template_class():
+    from langchain.prompts import StringPromptTemplate
+
+    class AgentPromptTemplate(StringPromptTemplate, ABC):
+        template: str = AGENT_PROMPT
+
+        def format(self, **kwargs) -> str:
+            kwargs["tools"] = "\n".join(
+                [f"{tool.name}: {tool.description}" for tool in kwargs["tools"]]
+            )
+            kwargs["block_height"] = kwargs["blockchain"].chain[-1]["index"]
+            kwargs["pending_txs"] = len(kwargs["blockchain"].pending_transactions)
+            return self.template.format(**kwargs)
+
+    return AgentPromptTemplate
+
+def __getattr__(name: str):
+    # AgentPromptTemplate subclasses a langchain class, so it is built on access
+    if name == 'AgentPromptTemplate':
+        return _prompt_template_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class ChainSecAgent(ABC):
     def __init__(
         self,
         name: str,
         purpose: str,
-        tools: List[Tool],
+        tools: List["Tool"],
         blockchain: Blockchain,
-        llm: BaseLLM,
-        private_key: Optional[str] = None
+        llm: Optional["BaseLLM"] = None,
+        private_key: Optional[str] = None,
+        scheme: str = DEFAULT_SCHEME
     ):
         self.name = name
         self.purpose = purpose
@@ -51,11 +75,24 @@ class ChainSecAgent(ABC):
         self.blockchain = blockchain
         self.llm = llm
         self.private_key = private_key
-        self.agent_executor = self._create_agent_executor()
+        self.scheme = scheme
+        # Without an LLM the agent is headless: it signs and validates but
+        # has no executor, and execute() raises
+        self.agent_executor = self._create_agent_executor() if llm is not None else None
         self.public_key = self._derive_public_key() if private_key else ""
+        self.result_cache = None
+        self._nonce = 0
+        self._nonce_lock = threading.Lock()
+
+    @property
+    def headless(self) -> bool:
+        return self.agent_executor is None
 
-    def _create_agent_executor(self) -> AgentExecutor:
-        prompt = AgentPromptTemplate(
+    def _create_agent_executor(self) -> "AgentExecutor":
+        from langchain.agents import AgentExecutor, LLMSingleActionAgent
+        from langchain.chains import LLMChain
+
+        prompt = _prompt_template_class()(
             input_variables=["input", "agent_scratchpad"],
             partial_variables={
                 "agent_name": self.name,
@@ -80,40 +117,54 @@ class ChainSecAgent(ABC):
             verbose=True
         )
 
+    def _executor(self) -> "AgentExecutor":
+        if self.agent_executor is None:
+            raise ValueError(f"{self.name} is headless: no LLM configured")
+        return self.agent_executor
+
     def _derive_public_key(self) -> str:
-        """Derive public key from private key using RSA"""
-        from Crypto.PublicKey import RSA
-        key = RSA.import_key(self.private_key)
-        return key.publickey().export_key().decode()
+        """Derive public key from private key with the agent's signature scheme"""
+        return get_backend(self.scheme).public_key(self.private_key)
 
-    def sign_transaction(self, data: Dict) -> Dict:
+    def sign_transaction(self, data: Dict) -> Transaction:
         """Create signed transaction payload"""
         if not self.private_key:
             raise ValueError("Agent requires private key for signing")
             
-        signature = sign_data(self.private_key, data)
-        return {
-            **data,
-            "sender": self.name,
-            "public_key": self.public_key,
-            "signature": signature,
-            "timestamp": time(),
-            "nonce": self._generate_nonce()
-        }
+        signature = sign_data(self.private_key, signed_payload(data), self.scheme)
+        return Transaction(
+            data,
+            sender=self.name,
+            public_key=self.public_key,
+            scheme=self.scheme,
+            signature=signature,
+            timestamp=time(),
+            nonce=self._generate_nonce()
+        )
 
     def _generate_nonce(self) -> int:
-        """Generate unique transaction nonce"""
-        return int(time() * 1000) % 1000000
+        """
+        Generate unique transaction nonce
+        Millisecond clock, bumped so it strictly increases per agent:
+        the mempool keeps one transaction per (sender, nonce)
+        """
+        with self._nonce_lock:
+            self._nonce = max(self._nonce + 1, int(time() * 1000))
+            return self._nonce
 
+    @timed('agent.log_transaction')
     def log_transaction(self, receiver: str, data: dict) -> str:
-        """Submit transaction to blockchain network"""
+        """
+        Submit transaction to blockchain network
+        Raises ValueError if the mempool rejects it
+        """
         signed_tx = self.sign_transaction({
             "receiver": receiver,
             "data": data,
             "previous_hash": self.blockchain.hash(self.blockchain.last_block)
         })
         
-        self.blockchain.add_transaction(**signed_tx)
+        self.blockchain.queue_transaction(signed_tx)
         return hash_data(signed_tx)
 
     @abstractmethod
@@ -121,10 +172,71 @@ class ChainSecAgent(ABC):
         """Abstract method for custom output parsing"""
         pass
 
+    def enable_result_cache(self, **options) -> "ResultCache":
+        """
+        Reuse results of repeated tasks instead of calling the LLM again.
+        Options are passed to ResultCache (path, ttl, max_entries, ...).
+        """
+        from src.agents.result_cache import ResultCache
+
+        self.result_cache = ResultCache(**options)
+        return self.result_cache
+
+    def _result_key(self, task: str) -> str:
+        from src.agents.result_cache import result_key
+
+        return result_key(self.name, self.purpose, [tool.name for tool in self.tools], task)
+
+    def _cached_payload(self, key: str, cached: Dict) -> dict:
+        """Transaction data for a cache hit: a pointer, not a copy of the result"""
+        return {"type": "cached_result", "task_hash": key, "result_tx": cached['tx_hash']}
+
+    @timed('agent.execute')
     def execute(self, task: str) -> dict:
         """Execute task and return parsed result with TX hash"""
-        result = self.agent_executor.run(task)
+        if self.result_cache is not None:
+            key = self._result_key(task)
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                tx_hash = self.log_transaction("Network", self._cached_payload(key, cached))
+                return {"result": cached['result'], "tx_hash": tx_hash,
+                        "cached_from": cached['tx_hash']}
+        result = self._executor().run(task)
         tx_hash = self.log_transaction("Network", {"task": task, "result": result})
+        if self.result_cache is not None:
+            self.result_cache.put(key, result, tx_hash)
+        return {"result": result, "tx_hash": tx_hash}
+
+    async def arun_task(self, task: str) -> str:
+        """LLM stage of execute, without blocking the event loop"""
+        return await self._executor().arun(task)
+
+    async def alog_transaction(self, receiver: str, data: dict) -> str:
+        """log_transaction in a worker thread (signing is CPU bound)"""
+        return await asyncio.to_thread(self.log_transaction, receiver, data)
+
+    @timed('agent.execute')
+    async def aexecute(self, task: str, llm_done=None) -> dict:
+        """
+        Async execute; see src.agents.runtime.AgentPool for running many.
+        `llm_done(result)` is awaited once the result is known (from the
+        LLM or the cache), before its transaction is signed and queued.
+        """
+        if self.result_cache is not None:
+            key = self._result_key(task)
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                if llm_done is not None:
+                    await llm_done(cached['result'])
+                tx_hash = await self.alog_transaction("Network", self._cached_payload(key, cached))
+                return {"result": cached['result'], "tx_hash": tx_hash,
+                        "cached_from": cached['tx_hash']}
+        result = await self.arun_task(task)
+        if llm_done is not None:
+            await llm_done(result)
+        tx_hash = await self.alog_transaction("Network", {"task": task, "result": result})
+        if self.result_cache is not None:
+            self.result_cache.put(key, result, tx_hash)
         return {"result": result, "tx_hash": tx_hash}
     
     def _update_reputation_metrics(self, task_result: dict):
@@ -0,0 +1,132 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.utils.crypto import (
+    hash_data, signed_payload, signer_key, validate_signature, validate_signatures
+)
+from src.utils.metrics import stage, timed
+from src.utils.signatures import DEFAULT_SCHEME, schemes
+
+REQUIRED_FIELDS = {'sender', 'receiver', 'data', 'timestamp'}
+
+def _well_formed(transaction: Dict) -> bool:
+    return all(field in transaction for field in REQUIRED_FIELDS)
+
+@timed('validation.structure')
+def check_structure(transaction: Dict) -> Tuple[bool, str]:
+    if not _well_formed(transaction):
+        return False, "Missing required fields"
+    return True, "Valid transaction structure"
+
+def _signature_result(valid: bool) -> Tuple[bool, str]:
+    if not valid:
+        return False, "Invalid cryptographic signature"
+    return True, "Cryptographic validation passed"
+
+@timed('validation.signature')
+def check_signature(transaction: Dict, public_key: str) -> Tuple[bool, str]:
+    """
+    Verify the signed payload with the transaction's scheme;
+    transactions without one are RSA
+    """
+    try:
+        data_hash = hash_data(signed_payload(transaction))
+        scheme = transaction.get('scheme', DEFAULT_SCHEME)
+        return _signature_result(
+            validate_signature(public_key, data_hash, transaction['signature'], scheme)
+        )
+    except KeyError:
+        return False, "Missing cryptographic elements"
+    except ValueError:
+        return False, "Unsupported signature scheme"
+
+def validate_local(transaction: Dict, signature_valid: Optional[bool] = None) -> Dict:
+    """
+    Structure and cryptographic stages of ValidatorAgent.validate_transaction
+    These need no network access and are safe to run in worker processes
+    signature_valid: signature verdict already computed by validate_batch
+    """
+    report = {
+        'valid': True,
+        'errors': [],
+        'warnings': [],
+        'validations_passed': 0
+    }
+
+    structure_valid, message = check_structure(transaction)
+    if not structure_valid:
+        report['valid'] = False
+        report['errors'].append(f"Structural error: {message}")
+        return report
+    report['validations_passed'] += 1
+
+    if signature_valid is None:
+        crypto_valid, message = check_signature(transaction, signer_key(transaction))
+    else:
+        crypto_valid, message = _signature_result(signature_valid)
+    if not crypto_valid:
+        report['valid'] = False
+        report['errors'].append(f"Crypto error: {message}")
+        return report
+    report['validations_passed'] += 1
+    return report
+
+def validate_batch(transactions: List[Dict]) -> List[Dict]:
+    """
+    validate_local over many transactions, with signatures grouped by
+    scheme and checked through the backend's verify_batch
+    """
+    reports: List[Optional[Dict]] = [None] * len(transactions)
+    available = set(schemes())
+    groups: Dict[str, List[Tuple[int, Tuple[str, str, str]]]] = {}
+    for i, tx in enumerate(transactions):
+        scheme = tx.get('scheme', DEFAULT_SCHEME)
+        if _well_formed(tx) and 'signature' in tx and scheme in available:
+            groups.setdefault(scheme, []).append(
+                (i, (signer_key(tx), hash_data(signed_payload(tx)), tx['signature']))
+            )
+        else:
+            reports[i] = validate_local(tx)
+    for scheme, entries in groups.items():
+        with stage('validation.signature_batch'):
+            verdicts = validate_signatures([item for _, item in entries], scheme)
+        for (i, _), valid in zip(entries, verdicts):
+            reports[i] = validate_local(transactions[i], signature_valid=valid)
+    return reports
+
+class BatchValidationEngine:
+    """
+    Runs the local validation stages over chunks of transactions in a
+    process pool. Reports come back in input order. Workers are
+    long-lived, so each one keeps its parsed public keys cached
+    (see src.utils.crypto.load_public_key) across batches.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 256):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def validate(self, transactions: Iterable[Dict]) -> List[Dict]:
+        transactions = list(transactions)
+        if len(transactions) <= self.chunk_size or self.workers == 1:
+            return validate_batch(transactions)
+
+        chunks = [
+            transactions[i:i + self.chunk_size]
+            for i in range(0, len(transactions), self.chunk_size)
+        ]
+        reports = []
+        for chunk_reports in self._pool().map(validate_batch, chunks):
+            reports.extend(chunk_reports)
+        return reports
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
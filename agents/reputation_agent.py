@@ -1,38 +1,114 @@
+import functools
+import os
+from typing import TYPE_CHECKING, Any, List, Optional
 from src.agents.base_agent import ChainSecAgent
-from langchain.tools import tool
+from src.blockchain.core import Blockchain
+from src.blockchain.reputation_monitor import ReputationMonitor
+from src.blockchain.reputation_scoring import ReputationReplay
+from src.utils.config import DATA_DIR
+from src.utils.signatures import DEFAULT_SCHEME
+
+if TYPE_CHECKING:
+    from langchain.agents import Tool
+    from langchain.llms import BaseLLM
+
+@functools.lru_cache(maxsize=None)
+def _reputation_analyzer_tool():
+    """The LangChain tool class, built on first use (only agents with an LLM need it)"""
+    from langchain.tools import BaseTool
 
-class ReputationAgent(ChainSecAgent):
-    def __init__(self, *args, **kwargs):
-        super().__init__(
-            name="ReputationOracle-v1",
-            purpose="Manage and monitor agent reputation scores",
-            *args, **kwargs
-        )
-        self.tools.append(self.ReputationAnalyzerTool())
-    
     class ReputationAnalyzerTool(BaseTool):
         name = "Reputation Analyzer"
         description = "Analyze agent reputation scores and provide insights"
-        
+        agent: Any = None
+
         def _run(self, agent_address: str) -> dict:
             return self.agent.blockchain.get_agent_reputation(agent_address)
-        
+
         def _arun(self, agent_address: str):
             raise NotImplementedError
 
-    def monitor_network(self):
+    return ReputationAnalyzerTool
+
+def __getattr__(name: str):
+    if name == 'ReputationAnalyzerTool':
+        return _reputation_analyzer_tool()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class ReputationAgent(ChainSecAgent):
+    """
+    Monitors reputations and records policies for low performers.
+    Without an llm the agent is headless and langchain is never imported.
+    """
+
+    def __init__(self, blockchain: Blockchain, tools: Optional[List["Tool"]] = None,
+                 llm: Optional["BaseLLM"] = None, private_key: Optional[str] = None,
+                 scheme: str = DEFAULT_SCHEME):
+        tools = list(tools or [])
+        if llm is not None:
+            tools.append(_reputation_analyzer_tool()(agent=self))
+        super().__init__(
+            name="ReputationOracle-v1",
+            purpose="Manage and monitor agent reputation scores",
+            tools=tools,
+            blockchain=blockchain,
+            llm=llm,
+            private_key=private_key,
+            scheme=scheme
+        )
+        self.monitor: Optional[ReputationMonitor] = None
+        self._replay: Optional[ReputationReplay] = None
+
+    def _create_output_parser(self):
+        from langchain.agents.agent import AgentOutputParser
+        from langchain.schema import AgentAction, AgentFinish
+
+        class ReputationOutputParser(AgentOutputParser):
+            def parse(self, text: str) -> AgentAction | AgentFinish:
+                if "Final Answer:" in text:
+                    return AgentFinish(
+                        {"output": text.split("Final Answer:")[-1].strip()},
+                        text
+                    )
+                return AgentAction("Reputation Analyzer", text.strip(), text)
+
+        return ReputationOutputParser()
+
+    def monitor_network(self, threshold: int = 50, poll_interval: float = 2.0,
+                        state_path: Optional[str] = None):
         """
         Continuously check and adjust reputations
+        Follows ReputationUpdated events and enforces policies within
+        one poll of a score dropping below threshold
+        The cursor is kept in state_path, by default
+        reputation_monitor.json under config.DATA_DIR
         """
-        while True:
-            low_performers = self._identify_low_performers()
-            self._enforce_reputation_policies(low_performers)
-            time.sleep(3600)  # Check hourly
+        if state_path is None:
+            os.makedirs(DATA_DIR, exist_ok=True)
+            state_path = os.path.join(DATA_DIR, 'reputation_monitor.json')
+        self.monitor = ReputationMonitor(
+            self.blockchain._reputation_contract(),
+            on_breach=self._enforce_reputation_policies,
+            threshold=threshold,
+            state_path=state_path
+        )
+        self.monitor.run(poll_interval)
 
     def _identify_low_performers(self, threshold=50):
-        # Implementation for identifying low performers
-        pass
+        """
+        Score every known agent locally and return those below threshold
+        Only events since the previous call are replayed
+        """
+        if self._replay is None:
+            self._replay = ReputationReplay(self.blockchain._reputation_contract())
+        return self._replay.advance().below(threshold)
 
     def _enforce_reputation_policies(self, agents: list):
-        # Implementation for enforcing policies
-        pass
\ No newline at end of file
+        """Record low performers on-chain so validators can restrict them"""
+        if not agents:
+            return None
+        return self.log_transaction("Network", {
+            'type': 'reputation_policy',
+            'action': 'restrict',
+            'agents': agents
+        })
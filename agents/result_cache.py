@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional
+from src.utils.crypto import hash_data
+
+def normalize_task(task: str) -> str:
+    """Collapse whitespace so trivially different prompts share an entry"""
+    return " ".join(task.split())
+
+def result_key(agent_name: str, purpose: str, tool_names: Iterable[str], task: str) -> str:
+    return hash_data({
+        'agent': agent_name,
+        'purpose': purpose,
+        'tools': sorted(tool_names),
+        'task': normalize_task(task)
+    })
+
+class ResultCache:
+    """
+    Cache of agent task results keyed by result_key().
+
+    A bounded in-memory LRU sits in front of an optional on-disk tier
+    (one JSON file per key under `path`), so results survive restarts
+    and can be shared by agents on the same host. Entries expire `ttl`
+    seconds after they were stored, in both tiers. Each entry keeps the
+    tx_hash of the transaction that logged the original result.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = 3600.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        if path:
+            os.makedirs(path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._file(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, entry: Dict) -> None:
+        tmp_path = f"{self._file(key)}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._file(key))
+
+    def _remember(self, key: str, entry: Dict) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """{'result', 'tx_hash', 'expires'} for a live entry, else None"""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['expires'] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self._entries.pop(key, None)
+
+        entry = self._read_disk(key) if self.path else None
+        with self._lock:
+            if entry is not None and entry['expires'] > now:
+                self._remember(key, entry)
+                self.hits += 1
+                self.disk_hits += 1
+                return entry
+            self.misses += 1
+        return None
+
+    def put(self, key: str, result, tx_hash: str) -> Dict:
+        entry = {'result': result, 'tx_hash': tx_hash, 'expires': self.clock() + self.ttl}
+        with self._lock:
+            self._remember(key, entry)
+        if self.path:
+            self._write_disk(key, entry)
+        return entry
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.path:
+            try:
+                os.remove(self._file(key))
+            except FileNotFoundError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,149 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+class FakeLLM:
+    """
+    Deterministic stand-in for an LLM with configurable latency, for
+    tests and benchmarks of the async runtime. `delay` is the base
+    response time in seconds and `jitter` adds up to that much on top
+    (seeded, so runs are reproducible).
+    """
+
+    def __init__(self, response: str = "Final Answer: done", delay: float = 0.05,
+                 jitter: float = 0.0, seed: int = 0):
+        self.response = response
+        self.delay = delay
+        self.jitter = jitter
+        self.calls = 0
+        self._random = random.Random(seed)
+
+    def _latency(self) -> float:
+        return self.delay + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def invoke(self, prompt: str) -> str:
+        self.calls += 1
+        time.sleep(self._latency())
+        return self.response
+
+    async def ainvoke(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self._latency())
+        return self.response
+
+    # langchain-style aliases
+    predict = run = invoke
+    apredict = arun = ainvoke
+
+@dataclass
+class TaskResult:
+    task: str
+    agent: str
+    result: Optional[str] = None
+    tx_hash: Optional[str] = None
+    cached_from: Optional[str] = None  # tx of the original result on a cache hit
+    error: Optional[str] = None
+    queued: float = 0.0   # waiting for a free agent slot, seconds
+    llm: float = 0.0      # LLM call or cache lookup, seconds
+    chain: float = 0.0    # signing and queueing the transaction, seconds
+    latency: float = 0.0  # submit to done, seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class AgentPool:
+    """
+    Runs many tasks concurrently across agents that implement
+    aexecute(task, llm_done) (ChainSecAgent does), so result caching
+    and the agent.execute timer apply to pooled tasks too.
+
+    Each agent runs at most `per_agent` LLM calls at once and a task goes
+    to the least busy agent. An agent's slot is released as soon as its
+    LLM call returns, so signing and queueing the result transaction
+    overlaps with the agent's next LLM call.
+    """
+
+    def __init__(self, agents: Sequence, per_agent: int = 4):
+        if not agents:
+            raise ValueError("AgentPool needs at least one agent")
+        if per_agent < 1:
+            raise ValueError("per_agent must be at least 1")
+        self.agents = list(agents)
+        self.per_agent = per_agent
+        self._busy: Dict[int, int] = {id(agent): 0 for agent in self.agents}
+        self._slots: Optional[asyncio.Condition] = None
+
+    async def _acquire(self):
+        if self._slots is None:
+            self._slots = asyncio.Condition()
+        async with self._slots:
+            await self._slots.wait_for(
+                lambda: min(self._busy.values()) < self.per_agent
+            )
+            agent = min(self.agents, key=lambda a: self._busy[id(a)])
+            self._busy[id(agent)] += 1
+            return agent
+
+    async def _release(self, agent) -> None:
+        async with self._slots:
+            self._busy[id(agent)] -= 1
+            self._slots.notify()
+
+    async def submit(self, task: str) -> TaskResult:
+        """Run one task on the next free agent"""
+        start = time.perf_counter()
+        agent = await self._acquire()
+        report = TaskResult(task=task, agent=getattr(agent, 'name', type(agent).__name__))
+        report.queued = time.perf_counter() - start
+        released = None
+
+        async def llm_done(result=None) -> None:
+            nonlocal released
+            released = time.perf_counter()
+            await self._release(agent)
+
+        try:
+            outcome = await agent.aexecute(task, llm_done=llm_done)
+            report.result = outcome['result']
+            report.tx_hash = outcome['tx_hash']
+            report.cached_from = outcome.get('cached_from')
+        except Exception as exc:
+            report.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            if released is None:
+                await llm_done()
+        end = time.perf_counter()
+        report.llm = released - start - report.queued
+        report.chain = end - released
+        report.latency = end - start
+        return report
+
+    async def run(self, tasks: Iterable[str]) -> List[TaskResult]:
+        """Run all tasks concurrently; results are in task order"""
+        return list(await asyncio.gather(*(self.submit(task) for task in tasks)))
+
+    def run_sync(self, tasks: Iterable[str]) -> List[TaskResult]:
+        self._slots = None  # asyncio primitives are bound to one loop
+        return asyncio.run(self.run(tasks))
+
+    @staticmethod
+    def summarize(results: Sequence[TaskResult]) -> Dict[str, Union[int, float]]:
+        """Count, failures and latency percentiles (seconds) of finished tasks"""
+        latencies = sorted(r.latency for r in results)
+        if not latencies:
+            return {'tasks': 0, 'failed': 0}
+
+        def percentile(q: float) -> float:
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            'tasks': len(results),
+            'failed': sum(not r.ok for r in results),
+            'mean': sum(latencies) / len(latencies),
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'max': latencies[-1]
+        }
@@ -1,21 +1,36 @@
-from typing import List, Dict
+import asyncio
+from collections.abc import Mapping
+from typing import List, Dict, Optional
+from langchain.llms import BaseLLM
 from langchain.tools import BaseTool
 from src.agents.base_agent import ChainSecAgent
 from src.blockchain.core import Blockchain
-from src.utils.crypto import validate_signature
+from src.utils.crypto import hash_data, signed_payload, signer_key, validate_signature
+from src.utils.signatures import DEFAULT_SCHEME
+from src.utils.config import DATA_SOURCE_DIR
+from src.utils.streaming_stats import confine_source, stream_stats
 
 class BlockchainTools:
     class DataProcessor(BaseTool):
         name = "Data Processor"
         description = "Process structured data and generate insights"
         
+        # data['source'] paths must resolve under this directory
+        data_dir: str = DATA_SOURCE_DIR
+
         def _run(self, data: Dict) -> Dict:
+            """
+            Stats over data['values'] (any iterable or array) or, streamed
+            in bounded memory, data['source']: a .csv / .ndjson / .npy path
+            under data_dir or an iterable, with data['column'] selecting
+            the CSV/NDJSON field
+            """
+            source = confine_source(data.get('source', data.get('values', ())), self.data_dir)
+            stats = stream_stats(source, column=data.get('column'))
+            items = len(data['items']) if 'items' in data else stats['count']
             return {
-                "insights": f"Processed {len(data.get('items', []))} items",
-                "stats": {
-                    "mean": sum(data.get('values', [])) / len(data.get('values', [1])),
-                    "total": sum(data.get('values', []))
-                }
+                "insights": f"Processed {items} items",
+                "stats": stats
             }
 
     class ContractInteractor(BaseTool):
@@ -33,20 +48,35 @@ class BlockchainTools:
         name = "Transaction Validator"
         description = "Validate blockchain transactions"
         
-        def _run(self, tx_hash: str, blockchain: Blockchain) -> Dict:
-            for block in blockchain.chain:
-                for tx in block['transactions']:
-                    if hash_data(tx) == tx_hash:
-                        return {
-                            "valid": validate_signature(
-                                tx['public_key'],
-                                hash_data(tx['data']),
-                                tx['signature']
-                            ),
-                            "block": block['index'],
-                            "timestamp": tx['timestamp']
-                        }
-            return {"valid": False, "error": "Transaction not found"}
+        def _run(self, tx_hash: str, blockchain: Blockchain,
+                 proof: Optional[Dict] = None) -> Dict:
+            if proof is not None:
+                # Light path: only the block header's merkle_root is needed
+                tx = proof.get('transaction') if isinstance(proof, Mapping) else None
+                if not isinstance(tx, Mapping):
+                    return {"valid": False, "error": "Malformed inclusion proof"}
+                if hash_data(tx) != tx_hash or not blockchain.verify_inclusion_proof(proof):
+                    return {"valid": False, "error": "Invalid inclusion proof"}
+                block_index = proof['block']
+            else:
+                found = blockchain.get_transaction(tx_hash)
+                if found is None:
+                    return {"valid": False, "error": "Transaction not found"}
+                block, tx = found
+                block_index = block['index']
+            if not signer_key(tx) or not tx.get('signature'):
+                return {"valid": False, "error": "Transaction is not signed",
+                        "block": block_index}
+            return {
+                "valid": validate_signature(
+                    signer_key(tx),
+                    hash_data(signed_payload(tx)),
+                    tx['signature'],
+                    tx.get('scheme', DEFAULT_SCHEME)
+                ),
+                "block": block_index,
+                "timestamp": tx.get('timestamp')
+            }
 
 class TaskAgent(ChainSecAgent):
     def __init__(
@@ -54,7 +84,8 @@ class TaskAgent(ChainSecAgent):
         blockchain: Blockchain,
         private_key: str,
         llm: BaseLLM,
-        custom_tools: List[BaseTool] = None
+        custom_tools: List[BaseTool] = None,
+        scheme: str = DEFAULT_SCHEME
     ):
         tools = [
             BlockchainTools.DataProcessor(),
@@ -68,7 +99,8 @@ class TaskAgent(ChainSecAgent):
             tools=tools,
             blockchain=blockchain,
             llm=llm,
-            private_key=private_key
+            private_key=private_key,
+            scheme=scheme
         )
 
     def _create_output_parser(self):
@@ -104,6 +136,38 @@ class TaskAgent(ChainSecAgent):
             self.blockchain
         )
         
+        return {
+            "processed": processed,
+            "storage_tx": store_tx,
+            "validation": validation
+        }
+
+    async def acomplex_operation(self, data: Dict) -> Dict:
+        """
+        complex_operation on the event loop; the execute transaction is
+        signed and queued while the storage call is prepared
+        """
+        answered = asyncio.get_running_loop().create_future()
+
+        async def llm_done(result: str) -> None:
+            answered.set_result(result)
+
+        executed = asyncio.ensure_future(
+            self.aexecute(f"Process this data: {data}", llm_done=llm_done)
+        )
+        await asyncio.wait({answered, executed}, return_when=asyncio.FIRST_COMPLETED)
+        if not answered.done():
+            await executed  # the LLM call failed; raise its error
+        processed = answered.result()
+        store_tx = self.tools[1]._run(
+            "0xCONTRACTADDRESS",
+            "storeResults(bytes32)",
+            [hash_data(processed)]
+        )
+        validation = await asyncio.to_thread(
+            self.tools[2]._run, store_tx['operation'], self.blockchain
+        )
+        await executed
         return {
             "processed": processed,
             "storage_tx": store_tx,
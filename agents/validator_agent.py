@@ -1,74 +1,120 @@
-from typing import Dict, Optional, Tuple
-from langchain.tools import BaseTool
-from langchain.agents import AgentExecutor
+import functools
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from src.agents.base_agent import ChainSecAgent
+from src.agents.batch_validation import (
+    BatchValidationEngine, check_signature, check_structure, validate_batch, validate_local
+)
+from src.blockchain.consensus import ConsensusClient
 from src.blockchain.core import Blockchain
-from src.utils.crypto import hash_data, validate_signature
+from src.blockchain.smart_contracts import is_agent_address
+from src.utils.crypto import hash_data, signer_key
+from src.utils.metrics import stage, timed
+from src.utils.signatures import DEFAULT_SCHEME
 
-class ValidationTools:
-    class TransactionStructureValidator(BaseTool):
-        name = "Transaction Structure Validator"
-        description = "Validates transaction format and required fields"
-        
-        def _run(self, transaction: Dict) -> Tuple[bool, str]:
-            required_fields = {'sender', 'receiver', 'data', 'timestamp'}
-            if not all(field in transaction for field in required_fields):
-                return False, "Missing required fields"
-            return True, "Valid transaction structure"
-
-    class CryptographicValidator(BaseTool):
-        name = "Cryptographic Validator"
-        description = "Verifies cryptographic signatures and hashes"
-
-        def _run(self, transaction: Dict, public_key: str) -> Tuple[bool, str]:
-            try:
-                data_hash = hash_data(transaction['data'])
-                if not validate_signature(public_key, data_hash, transaction['signature']):
-                    return False, "Invalid cryptographic signature"
-                return True, "Cryptographic validation passed"
-            except KeyError:
-                return False, "Missing cryptographic elements"
+if TYPE_CHECKING:
+    from langchain.llms import BaseLLM
+    from src.agents.validator_cluster import ValidatorCluster
+
+logger = logging.getLogger(__name__)
+
+# Report key marking a consensus stage left to the coordinator
+CONSENSUS_DEFERRED = 'consensus_deferred'
+
+@functools.lru_cache(maxsize=None)
+def _validation_tools():
+    """The LangChain tool classes, built on first use (only agents with an LLM need them)"""
+    from langchain.tools import BaseTool
+
+    class ValidationTools:
+        class TransactionStructureValidator(BaseTool):
+            name = "Transaction Structure Validator"
+            description = "Validates transaction format and required fields"
+
+            def _run(self, transaction: Dict) -> Tuple[bool, str]:
+                return check_structure(transaction)
+
+        class CryptographicValidator(BaseTool):
+            name = "Cryptographic Validator"
+            description = "Verifies cryptographic signatures and hashes"
+
+            def _run(self, transaction: Dict, public_key: str) -> Tuple[bool, str]:
+                return check_signature(transaction, public_key)
+
+    return ValidationTools
+
+def __getattr__(name: str):
+    if name == 'ValidationTools':
+        return _validation_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class ValidatorAgent(ChainSecAgent):
-    def __init__(self, blockchain: Blockchain, smart_contract_address: str):
-        tools = [
-            ValidationTools.TransactionStructureValidator(),
-            ValidationTools.CryptographicValidator()
-        ]
-        super().__init__("ValidatorAgent-v1", tools, blockchain)
+    """
+    Validates pending transactions. Without an llm the validator is
+    headless: no LangChain executor or tools are built and langchain is
+    never imported; see src.agents.validator_worker.
+    """
+
+    def __init__(self, blockchain: Blockchain, smart_contract_address: str,
+                 consensus_client: Optional[ConsensusClient] = None,
+                 llm: Optional["BaseLLM"] = None,
+                 private_key: Optional[str] = None,
+                 scheme: str = DEFAULT_SCHEME):
+        tools = []
+        if llm is not None:
+            tools = [
+                _validation_tools().TransactionStructureValidator(),
+                _validation_tools().CryptographicValidator()
+            ]
+        super().__init__(
+            name="ValidatorAgent-v1",
+            purpose="Validate transactions before they are added to the chain",
+            tools=tools,
+            blockchain=blockchain,
+            llm=llm,
+            private_key=private_key,
+            scheme=scheme
+        )
         self.smart_contract_address = smart_contract_address
         self.validation_threshold = 3  # Number of validations required
-        
-    def validate_transaction(self, transaction: Dict) -> Dict:
+        self._contract_client = None
+        self._batch_engine: Optional[BatchValidationEngine] = None
+        self.consensus_client = consensus_client
+        # Sender reputations bulk-loaded for the batch being processed
+        self._prefetched_reputations: Dict[str, Dict] = {}
+        # Transactions at or above this value re-read reputation on-chain
+        self.high_value_threshold = 10000
+        self.cluster = None
+
+    def _create_output_parser(self):
+        from langchain.agents.agent import AgentOutputParser
+        from langchain.schema import AgentAction, AgentFinish
+
+        class ValidatorOutputParser(AgentOutputParser):
+            def parse(self, text: str) -> AgentAction | AgentFinish:
+                if "Final Answer:" in text:
+                    return AgentFinish(
+                        {"output": text.split("Final Answer:")[-1].strip()},
+                        text
+                    )
+                return AgentAction("Transaction Structure Validator", None, text)
+
+        return ValidatorOutputParser()
+
+    def _validate_stages(self, transaction: Dict,
+                         local_report: Optional[Dict] = None,
+                         consensus: bool = True) -> Dict:
         """
         Perform multi-stage validation of a transaction
         Returns validation report with status and reasons
+        local_report carries precomputed structure/crypto results
+        from the batch validation engine
+        consensus=False leaves the consensus stage to apply_consensus()
         """
-        report = {
-            'valid': True,
-            'errors': [],
-            'warnings': [],
-            'validations_passed': 0
-        }
-
-        # Structural validation
-        structure_valid, message = self.tools[0]._run(transaction)
-        if not structure_valid:
-            report['valid'] = False
-            report['errors'].append(f"Structural error: {message}")
+        # Structural and cryptographic validation
+        report = local_report if local_report is not None else validate_local(transaction)
+        if not report['valid']:
             return report
-        report['validations_passed'] += 1
-
-        # Cryptographic validation
-        crypto_valid, message = self.tools[1]._run(
-            transaction, 
-            transaction.get('sender_public_key', '')
-        )
-        if not crypto_valid:
-            report['valid'] = False
-            report['errors'].append(f"Crypto error: {message}")
-            return report
-        report['validations_passed'] += 1
 
         # Smart contract validation
         sc_valid = self.validate_via_smart_contract(transaction)
@@ -79,26 +125,60 @@ class ValidatorAgent(ChainSecAgent):
         report['validations_passed'] += 1
 
         # Consensus check (mock implementation)
-        if not self.check_network_consensus(transaction):
+        if not consensus:
+            # Where the warning goes, so the report matches a serial one
+            report[CONSENSUS_DEFERRED] = len(report['warnings'])
+        elif not self.check_network_consensus(transaction):
             report['warnings'].append("Consensus verification pending")
             
         return report
 
+    def apply_consensus(self, transaction: Dict, report: Dict) -> Dict:
+        """Run the consensus stage deferred by a worker, against this node's chain and peers"""
+        position = report.pop(CONSENSUS_DEFERRED, None)
+        if position is not None and not self.check_network_consensus(transaction):
+            report['warnings'].insert(position, "Consensus verification pending")
+        return report
+
+    @timed('validation.smart_contract')
     def validate_via_smart_contract(self, transaction: Dict) -> bool:
         """Interact with blockchain smart contract for validation"""
-        from src.blockchain.smart_contracts import SmartContract
+        from src.blockchain.smart_contracts import get_contract
         
-        sc = SmartContract(
-            contract_address=self.smart_contract_address,
-            abi=self._load_contract_abi()
-        )
+        if self._contract_client is None:
+            self._contract_client = get_contract(
+                self.smart_contract_address,
+                self._load_contract_abi(),
+                self.blockchain.provider_uri
+            )
+        sc = self._contract_client
         return sc.validate_transaction(transaction)
 
+    @timed('validation.consensus')
     def check_network_consensus(self, transaction: Dict) -> bool:
         """Check if transaction exists in majority of network nodes"""
-        # Mock implementation - would connect to multiple nodes in real scenario
+        proof = transaction.get('inclusion_proof')
+        if proof is not None:
+            # A Merkle proof against the local header replaces the block scan
+            body = {k: v for k, v in transaction.items() if k != 'inclusion_proof'}
+            return (
+                proof.get('transaction') == body
+                and self.blockchain.verify_inclusion_proof(proof)
+            )
+        if self.consensus_client is not None:
+            return self.consensus_client.check_transaction_sync(transaction)
+        # Without configured peers only the local tip can be compared
+        if not self.blockchain.chain:
+            return False
         return self.blockchain.hash(self.blockchain.last_block) == transaction.get('block_hash', '')
 
+    @timed('validation.consensus')
+    async def acheck_network_consensus(self, transaction: Dict) -> bool:
+        """check_network_consensus for callers already inside an event loop"""
+        if self.consensus_client is None or 'inclusion_proof' in transaction:
+            return self.check_network_consensus(transaction)
+        return await self.consensus_client.check_transaction(transaction)
+
     def _load_contract_abi(self) -> Dict:
         """Load smart contract ABI from file"""
         # Implementation would load actual ABI JSON
@@ -112,14 +192,94 @@ class ValidatorAgent(ChainSecAgent):
             }
         }
 
-    def process_pending_transactions(self) -> None:
-        """Main validation workflow for pending transactions"""
-        for tx in self.blockchain.pending_transactions:
-            validation_report = self.validate_transaction(tx)
+    def process_pending_transactions(self, parallel: bool = False,
+                                     batch_size: int = 1000) -> None:
+        """
+        Main validation workflow for pending transactions
+        Takes the top batch_size ready transactions from the mempool
+        parallel=True runs the structure/crypto stages in a process pool;
+        with enable_cluster() the other stages run in sender-sharded
+        workers and only consensus, against this node's chain and peers,
+        runs here
+        """
+        selected = self.blockchain.pending_transactions.select(batch_size)
+        pending = [tx for _, tx in selected]
+        if self.cluster is not None:
+            reports = [
+                self.apply_consensus(tx, report)
+                for tx, report in zip(pending, self.cluster.validate(pending))
+            ]
+        else:
+            reports = self.validate_pending(pending, parallel)
+        for tx, validation_report in zip(pending, reports):
             if validation_report['valid']:
                 self._finalize_transaction(tx)
             else:
                 self._reject_transaction(tx, validation_report)
+        self.blockchain.pending_transactions.remove(tx_hash for tx_hash, _ in selected)
+
+    def validate_pending(self, pending: List[Dict], parallel: bool = False,
+                         consensus: bool = True) -> List[Dict]:
+        """
+        Validation reports for a batch, in order, without acting on them
+        Signatures are batch-verified and sender reputations bulk-loaded
+        """
+        if parallel:
+            if self._batch_engine is None:
+                self._batch_engine = BatchValidationEngine()
+            local_reports = self._batch_engine.validate(pending)
+        else:
+            local_reports = validate_batch(pending)
+
+        # Only senders that can still pass and that the contract accepts;
+        # anything else is looked up (and fails) per transaction
+        senders = [
+            signer_key(tx) for tx, report in zip(pending, local_reports)
+            if report['valid'] and is_agent_address(signer_key(tx))
+        ]
+        self._prefetched_reputations = self._prefetch_reputations(senders)
+        try:
+            return [
+                self.validate_transaction(tx, local_report=local_report, consensus=consensus)
+                for tx, local_report in zip(pending, local_reports)
+            ]
+        finally:
+            self._prefetched_reputations = {}
+
+    def _prefetch_reputations(self, senders: List[str]) -> Dict[str, Dict]:
+        if not senders:
+            return {}
+        try:
+            return self.blockchain.get_agent_reputations(senders)
+        except Exception:
+            logger.exception("Bulk reputation lookup failed; falling back to per-transaction reads")
+            return {}
+
+    def enable_cluster(self, shards: Optional[int] = None, build_worker=None,
+                       mp_context=None, **cache_options) -> "ValidatorCluster":
+        """
+        Validate batches in worker processes sharded by sender; consensus,
+        approvals and rejections are still handled here, in mempool order.
+        build_worker defaults to headless copies of this validator.
+        A cluster enabled earlier is shut down first.
+        """
+        from src.agents.validator_cluster import ValidatorCluster, cluster_for
+
+        self.close()
+        if build_worker is not None:
+            self.cluster = ValidatorCluster(build_worker, shards, mp_context)
+        else:
+            self.cluster = cluster_for(self, shards, mp_context, **cache_options)
+        return self.cluster
+
+    def close(self) -> None:
+        """Stop the cluster workers and the batch validation pool, if any"""
+        if self.cluster is not None:
+            self.cluster.close()
+            self.cluster = None
+        if self._batch_engine is not None:
+            self._batch_engine.close()
+            self._batch_engine = None
 
     def _finalize_transaction(self, transaction: Dict) -> None:
         """Add validated transaction to the blockchain"""
@@ -143,14 +303,26 @@ class ValidatorAgent(ChainSecAgent):
                 'errors': report['errors']
             }
         )
-    def validate_transaction(self, transaction: Dict) -> Dict:
-        report = super().validate_transaction(transaction)
-        
+
+    @timed('validation.transaction')
+    def validate_transaction(self, transaction: Dict, **kwargs) -> Dict:
+        report = self._validate_stages(transaction, **kwargs)
+        if not report['valid']:
+            return report
+
         # Check reputation score
-        sender_rep = self.blockchain.get_agent_reputation(
-            transaction['sender_public_key']
-        )
-        
+        strict = self._is_high_value(transaction)
+        sender = signer_key(transaction)
+        with stage('validation.reputation'):
+            sender_rep = None if strict else self._prefetched_reputations.get(sender)
+            if sender_rep is None:
+                try:
+                    sender_rep = self.blockchain.get_agent_reputation(sender, strict=strict)
+                except Exception as exc:
+                    report['valid'] = False
+                    report['errors'].append(f"Reputation lookup failed: {type(exc).__name__}: {exc}")
+                    return report
+
         if sender_rep['score'] < 50:  # Threshold
             report['warnings'].append("Low reputation agent - additional verification required")
             report['valid'] = False
@@ -158,4 +330,9 @@ class ValidatorAgent(ChainSecAgent):
         elif sender_rep['score'] < 70:
             report['warnings'].append("Medium reputation agent - limited privileges")
             
-        return report
\ No newline at end of file
+        return report
+
+    def _is_high_value(self, transaction: Dict) -> bool:
+        data = transaction.get('data')
+        value = data.get('value', 0) if isinstance(data, dict) else 0
+        return transaction.get('value', value) >= self.high_value_threshold
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Sender-sharded validation across worker processes.
+
+Pending transactions are hash-partitioned by sender_public_key (or
+sender, for transactions without one), so every transaction of a sender
+is validated by the same long-lived worker. Each worker therefore keeps
+its shard's reputations (ReputationCache) and parsed public keys
+(load_public_key's LRU) warm, and no two processes race on one sender's
+state. A shard's transactions are validated in the order they were
+selected, and reports are merged back into that order for the
+coordinating ValidatorAgent, which runs the consensus stage against its
+own chain and peers and then finalizes or rejects.
+"""
+import functools
+import hashlib
+import multiprocessing
+import os
+from typing import Callable, Dict, Iterable, List, Optional
+from src.agents.validator_worker import ValidationWorker, build_agent
+
+def shard_key(transaction: Dict) -> str:
+    return str(transaction.get('sender_public_key') or transaction.get('sender', ''))
+
+def shard_of(transaction: Dict, shards: int) -> int:
+    """Stable across processes and runs, unlike hash()"""
+    digest = hashlib.blake2b(shard_key(transaction).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % shards
+
+def warm_worker(contract: str, reputation_contract: str,
+                provider_uri: Optional[str] = None,
+                high_value_threshold: Optional[int] = None,
+                **cache_options) -> ValidationWorker:
+    """
+    Headless validator with an event-invalidated reputation cache
+    Consensus is deferred: the worker has no copy of the chain or peers
+    """
+    agent = build_agent(contract, reputation_contract, provider_uri)
+    if high_value_threshold is not None:
+        agent.high_value_threshold = high_value_threshold
+    agent.blockchain.enable_reputation_cache(**cache_options)
+    return ValidationWorker(agent, consensus=False)
+
+def _serve(build_worker: Callable[[], ValidationWorker], conn) -> None:
+    worker = build_worker()
+    while True:
+        transactions = conn.recv()
+        if transactions is None:
+            break
+        try:
+            result = worker.validate(transactions)
+        except Exception as exc:
+            result = exc
+        conn.send(result)
+    conn.close()
+
+class ValidatorCluster:
+    """
+    One worker process per shard, started on first use. build_worker is
+    called once in each worker and must be picklable (a module-level
+    function or functools.partial of one).
+
+    A worker that dies fails the batch with RuntimeError and is restarted
+    (with cold state) before the next one; nothing from a failed batch is
+    returned.
+    """
+
+    def __init__(self, build_worker: Callable[[], ValidationWorker],
+                 shards: Optional[int] = None, mp_context=None):
+        self.build_worker = build_worker
+        self.shards = shards or os.cpu_count() or 1
+        self._context = mp_context or multiprocessing.get_context()
+        self._workers = []  # (process, connection) per shard
+        self.restarts = 0
+
+    def _spawn(self, shard: int):
+        parent, child = self._context.Pipe()
+        process = self._context.Process(
+            target=_serve, args=(self.build_worker, child),
+            name=f"validator-shard-{shard}", daemon=True
+        )
+        process.start()
+        child.close()
+        return process, parent
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [self._spawn(shard) for shard in range(self.shards)]
+
+    def _restart(self, shard: int) -> None:
+        process, conn = self._workers[shard]
+        conn.close()
+        process.join(timeout=1)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+        self._workers[shard] = self._spawn(shard)
+        self.restarts += 1
+
+    def partition(self, transactions: List[Dict]) -> List[List[int]]:
+        """Positions of the transactions in each shard, in input order"""
+        positions = [[] for _ in range(self.shards)]
+        for position, transaction in enumerate(transactions):
+            positions[shard_of(transaction, self.shards)].append(position)
+        return positions
+
+    def validate(self, transactions: Iterable[Dict]) -> List[Dict]:
+        """Validation reports in input order"""
+        transactions = list(transactions)
+        self.start()
+        parts = self.partition(transactions)
+        dead = []
+        waiting = []
+        for shard, ((_, conn), positions) in enumerate(zip(self._workers, parts)):
+            if not positions:
+                continue
+            try:
+                conn.send([transactions[i] for i in positions])
+                waiting.append(shard)
+            except (BrokenPipeError, OSError):
+                dead.append(shard)
+
+        reports: List[Optional[Dict]] = [None] * len(transactions)
+        error = None
+        # Every live shard is drained before raising, so no reply is left
+        # in a pipe to be read as the next batch's
+        for shard in waiting:
+            try:
+                result = self._workers[shard][1].recv()
+            except (EOFError, OSError):
+                dead.append(shard)
+                continue
+            if isinstance(result, Exception):
+                error = error or result
+                continue
+            for position, report in zip(parts[shard], result):
+                reports[position] = report
+
+        for shard in dead:
+            self._restart(shard)
+        if dead:
+            raise RuntimeError(f"Validator shard(s) {sorted(dead)} exited; batch not validated")
+        if error is not None:
+            raise error
+        return reports
+
+    def close(self) -> None:
+        for process, conn in self._workers:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process, conn in self._workers:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+        self._workers = []
+
+    def __enter__(self) -> "ValidatorCluster":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+def cluster_for(agent, shards: Optional[int] = None, mp_context=None,
+                **cache_options) -> ValidatorCluster:
+    """Cluster of headless copies of agent (same contracts and thresholds)"""
+    return ValidatorCluster(
+        functools.partial(
+            warm_worker,
+            agent.smart_contract_address,
+            agent.blockchain.reputation_contract,
+            agent.blockchain.provider_uri,
+            agent.high_value_threshold,
+            **cache_options
+        ),
+        shards,
+        mp_context
+    )
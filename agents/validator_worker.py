@@ -0,0 +1,102 @@
+"""
+Validation-only worker. Reads transactions as JSON lines and writes one
+validation report per line, in input order. It runs a headless
+ValidatorAgent: langchain is never imported, and web3 is loaded only
+when the first contract call is made.
+
+    python -m src.agents.validator_worker --contract 0x... --reputation-contract 0x...
+                                          [--provider URI] [--input txs.jsonl]
+                                          [--output reports.jsonl] [--batch-size 1000]
+    python -m src.agents.validator_worker --local-only < txs.jsonl
+
+--local-only runs only the structure and signature stages, which need
+no network access.
+"""
+import argparse
+import itertools
+import json
+import sys
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, TextIO
+from src.agents.batch_validation import validate_batch
+from src.utils.crypto import hash_data, json_default
+
+if TYPE_CHECKING:
+    from src.agents.validator_agent import ValidatorAgent
+
+def read_transactions(stream: TextIO) -> Iterator[Dict]:
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+class ValidationWorker:
+    """
+    Validates batches with a headless agent, or locally when agent is None
+    consensus=False defers the consensus stage to a coordinating agent
+    (ValidatorAgent.apply_consensus)
+    """
+
+    def __init__(self, agent: Optional["ValidatorAgent"] = None, consensus: bool = True):
+        self.agent = agent
+        self.consensus = consensus
+
+    def validate(self, transactions: List[Dict]) -> List[Dict]:
+        if self.agent is None:
+            reports = validate_batch(transactions)
+        else:
+            reports = self.agent.validate_pending(transactions, consensus=self.consensus)
+        for transaction, report in zip(transactions, reports):
+            report['tx_hash'] = hash_data(transaction)
+        return reports
+
+    def run(self, source: TextIO, sink: TextIO, batch_size: int = 1000) -> int:
+        """Validate JSON lines from source into sink; returns the number processed"""
+        transactions = read_transactions(source)
+        count = 0
+        while True:
+            batch = list(itertools.islice(transactions, batch_size))
+            if not batch:
+                return count
+            for report in self.validate(batch):
+                sink.write(json.dumps(report, default=json_default) + "\n")
+            sink.flush()
+            count += len(batch)
+
+def build_agent(contract: str, reputation_contract: str,
+                provider_uri: Optional[str] = None) -> "ValidatorAgent":
+    from src.agents.validator_agent import ValidatorAgent
+    from src.blockchain.core import Blockchain
+
+    return ValidatorAgent(Blockchain(reputation_contract, provider_uri), contract)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--contract', help="validation contract address")
+    parser.add_argument('--reputation-contract', help="AgentReputation contract address")
+    parser.add_argument('--provider', help="Web3 provider URI (default from config)")
+    parser.add_argument('--local-only', action='store_true',
+                        help="structure and signature checks only")
+    parser.add_argument('--input', help="JSON lines file (default stdin)")
+    parser.add_argument('--output', help="reports file (default stdout)")
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    agent = None
+    if not args.local_only:
+        if not args.contract or not args.reputation_contract:
+            parser.error("--contract and --reputation-contract are required without --local-only")
+        agent = build_agent(args.contract, args.reputation_contract, args.provider)
+
+    source = open(args.input) if args.input else sys.stdin
+    sink = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        count = ValidationWorker(agent).run(source, sink, args.batch_size)
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            sink.close()
+    print(f"validated {count} transactions", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Throughput of the structure + RSA stages over pending transactions,
+serial versus BatchValidationEngine at increasing worker counts.
+
+    python -m benchmarks.bench_batch_validation [transactions]
+"""
+import os
+import sys
+import time
+from Crypto.PublicKey import RSA
+from src.agents.batch_validation import BatchValidationEngine, validate_local
+from src.utils.crypto import sign_data
+
+PARAMS = ('transactions',)
+
+def make_transactions(count: int, senders: int = 8) -> list:
+    keys = [RSA.generate(2048) for _ in range(senders)]
+    pems = [(k.export_key().decode(), k.publickey().export_key().decode()) for k in keys]
+    transactions = []
+    for i in range(count):
+        private_pem, public_pem = pems[i % senders]
+        data = {'task': f'task-{i}', 'result': i}
+        transactions.append({
+            'sender': f'agent-{i % senders}',
+            'receiver': 'Network',
+            'data': data,
+            'timestamp': i,
+            'sender_public_key': public_pem,
+            'signature': sign_data(private_pem, {'receiver': 'Network', 'data': data})
+        })
+    return transactions
+
+def run(count: int = 4000) -> dict:
+    transactions = make_transactions(count)
+    start = time.perf_counter()
+    serial = [validate_local(tx) for tx in transactions]
+    results = {'transactions': count, 'serial_tx_per_s': count / (time.perf_counter() - start)}
+    assert all(report['valid'] for report in serial)
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        engine = BatchValidationEngine(workers=workers, chunk_size=128)
+        engine.validate(transactions[:workers * 128])  # warm the pool
+        start = time.perf_counter()
+        reports = engine.validate(transactions)
+        results[f'workers_{workers}_tx_per_s'] = count / (time.perf_counter() - start)
+        assert reports == serial
+        engine.close()
+        workers *= 2
+    return results
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    for key, value in run(count).items():
+        print(f"{key}: {value:.0f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,72 @@
+"""
+Chain append and transaction lookup, for the in-memory chain and the
+on-disk ChainStore: blocks appended per second (including Merkle roots
+and indexing), get_transaction lookups and inclusion proofs per second,
+and reopening a stored chain.
+
+    python -m benchmarks.bench_chain [blocks] [transactions_per_block]
+"""
+import random
+import sys
+import tempfile
+import time
+from src.blockchain.core import Blockchain
+from src.blockchain.records import Block, Transaction
+
+PARAMS = ('blocks', 'transactions_per_block')
+
+def make_blocks(blocks: int, per_block: int) -> list:
+    return [
+        Block(index=height, timestamp=float(height), previous_hash='0' * 64, transactions=[
+            Transaction(sender=f'agent-{i % 16}', receiver='Network', nonce=height * per_block + i,
+                        timestamp=float(height), data={'task': f'task-{height}-{i}', 'result': i},
+                        signature='s' * 128)
+            for i in range(per_block)
+        ])
+        for height in range(blocks)
+    ]
+
+def _measure(blockchain: Blockchain, blocks: list, lookups: int, label: str) -> dict:
+    start = time.perf_counter()
+    for block in blocks:
+        blockchain.add_block(block)
+    append = time.perf_counter() - start
+
+    tx_hashes = [tx.digest for block in blocks for tx in block['transactions']]
+    sample = random.Random(1).choices(tx_hashes, k=lookups)
+    start = time.perf_counter()
+    for tx_hash in sample:
+        assert blockchain.get_transaction(tx_hash) is not None
+    lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tx_hash in sample[:lookups // 10]:
+        assert blockchain.verify_inclusion_proof(blockchain.get_inclusion_proof(tx_hash))
+    proof = time.perf_counter() - start
+
+    return {
+        f'{label}_append_blocks_per_s': len(blocks) / append,
+        f'{label}_lookups_per_s': lookups / lookup,
+        f'{label}_proofs_per_s': (lookups // 10) / proof
+    }
+
+def run(blocks: int = 500, per_block: int = 100, lookups: int = 20000) -> dict:
+    results = {'blocks': blocks, 'transactions_per_block': per_block}
+    results.update(_measure(Blockchain(), make_blocks(blocks, per_block), lookups, 'memory'))
+    with tempfile.TemporaryDirectory() as tmp:
+        stored = Blockchain(storage_dir=tmp)
+        results.update(_measure(stored, make_blocks(blocks, per_block), lookups, 'store'))
+        stored.chain.close()
+
+        start = time.perf_counter()
+        reopened = Blockchain(storage_dir=tmp)
+        reopened.get_transaction('0' * 64)  # first lookup rebuilds the index
+        results['store_reopen_and_index_s'] = time.perf_counter() - start
+        reopened.chain.close()
+    return results
+
+if __name__ == '__main__':
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    per_block = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    for key, value in run(blocks, per_block).items():
+        print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,52 @@
+"""
+Consensus check latency with one or more slow peers. p99 should track
+the quorum-th fastest peer, not the slowest.
+
+    python -m benchmarks.bench_consensus [rounds]
+"""
+import asyncio
+import random
+import statistics
+import sys
+from src.blockchain.consensus import ConsensusClient, LocalPeer
+from src.blockchain.core import Blockchain
+from src.utils.crypto import hash_data
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def _measure(rounds: int, peers: int, slow_peers: int) -> dict:
+    tx = {'sender': 'bench', 'data': {}}
+    blockchain = Blockchain()
+    blockchain.add_block({'index': 0, 'transactions': [tx]})
+    rng = random.Random(7)
+    fleet = [
+        LocalPeer(blockchain, latency=lambda: rng.lognormvariate(-4.6, 0.5), name=f"fast-{i}")
+        for i in range(peers - slow_peers)
+    ] + [
+        LocalPeer(blockchain, latency=lambda: rng.uniform(0.5, 1.0), name=f"slow-{i}")
+        for i in range(slow_peers)
+    ]
+    client = ConsensusClient(fleet, timeout=2.0)
+    tx_hash = hash_data(tx)
+    samples = []
+    for _ in range(rounds):
+        result = await client.check(tx_hash)
+        assert result.agreed
+        samples.append(result.elapsed * 1000)
+    return {
+        'peers': peers,
+        'slow_peers': slow_peers,
+        'quorum': client.quorum,
+        'p50_ms': statistics.median(samples),
+        'p99_ms': _percentile(samples, 99)
+    }
+
+def run(rounds: int = 200) -> list:
+    return [asyncio.run(_measure(rounds, 7, slow)) for slow in (0, 1, 3)]
+
+if __name__ == '__main__':
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for row in run(rounds):
+        print(", ".join(f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}" for k, v in row.items()))
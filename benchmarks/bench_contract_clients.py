@@ -0,0 +1,43 @@
+"""
+Per-call overhead of building a fresh Web3 + contract object (the old
+SmartContract behaviour) versus reusing clients from ContractRegistry.
+
+    python -m benchmarks.bench_contract_clients [iterations]
+"""
+import sys
+import time
+from web3 import Web3, EthereumTesterProvider
+from benchmarks.evm import deploy_reputation_contract
+from src.blockchain.smart_contracts import AGENT_REPUTATION_ABI, ContractRegistry
+
+def run(iterations: int = 2000) -> dict:
+    w3, deployed = deploy_reputation_contract()
+    tester = w3.provider.ethereum_tester
+    agent = w3.eth.accounts[1]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fresh = Web3(EthereumTesterProvider(tester))
+        contract = fresh.eth.contract(address=deployed.address, abi=AGENT_REPUTATION_ABI)
+        contract.functions.calculateReputationScore(agent).call()
+    uncached = time.perf_counter() - start
+
+    registry = ContractRegistry()
+    registry.register_web3('tester', w3)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        client = registry.contract(deployed.address, AGENT_REPUTATION_ABI, 'tester')
+        client.contract.functions.calculateReputationScore(agent).call()
+    cached = time.perf_counter() - start
+
+    return {
+        'iterations': iterations,
+        'uncached_us_per_call': uncached / iterations * 1e6,
+        'cached_us_per_call': cached / iterations * 1e6,
+        'saved_us_per_call': (uncached - cached) / iterations * 1e6
+    }
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for key, value in run(iterations).items():
+        print(f"{key}: {value:.1f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,77 @@
+"""
+End-to-end ChainSecAgent.execute latency with a deterministic FakeLLM:
+task -> LLM -> sign -> mempool, serially and through AgentPool, with
+and without the result cache. LLM delay is configurable so agent
+overhead can be measured separately from model latency.
+
+    python -m benchmarks.bench_execute [tasks] [llm_delay_seconds]
+"""
+import statistics
+import sys
+import time
+from src.agents.base_agent import ChainSecAgent
+from src.agents.runtime import AgentPool, FakeLLM
+from src.blockchain.core import Blockchain
+from src.utils.signatures import get_backend
+
+PARAMS = ('tasks', 'llm_delay_ms', 'scheme')
+
+class BenchAgent(ChainSecAgent):
+    """ChainSecAgent whose executor is the FakeLLM itself (run / arun)"""
+
+    def _create_agent_executor(self):
+        return self.llm
+
+    def _create_output_parser(self):
+        return None
+
+def make_agent(name: str, blockchain: Blockchain, llm: FakeLLM, scheme: str) -> BenchAgent:
+    return BenchAgent(name, "benchmark", [], blockchain, llm,
+                      private_key=get_backend(scheme).generate_private_key(), scheme=scheme)
+
+def _percentiles(samples: list, prefix: str) -> dict:
+    ordered = sorted(samples)
+    return {
+        f'{prefix}_p50_ms': statistics.median(ordered) * 1e3,
+        f'{prefix}_p99_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e3
+    }
+
+def run(tasks: int = 200, llm_delay: float = 0.005, scheme: str = 'rsa') -> dict:
+    blockchain = Blockchain()
+    blockchain.add_block({'index': 0, 'timestamp': 0.0, 'transactions': [], 'previous_hash': ''})
+    llm = FakeLLM(delay=llm_delay)
+    agent = make_agent("bench-0", blockchain, llm, scheme)
+    results = {'tasks': tasks, 'llm_delay_ms': llm_delay * 1e3, 'scheme': scheme}
+
+    latencies = []
+    for i in range(tasks):
+        start = time.perf_counter()
+        agent.execute(f"Process this data: {i}")
+        latencies.append(time.perf_counter() - start)
+    results.update(_percentiles(latencies, 'execute'))
+    results['execute_overhead_ms'] = (statistics.mean(latencies) - llm_delay) * 1e3
+
+    agent.enable_result_cache()
+    agent.execute("Process this data: repeated")
+    latencies = []
+    for _ in range(tasks):
+        start = time.perf_counter()
+        agent.execute("Process this data: repeated")
+        latencies.append(time.perf_counter() - start)
+    results.update(_percentiles(latencies, 'execute_cached'))
+
+    agents = [make_agent(f"bench-{i + 1}", blockchain, llm, scheme) for i in range(4)]
+    pool = AgentPool(agents, per_agent=8)
+    start = time.perf_counter()
+    reports = pool.run_sync([f"Pooled task {i}" for i in range(tasks)])
+    elapsed = time.perf_counter() - start
+    assert all(report.ok for report in reports)
+    results['pool_tasks_per_s'] = tasks / elapsed
+    results.update(_percentiles([r.latency for r in reports], 'pool'))
+    return results
+
+if __name__ == '__main__':
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    llm_delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.005
+    for key, value in run(tasks, llm_delay).items():
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
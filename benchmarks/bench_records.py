@@ -0,0 +1,73 @@
+"""
+Memory per transaction and hashing cost of plain dicts versus slotted
+Transaction records. Each transaction is hashed `rounds` times, as it is
+on its way through log_transaction, the mempool, block sealing and
+validation.
+
+    python -m benchmarks.bench_records [transactions] [rounds]
+"""
+import sys
+import time
+import tracemalloc
+from src.blockchain.records import Transaction
+from src.utils.crypto import hash_data
+
+PARAMS = ('transactions',)
+
+def make_payloads(count: int) -> list:
+    return [{
+        'sender': f'agent-{i % 8}',
+        'receiver': 'Network',
+        'data': {'task': f'task-{i}', 'result': i},
+        'previous_hash': '0' * 64,
+        'public_key': 'k' * 32,
+        'signature': 's' * 512,
+        'timestamp': 1700000000.0 + i,
+        'nonce': i
+    } for i in range(count)]
+
+def _footprint(build) -> tuple:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return objects, sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+
+def run(count: int = 20000, rounds: int = 4) -> dict:
+    payloads = make_payloads(count)
+    # Containers only (field values are shared with `payloads`); records
+    # are measured with their digest already cached
+    dicts, dict_bytes = _footprint(lambda: [dict(p) for p in payloads])
+    records, record_bytes = _footprint(
+        lambda: [tx for tx in map(Transaction, payloads) if tx.digest]
+    )
+
+    start = time.perf_counter()
+    for tx in dicts:
+        for _ in range(rounds):
+            hash_data(tx)
+    dict_seconds = time.perf_counter() - start
+
+    # Includes building the record and its first (uncached) hash
+    start = time.perf_counter()
+    for payload in payloads:
+        tx = Transaction(payload)
+        for _ in range(rounds):
+            hash_data(tx)
+    record_seconds = time.perf_counter() - start
+
+    assert all(hash_data(d) == r.digest for d, r in zip(dicts, records))
+    return {
+        'transactions': count,
+        'dict_bytes_per_tx': dict_bytes / count,
+        'record_bytes_per_tx': record_bytes / count,
+        'dict_hash_us_per_tx': dict_seconds / count * 1e6,
+        'record_hash_us_per_tx': record_seconds / count * 1e6
+    }
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    for key, value in run(count, rounds).items():
+        print(f"{key}: {value:.1f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,60 @@
+"""
+Reputation read / update latency against AgentReputation deployed on
+an in-process EVM (eth-tester / py-evm): uncached, cached and bulk
+reads, blocking updates and batched non-blocking submissions.
+
+    python -m benchmarks.bench_reputation [iterations]
+"""
+import sys
+import time
+from benchmarks.evm import deploy_reputation_contract
+from src.blockchain.core import Blockchain
+from src.blockchain.smart_contracts import ContractRegistry
+
+PARAMS = ('iterations',)
+
+def _timed_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+def run(iterations: int = 100) -> dict:
+    w3, contract = deploy_reputation_contract()
+    ContractRegistry.default().register_web3('bench', w3)
+    blockchain = Blockchain(contract.address, provider_uri='bench')
+    agents = w3.eth.accounts[1:9]
+    pick = lambda i: agents[i % len(agents)]
+
+    results = {'iterations': iterations}
+    results['update_us'] = _timed_us(
+        lambda i: blockchain.update_agent_reputation(pick(i), i % 3 != 0, 100 + i, 80, i % 6),
+        iterations
+    )
+    results['read_uncached_us'] = _timed_us(
+        lambda i: blockchain.get_agent_reputation(pick(i)), iterations
+    )
+    results['read_bulk_us_per_agent'] = _timed_us(
+        lambda i: blockchain.get_agent_reputations(agents), iterations
+    ) / len(agents)
+
+    blockchain.enable_reputation_cache(poll_interval=3600)
+    results['read_cached_us'] = _timed_us(
+        lambda i: blockchain.get_agent_reputation(pick(i)), iterations * 10
+    )
+
+    start = time.perf_counter()
+    futures = [
+        blockchain.submit_reputation_update(pick(i), True, 100, 90, 4)
+        for i in range(iterations)
+    ]
+    for future in futures:
+        future.result(timeout=60)
+    results['submit_batched_us_per_update'] = (time.perf_counter() - start) / iterations * 1e6
+    blockchain.reputation_submitter.close()
+    return results
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    for key, value in run(iterations).items():
+        print(f"{key}: {value:.1f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,50 @@
+"""
+Sign / verify throughput and signed transaction size for each
+registered signature scheme.
+
+    python -m benchmarks.bench_signatures [signatures]
+"""
+import sys
+import time
+from src.utils.crypto import (
+    canonical_encode, hash_data, sign_data, signed_payload, validate_signatures
+)
+from src.utils.signatures import get_backend, schemes
+
+PARAMS = ('signatures',)
+
+def signed_transaction(scheme: str, private_key: str, public_key: str, i: int) -> dict:
+    data = {'task': f'task-{i}', 'result': i}
+    return {
+        'sender': 'agent-0',
+        'receiver': 'Network',
+        'data': data,
+        'timestamp': 1700000000.0 + i,
+        'nonce': i,
+        'scheme': scheme,
+        'sender_public_key': public_key,
+        'signature': sign_data(private_key, {'receiver': 'Network', 'data': data}, scheme)
+    }
+
+def run(count: int = 200) -> dict:
+    results = {'signatures': count}
+    for scheme in schemes():
+        backend = get_backend(scheme)
+        private_key = backend.generate_private_key()
+        public_key = backend.public_key(private_key)
+
+        start = time.perf_counter()
+        transactions = [signed_transaction(scheme, private_key, public_key, i) for i in range(count)]
+        results[f'{scheme}_sign_per_s'] = count / (time.perf_counter() - start)
+
+        items = [(public_key, hash_data(signed_payload(tx)), tx['signature']) for tx in transactions]
+        start = time.perf_counter()
+        assert all(validate_signatures(items, scheme))
+        results[f'{scheme}_verify_per_s'] = count / (time.perf_counter() - start)
+        results[f'{scheme}_tx_bytes'] = len(canonical_encode(transactions[0]))
+    return results
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for key, value in run(count).items():
+        print(f"{key}: {value:.0f}" if isinstance(value, float) else f"{key}: {value}")
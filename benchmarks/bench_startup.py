@@ -0,0 +1,84 @@
+"""
+Cold-start time and peak RSS (VmHWM) of a validator process: the headless
+worker against the eager import path (langchain agents / chains / LLMs /
+prompts / tools and web3 loaded at import, as before the imports were
+made lazy). Every sample is a fresh interpreter.
+
+    python -m benchmarks.bench_startup [runs]
+
+langchain is only part of the eager path when it is installed; see
+'langchain_installed' in the results. Peak RSS is read from
+/proc/self/status, so this benchmark needs Linux.
+"""
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PARAMS = ('runs', 'langchain_installed')
+
+# Peak RSS is the child's own VmHWM; ru_maxrss of RUSAGE_SELF can carry
+# the parent's high-water mark across fork/exec
+_MEASURE = """
+import json, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+with open('/proc/self/status') as status:
+    hwm_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM:'))
+print(json.dumps({{'import_s': elapsed, 'rss_kb': hwm_kb}}))
+"""
+
+_LANGCHAIN = ("import langchain.agents, langchain.chains, langchain.llms, "
+              "langchain.prompts, langchain.tools")
+
+_HEADLESS = """
+from src.agents.validator_agent import ValidatorAgent
+from src.agents.validator_worker import ValidationWorker
+from src.blockchain.core import Blockchain
+ValidationWorker(ValidatorAgent(Blockchain(), '0x0'))
+"""
+
+def _eager() -> str:
+    lines = ["import web3", "import src.agents.validator_agent"]
+    if importlib.util.find_spec('langchain') is not None:
+        lines.insert(0, _LANGCHAIN)
+    return "\n".join(lines)
+
+def _sample(body: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    start = time.perf_counter()
+    out = subprocess.check_output(
+        [sys.executable, '-c', _MEASURE.format(body=body)], env=env, text=True
+    )
+    sample = json.loads(out.strip().splitlines()[-1])
+    sample['wall_s'] = time.perf_counter() - start
+    return sample
+
+def _measure(body: str, runs: int, prefix: str) -> dict:
+    samples = [_sample(body) for _ in range(runs)]
+    return {
+        f'{prefix}_cold_start_s': statistics.median(s['wall_s'] for s in samples),
+        f'{prefix}_import_s': statistics.median(s['import_s'] for s in samples),
+        f'{prefix}_rss_mb': statistics.median(s['rss_kb'] for s in samples) / 1024
+    }
+
+def run(runs: int = 5) -> dict:
+    results = {
+        'runs': runs,
+        'langchain_installed': importlib.util.find_spec('langchain') is not None
+    }
+    results.update(_measure(_eager(), runs, 'eager'))
+    results.update(_measure(_HEADLESS, runs, 'headless'))
+    results['cold_start_speedup'] = (
+        results['eager_cold_start_s'] / results['headless_cold_start_s']
+    )
+    return results
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for key, value in run(runs).items():
+        print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
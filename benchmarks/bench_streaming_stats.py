@@ -0,0 +1,62 @@
+"""
+Throughput and peak memory of stream_stats over a memory-mapped .npy
+file, compared with the original list-based DataProcessor computation
+on a sample of the same values.
+
+    python -m benchmarks.bench_streaming_stats [values]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from src.utils.streaming_stats import CHUNK_SIZE, stream_stats
+
+PARAMS = ('values',)
+
+def _write_values(path: str, count: int) -> None:
+    # Written chunk by chunk so generating the input is bounded too
+    array = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(count,))
+    rng = np.random.default_rng(0)
+    for start in range(0, count, CHUNK_SIZE):
+        stop = min(count, start + CHUNK_SIZE)
+        array[start:stop] = rng.random(stop - start)
+    array.flush()
+    del array
+
+def _list_stats(values: list) -> dict:
+    return {'mean': sum(values) / len(values), 'total': sum(values)}
+
+def run(count: int = 100_000_000) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'values.npy')
+        _write_values(path, count)
+        start = time.perf_counter()
+        stats = stream_stats(path)
+        elapsed = time.perf_counter() - start
+        assert stats['count'] == count
+
+        # Heap allocations only: mmap'd file pages are not copied
+        tracemalloc.start()
+        stream_stats(path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        sample = np.load(path, mmap_mode='r')[:min(count, 1_000_000)].tolist()
+        start = time.perf_counter()
+        _list_stats(sample)
+        list_rate = len(sample) / (time.perf_counter() - start)
+
+    return {
+        'values': count,
+        'streaming_values_per_s': count / elapsed,
+        'streaming_seconds': elapsed,
+        'peak_heap_mb': peak / 2 ** 20,
+        'list_values_per_s': list_rate
+    }
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+    for key, value in run(count).items():
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
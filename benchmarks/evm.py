@@ -0,0 +1,54 @@
+"""
+In-process EVM helpers shared by the benchmarks: compiles
+contracts/AgentTransaction.sol and deploys AgentReputation on an
+eth-tester / py-evm backend so nothing needs a running node.
+"""
+import os
+from typing import Tuple
+from web3 import Web3, EthereumTesterProvider
+
+SOLC_VERSION = '0.8.19'
+CONTRACT_PATH = os.path.join(
+    os.path.dirname(__file__), '..', 'contracts', 'AgentTransaction.sol'
+)
+
+class SolcUnavailable(ImportError):
+    """solc SOLC_VERSION is not installed; raised instead of downloading it"""
+
+def _solc_installed(solcx) -> bool:
+    if SOLC_VERSION in [str(v) for v in solcx.get_installed_solc_versions()]:
+        return True
+    try:
+        # a matching solc on PATH is copied into py-solc-x's directory
+        solcx.import_installed_solc()
+    except Exception:
+        return False
+    return SOLC_VERSION in [str(v) for v in solcx.get_installed_solc_versions()]
+
+def compile_reputation_contract() -> dict:
+    """Compile AgentReputation with a locally installed solc (never fetched)"""
+    import solcx
+
+    if not _solc_installed(solcx):
+        raise SolcUnavailable(
+            f"solc {SOLC_VERSION} is not installed; run "
+            f"`python -m solcx.install v{SOLC_VERSION}` once"
+        )
+    with open(CONTRACT_PATH) as f:
+        compiled = solcx.compile_source(
+            f.read(),
+            output_values=['abi', 'bin'],
+            solc_version=SOLC_VERSION
+        )
+    return compiled['<stdin>:AgentReputation']
+
+def deploy_reputation_contract(w3: Web3 = None) -> Tuple[Web3, object]:
+    """Deploy AgentReputation and register the default account as validator"""
+    w3 = w3 or Web3(EthereumTesterProvider())
+    w3.eth.default_account = w3.eth.accounts[0]
+    compiled = compile_reputation_contract()
+    factory = w3.eth.contract(abi=compiled['abi'], bytecode=compiled['bin'])
+    receipt = w3.eth.wait_for_transaction_receipt(factory.constructor().transact())
+    contract = w3.eth.contract(address=receipt.contractAddress, abi=compiled['abi'])
+    contract.functions.addValidator(w3.eth.default_account).transact()
+    return w3, contract
@@ -0,0 +1,148 @@
+"""
+Offline benchmark suite. Runs the hot-path benchmarks (in-process EVM,
+FakeLLM, no network) and writes one JSON document, so results can be
+stored per commit and compared against a baseline.
+
+    python -m benchmarks.suite [--quick] [--only chain execute]
+                               [--output results.json]
+                               [--compare baseline.json] [--tolerance 0.2]
+
+Each result keeps the benchmark's inputs under 'params' (run()
+arguments and the result keys named in the module's PARAMS) apart from
+its measurements under 'metrics'. Only metrics are compared.
+
+With --compare the exit status is 1 when any metric regressed by more
+than the tolerance: throughput (*_per_s) dropping, or latency / size
+metrics (*_us, *_ms, *_s, *_bytes, ...) growing.
+"""
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+import traceback
+from typing import Dict, List, Optional
+
+# name -> (module, full-run arguments, --quick arguments)
+BENCHMARKS = {
+    'chain': ('benchmarks.bench_chain',
+              {'blocks': 500, 'per_block': 100}, {'blocks': 50, 'per_block': 50, 'lookups': 2000}),
+    'pending_validation': ('benchmarks.bench_batch_validation',
+                           {'count': 4000}, {'count': 256}),
+    'reputation': ('benchmarks.bench_reputation', {'iterations': 100}, {'iterations': 10}),
+    'execute': ('benchmarks.bench_execute', {'tasks': 200}, {'tasks': 20}),
+    'records': ('benchmarks.bench_records', {'count': 20000}, {'count': 2000}),
+    'signatures': ('benchmarks.bench_signatures', {'count': 200}, {'count': 20}),
+    'streaming_stats': ('benchmarks.bench_streaming_stats',
+                        {'count': 10_000_000}, {'count': 1_000_000}),
+    'startup': ('benchmarks.bench_startup', {'runs': 5}, {'runs': 2}),
+}
+
+_HIGHER_IS_BETTER = ('_per_s', '_speedup')
+_LOWER_IS_BETTER = ('_us', '_ms', '_s', '_seconds', '_bytes', '_mb', '_bytes_per_tx')
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmark(name: str, quick: bool = False) -> Dict:
+    module_name, full, reduced = BENCHMARKS[name]
+    arguments = reduced if quick else full
+    start = time.perf_counter()
+    try:
+        module = importlib.import_module(module_name)
+        metrics = module.run(**arguments)
+    except ImportError as exc:
+        # e.g. solc or langchain not installed
+        return {'skipped': f"{type(exc).__name__}: {exc}"}
+    except Exception as exc:
+        return {'error': f"{type(exc).__name__}: {exc}", 'traceback': traceback.format_exc()}
+    params = dict(arguments)
+    for key in getattr(module, 'PARAMS', ()):
+        if key in metrics:
+            params[key] = metrics.pop(key)
+    return {'params': params, 'metrics': metrics, 'wall_seconds': time.perf_counter() - start}
+
+def run_suite(names: Optional[List[str]] = None, quick: bool = False) -> Dict:
+    names = names or list(BENCHMARKS)
+    return {
+        'commit': _git_commit(),
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': quick,
+        'results': {name: run_benchmark(name, quick) for name in names}
+    }
+
+def _direction(metric: str) -> int:
+    """+1 if higher is better, -1 if lower is better, 0 if not comparable"""
+    if any(metric.endswith(s) or f'{s}_' in metric for s in _HIGHER_IS_BETTER):
+        return 1
+    if any(metric.endswith(s) or f'{s}_per_' in metric for s in _LOWER_IS_BETTER):
+        return -1
+    return 0
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.2) -> List[Dict]:
+    """
+    Metrics present in both runs that got worse by more than `tolerance`
+    Benchmarks run with different params are not compared
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        previous = baseline.get('results', {}).get(name, {})
+        before = previous.get('metrics')
+        after = result.get('metrics')
+        if not isinstance(before, dict) or not isinstance(after, dict):
+            continue
+        if previous.get('params') != result.get('params'):
+            continue  # different inputs, e.g. --quick against a full run
+        for metric, value in after.items():
+            old = before.get(metric)
+            direction = _direction(metric)
+            if (not direction or isinstance(value, bool) or not isinstance(value, (int, float))
+                    or not isinstance(old, (int, float)) or old <= 0):
+                continue
+            change = (value - old) / old * direction
+            if change < -tolerance:
+                regressions.append({
+                    'benchmark': name, 'metric': metric,
+                    'baseline': old, 'current': value, 'change': change
+                })
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--quick', action='store_true', help="small inputs, for CI smoke runs")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS))
+    parser.add_argument('--output', help="write JSON here instead of stdout")
+    parser.add_argument('--compare', help="baseline JSON from an earlier run")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.only, args.quick)
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        report['regressions'] = regressions
+
+    text = json.dumps(report, indent=2, sort_keys=True, default=str)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    for regression in regressions:
+        print(f"REGRESSION {regression['benchmark']}.{regression['metric']}: "
+              f"{regression['baseline']:.4g} -> {regression['current']:.4g} "
+              f"({regression['change']:+.0%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
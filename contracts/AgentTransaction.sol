@@ -28,6 +28,35 @@ contract AgentReputation {
         uint256 validationScore,
         uint256 peerRating
     ) external onlyValidator {
+        _updateReputation(agent, taskSuccess, responseTime, validationScore, peerRating);
+    }
+
+    function updateReputationBatch(
+        address[] calldata agents,
+        bool[] calldata taskSuccess,
+        uint256[] calldata responseTimes,
+        uint256[] calldata validationScores,
+        uint256[] calldata peerRatings
+    ) external onlyValidator {
+        require(
+            agents.length == taskSuccess.length &&
+            agents.length == responseTimes.length &&
+            agents.length == validationScores.length &&
+            agents.length == peerRatings.length,
+            "Length mismatch"
+        );
+        for (uint256 i = 0; i < agents.length; i++) {
+            _updateReputation(agents[i], taskSuccess[i], responseTimes[i], validationScores[i], peerRatings[i]);
+        }
+    }
+
+    function _updateReputation(
+        address agent,
+        bool taskSuccess,
+        uint256 responseTime,
+        uint256 validationScore,
+        uint256 peerRating
+    ) internal {
         Reputation storage rep = reputations[agent];
         
         rep.totalTasks += 1;
@@ -53,6 +82,19 @@ contract AgentReputation {
         ) / 1e16; // Returns score 0-100
     }
 
+    function getReputationsBatch(address[] calldata agents)
+        external
+        view
+        returns (uint256[] memory scores, Reputation[] memory reps)
+    {
+        scores = new uint256[](agents.length);
+        reps = new Reputation[](agents.length);
+        for (uint256 i = 0; i < agents.length; i++) {
+            scores[i] = calculateReputationScore(agents[i]);
+            reps[i] = reputations[agents[i]];
+        }
+    }
+
     function addValidator(address validator) external {
         validators[validator] = true;
     }
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from src.blockchain.records import Block
+
+logger = logging.getLogger(__name__)
+
+class BlockBuilder:
+    """
+    Seals pending transactions into blocks in a background thread.
+
+    A block is sealed as soon as the mempool holds max_transactions,
+    reaches max_bytes, or its oldest unsealed transaction has waited
+    max_latency seconds. Transaction hashes computed when the mempool
+    admitted them are reused as Merkle leaves, so sealing never
+    re-serializes transaction bodies. Sealed blocks are pushed to
+    subscribers instead of being polled for.
+    """
+
+    def __init__(
+        self,
+        blockchain,
+        max_transactions: int = 500,
+        max_bytes: int = 1024 * 1024,
+        max_latency: float = 1.0
+    ):
+        self.blockchain = blockchain
+        self.max_transactions = max_transactions
+        self.max_bytes = max_bytes
+        self.max_latency = max_latency
+        self._cond = threading.Condition()
+        self._sealed = threading.Condition()
+        self._seal_lock = threading.Lock()
+        self._subscribers: List[Callable[[Dict], None]] = []
+        self._first_pending_at: Optional[float] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "BlockBuilder":
+        with self._cond:
+            if self._running:
+                return self
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="block-builder", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, seal_pending: bool = True) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        while seal_pending and self.seal() is not None:
+            pass
+
+    def notify(self) -> None:
+        """Wake the builder after transactions were added"""
+        with self._cond:
+            self._cond.notify()
+
+    def subscribe(self, callback: Callable[[Dict], None]) -> None:
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Dict], None]) -> None:
+        self._subscribers.remove(callback)
+
+    def subscribe_async(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> asyncio.Queue:
+        """asyncio.Queue that receives every sealed block on `loop`"""
+        loop = loop or asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        self.subscribe(lambda block: loop.call_soon_threadsafe(queue.put_nowait, block))
+        return queue
+
+    def wait_for_block(self, height: int, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Block until the chain reaches `height`; returns that block or None"""
+        with self._sealed:
+            if not self._sealed.wait_for(lambda: len(self.blockchain.chain) > height, timeout):
+                return None
+        return self.blockchain.chain[height]
+
+    def _due(self, now: float) -> bool:
+        pool = self.blockchain.pending_transactions
+        return (
+            len(pool) >= self.max_transactions
+            or pool.total_bytes >= self.max_bytes
+            or now - self._first_pending_at >= self.max_latency
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    if not len(self.blockchain.pending_transactions):
+                        self._first_pending_at = None
+                        self._cond.wait()
+                        continue
+                    now = time.monotonic()
+                    if self._first_pending_at is None:
+                        self._first_pending_at = now
+                    if self._due(now):
+                        break
+                    self._cond.wait(self._first_pending_at + self.max_latency - now)
+                if not self._running:
+                    return
+            self.seal()
+
+    def seal(self) -> Optional[Dict]:
+        """Seal one block from the mempool now; None if nothing is pending"""
+        with self._seal_lock:
+            selected = self.blockchain.pending_transactions.pop_ready(
+                self.max_transactions, self.max_bytes
+            )
+            with self._cond:
+                self._first_pending_at = (
+                    time.monotonic() if len(self.blockchain.pending_transactions) else None
+                )
+            if not selected:
+                return None
+
+            chain = self.blockchain.chain
+            block = Block(
+                index=len(chain),
+                timestamp=time.time(),
+                transactions=[tx for _, tx in selected],
+                previous_hash=self.blockchain.hash(chain[-1]) if len(chain) else '0' * 64
+            )
+            self.blockchain.add_block(block, leaves=[tx_hash for tx_hash, _ in selected])
+
+        with self._sealed:
+            self._sealed.notify_all()
+        for callback in list(self._subscribers):
+            try:
+                callback(block)
+            except Exception:
+                logger.exception("Block subscriber failed")
+        return block
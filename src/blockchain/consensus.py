@@ -0,0 +1,237 @@
+import asyncio
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Union
+from src.utils.crypto import hash_data
+
+_UNDECIDED = object()
+
+class Peer:
+    """
+    A network node that can be asked which block holds a transaction.
+    query() returns that block's hash, or None if the node does not
+    have the transaction.
+    """
+    name: str = "peer"
+
+    async def query(self, tx_hash: str) -> Optional[str]:
+        raise NotImplementedError
+
+class HttpPeer(Peer):
+    """
+    Node reachable over HTTP: GET {url}/transactions/{tx_hash} -> {"block_hash": ...}
+    An aiohttp session only works on the loop that created it, so one is
+    kept per event loop.
+    """
+
+    def __init__(self, url: str):
+        self.url = url.rstrip('/')
+        self.name = url
+        self._sessions = {}  # event loop -> aiohttp.ClientSession
+
+    def _session(self):
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # Sessions of loops that have since closed cannot be used again
+            self._sessions = {l: s for l, s in self._sessions.items() if not l.is_closed()}
+            session = self._sessions[loop] = aiohttp.ClientSession()
+        return session
+
+    async def query(self, tx_hash: str) -> Optional[str]:
+        async with self._session().get(f"{self.url}/transactions/{tx_hash}") as response:
+            if response.status == 404:
+                return None
+            response.raise_for_status()
+            return (await response.json()).get('block_hash')
+
+    async def close(self) -> None:
+        """Close the session of the running loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+class LocalPeer(Peer):
+    """In-process stand-in node backed by a Blockchain, with injectable latency"""
+
+    def __init__(self, blockchain, latency: Union[float, Callable[[], float]] = 0.0,
+                 name: str = "local"):
+        self.blockchain = blockchain
+        self.latency = latency
+        self.name = name
+
+    async def query(self, tx_hash: str) -> Optional[str]:
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay:
+            await asyncio.sleep(delay)
+        found = self.blockchain.get_transaction(tx_hash)
+        return self.blockchain.hash(found[0]) if found else None
+
+@dataclass
+class PeerHealth:
+    latency: float = 0.0  # EWMA of successful response times, seconds
+    failures: int = 0     # consecutive errors/timeouts
+
+    def score(self) -> float:
+        return self.latency * (1 + self.failures)
+
+@dataclass
+class ConsensusResult:
+    agreed: bool
+    block_hash: Optional[str] = None
+    votes: Dict[Optional[str], int] = field(default_factory=dict)
+    queried: int = 0
+    elapsed: float = 0.0
+
+class ConsensusClient:
+    """
+    Asks peers concurrently which block holds a transaction and returns
+    as soon as `quorum` of them agree (a majority by default).
+
+    Peers are tried healthiest first: the `quorum + spare` best-scoring
+    peers start immediately and the next one is launched whenever a
+    peer fails, times out or disagrees. Outstanding queries are
+    cancelled once the outcome is decided, so latency follows the
+    quorum-th fastest peer rather than the slowest.
+    """
+
+    def __init__(self, peers: List[Peer], quorum: Optional[int] = None,
+                 timeout: float = 2.0, spare: int = 1, smoothing: float = 0.2):
+        if not peers:
+            raise ValueError("ConsensusClient needs at least one peer")
+        self.peers = list(peers)
+        self.quorum = quorum or len(self.peers) // 2 + 1
+        self.timeout = timeout
+        self.spare = spare
+        self.smoothing = smoothing
+        self.health: Dict[int, PeerHealth] = {id(peer): PeerHealth() for peer in self.peers}
+        # Event loop thread for synchronous callers, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    def _ranked(self) -> List[Peer]:
+        return sorted(self.peers, key=lambda peer: self.health[id(peer)].score())
+
+    async def _ask(self, peer: Peer, tx_hash: str) -> Optional[str]:
+        health = self.health[id(peer)]
+        start = time.perf_counter()
+        try:
+            answer = await asyncio.wait_for(peer.query(tx_hash), self.timeout)
+        except asyncio.CancelledError:
+            # Cancelled stragglers were at least this slow
+            elapsed = time.perf_counter() - start
+            if elapsed > health.latency:
+                health.latency += self.smoothing * (elapsed - health.latency)
+            raise
+        except Exception:
+            health.failures += 1
+            health.latency += self.smoothing * (self.timeout - health.latency)
+            raise
+        elapsed = time.perf_counter() - start
+        health.latency += self.smoothing * (elapsed - health.latency)
+        health.failures = 0
+        return answer
+
+    async def check(self, tx_hash: str) -> ConsensusResult:
+        start = time.perf_counter()
+        waiting = deque(self._ranked())
+        votes = Counter()
+        tasks = {}
+        decided = _UNDECIDED
+        answered = 0
+
+        def top_up() -> None:
+            # Keep enough queries in flight that the leading answer could
+            # still reach quorum with `spare` peers to hedge against stragglers
+            leading = max(votes.values(), default=0)
+            while waiting and leading + len(tasks) < self.quorum + self.spare:
+                tasks[asyncio.ensure_future(self._ask(waiting.popleft(), tx_hash))] = None
+
+        top_up()
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del tasks[task]
+                    answered += 1
+                    if task.exception() is None:
+                        votes[task.result()] += 1
+                for answer, count in votes.items():
+                    if count >= self.quorum:
+                        decided = answer
+                if decided is not _UNDECIDED:
+                    break
+                if max(votes.values(), default=0) + len(tasks) + len(waiting) < self.quorum:
+                    break
+                top_up()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return ConsensusResult(
+            agreed=decided is not _UNDECIDED,
+            block_hash=None if decided is _UNDECIDED else decided,
+            votes=dict(votes),
+            queried=answered,
+            elapsed=time.perf_counter() - start
+        )
+
+    async def check_transaction(self, transaction: Dict) -> bool:
+        """
+        True when a quorum of peers places the transaction in the same
+        block (and that block matches transaction['block_hash'] if given)
+        """
+        tx_hash = transaction.get('tx_hash') or hash_data(
+            {k: v for k, v in transaction.items() if k != 'block_hash'}
+        )
+        result = await self.check(tx_hash)
+        if not result.agreed or result.block_hash is None:
+            return False
+        expected = transaction.get('block_hash')
+        return expected is None or expected == result.block_hash
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="consensus", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def check_transaction_sync(self, transaction: Dict) -> bool:
+        """
+        check_transaction for synchronous callers. Every call runs on one
+        long-lived loop thread, so peer sessions are reused, and it also
+        works when the calling thread already runs an event loop.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.check_transaction(transaction), self._background_loop()
+        )
+        return future.result()
+
+    def close(self) -> None:
+        """Close peer sessions on the background loop and stop it"""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        async def close_peers():
+            for peer in self.peers:
+                close = getattr(peer, 'close', None)
+                if close is not None:
+                    await close()
+
+        asyncio.run_coroutine_threadsafe(close_peers(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._loop_thread.join()
+        loop.close()
@@ -1,10 +1,222 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+from src.blockchain.mempool import Mempool
+from src.blockchain.merkle import merkle_proof, merkle_root, verify_proof
+from src.blockchain.records import Block, Transaction
+from src.blockchain.smart_contracts import AGENT_REPUTATION_ABI, SmartContract, get_contract
+from src.utils.crypto import hash_data
+from src.utils.metrics import timed
+
 class Blockchain:
-    def __init__(self, reputation_contract_address: str = None):
-        self.chain = []
-        self.pending_transactions = []
+    def __init__(self, reputation_contract_address: str = None,
+                 provider_uri: Optional[str] = None,
+                 storage_dir: Optional[str] = None):
+        if storage_dir:
+            from src.blockchain.storage import ChainStore
+
+            self.chain = ChainStore(storage_dir)
+        else:
+            self.chain = []
+        self.pending_transactions = Mempool()
         self.reputation_contract = reputation_contract_address
+        self.provider_uri = provider_uri
+        self._reputation_client: Optional[SmartContract] = None
+        self.reputation_cache = None
+        self.reputation_submitter = None
+        self.block_builder = None
+        # tx hash -> (block index, position within block['transactions'])
+        self.tx_index: Dict[str, Tuple[int, int]] = {}
+        # A reopened store's index is loaded on first lookup, not at startup
+        self._tx_index_ready = len(self.chain) == 0
+        # Transaction hashes of recent blocks, for inclusion proofs
+        self._leaves: "OrderedDict[int, List[str]]" = OrderedDict()
+        self.leaves_cache_size = 256
         # ... existing init code ...
 
+    @staticmethod
+    def hash(block: Dict) -> str:
+        """
+        Hash a block or transaction payload
+        Blocks carrying a merkle_root are hashed by header only; the
+        root already commits to the transaction list
+        """
+        if isinstance(block, Block):
+            return block.block_hash
+        if 'merkle_root' in block:
+            return hash_data(Blockchain.header(block))
+        return hash_data(block)
+
+    @staticmethod
+    def header(block: Dict) -> Dict:
+        """Block without its transaction bodies, as kept by light validators"""
+        return {key: value for key, value in block.items() if key != 'transactions'}
+
+    @property
+    def last_block(self) -> Dict:
+        return self.chain[-1]
+
+    def add_transaction(self, **transaction) -> int:
+        """Queue a signed transaction for the next block"""
+        return self.queue_transaction(Transaction(transaction))
+
+    def queue_transaction(self, transaction: Transaction) -> int:
+        """
+        add_transaction for an already built Transaction record
+        Raises ValueError if the mempool rejects it (a duplicate, a
+        higher-priority transaction holding its nonce, or a full pool)
+        """
+        if self.pending_transactions.add(transaction) is None:
+            raise ValueError(
+                f"Transaction {transaction.get('nonce')} from "
+                f"{transaction.get('sender', '')} rejected by the mempool"
+            )
+        if self.block_builder is not None:
+            self.block_builder.notify()
+        return len(self.chain)
+
+    def reputation_priority(self, transaction: Dict) -> float:
+        """
+        Mempool priority by sender reputation, for use as
+        Mempool(priority=blockchain.reputation_priority)
+        """
+        sender = transaction.get('sender_public_key') or transaction.get('sender', '')
+        return float(self.get_agent_reputation(sender)['score'])
+
+    def add_block(self, block: Dict, leaves: Optional[List[str]] = None) -> Dict:
+        """
+        Append a block to the chain and index its transactions
+        Sets the block's merkle_root if it does not carry one yet
+        leaves: precomputed transaction hashes, in block order
+        """
+        if leaves is None:
+            leaves = [hash_data(tx) for tx in block.get('transactions', [])]
+        block.setdefault('merkle_root', merkle_root(leaves))
+        if isinstance(self.chain, list):
+            self.chain.append(block)
+        else:
+            # ChainStore persists the transaction index with the block
+            self.chain.append(block, leaves)
+        self._remember_leaves(len(self.chain) - 1, leaves)
+        if self._tx_index_ready:
+            self._index_leaves(len(self.chain) - 1, leaves)
+        return block
+
+    def _remember_leaves(self, height: int, leaves: List[str]) -> None:
+        self._leaves[height] = leaves
+        self._leaves.move_to_end(height)
+        while len(self._leaves) > self.leaves_cache_size:
+            self._leaves.popitem(last=False)
+
+    def _block_leaves(self, height: int, block: Dict) -> List[str]:
+        leaves = self._leaves.get(height)
+        if leaves is None:
+            leaves = [hash_data(tx) for tx in block['transactions']]
+        self._remember_leaves(height, leaves)
+        return leaves
+
+    def _index_leaves(self, height: int, leaves: List[str]) -> None:
+        for position, tx_hash in enumerate(leaves):
+            self.tx_index[tx_hash] = (height, position)
+
+    def start_block_builder(self, **options) -> "BlockBuilder":
+        """
+        Seal pending transactions into blocks in the background.
+        Options are passed to BlockBuilder (max_transactions, ...).
+        """
+        from src.blockchain.block_builder import BlockBuilder
+
+        self.block_builder = BlockBuilder(self, **options).start()
+        return self.block_builder
+
+    def rebuild_tx_index(self) -> None:
+        """
+        Recompute the transaction index from the full chain,
+        e.g. after the chain was restored from storage
+        """
+        self.tx_index = {}
+        for height, block in enumerate(self.chain):
+            self._index_leaves(height, [hash_data(tx) for tx in block.get('transactions', [])])
+        self._tx_index_ready = True
+
+    def _load_tx_index(self) -> None:
+        load = getattr(self.chain, 'load_tx_index', None)
+        if load is None:
+            self.rebuild_tx_index()
+        else:
+            self.tx_index = load()
+            self._tx_index_ready = True
+
+    def get_transaction(self, tx_hash: str) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Look up a transaction by hash in O(1)
+        Returns (block, transaction) or None if unknown
+        """
+        if not self._tx_index_ready:
+            self._load_tx_index()
+        location = self.tx_index.get(tx_hash)
+        if location is None:
+            return None
+        height, position = location
+        block = self.chain[height]
+        return block, block['transactions'][position]
+
+    def get_inclusion_proof(self, tx_hash: str) -> Optional[Dict]:
+        """
+        Merkle inclusion proof for a transaction, or None if unknown
+        The proof carries the transaction so it can be checked against
+        a block header alone (see verify_inclusion_proof)
+        """
+        if not self._tx_index_ready:
+            self._load_tx_index()
+        location = self.tx_index.get(tx_hash)
+        if location is None:
+            return None
+        height, position = location
+        block = self.chain[height]
+        leaves = self._block_leaves(height, block)
+        return {
+            'transaction': block['transactions'][position],
+            'block': height,
+            'merkle_root': block['merkle_root'],
+            'path': merkle_proof(leaves, position)
+        }
+
+    def verify_inclusion_proof(self, proof: Dict) -> bool:
+        """Check a proof against the merkle_root of the local block header"""
+        try:
+            root = self.chain[proof['block']]['merkle_root']
+            return (
+                proof['merkle_root'] == root
+                and verify_proof(hash_data(proof['transaction']), proof['path'], root)
+            )
+        except (KeyError, IndexError, TypeError):
+            return False
+
+    def _load_reputation_abi(self) -> list:
+        return AGENT_REPUTATION_ABI
+
+    def _reputation_contract(self) -> SmartContract:
+        """Shared AgentReputation client from the process-wide registry"""
+        if self._reputation_client is None:
+            self._reputation_client = get_contract(
+                self.reputation_contract,
+                self._load_reputation_abi(),
+                self.provider_uri
+            )
+        return self._reputation_client
+
+    def enable_reputation_cache(self, **options) -> "ReputationCache":
+        """
+        Serve get_agent_reputation from an event-invalidated cache.
+        Options are passed to ReputationCache (ttl, max_entries, ...).
+        """
+        from src.blockchain.reputation_cache import ReputationCache
+
+        self.reputation_cache = ReputationCache(self._reputation_contract(), **options)
+        return self.reputation_cache
+
+    @timed('blockchain.update_agent_reputation')
     def update_agent_reputation(self, agent_address: str, 
                               task_success: bool,
                               response_time: int,
@@ -13,10 +225,7 @@ class Blockchain:
         """
         Update agent reputation through smart contract
         """
-        contract = SmartContract(
-            self.reputation_contract,
-            self._load_reputation_abi()
-        )
+        contract = self._reputation_contract()
         
         tx_hash = contract.contract.functions.updateReputation(
             agent_address,
@@ -26,20 +235,61 @@ class Blockchain:
             peer_rating
         ).transact()
         
-        return self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = contract.w3.eth.wait_for_transaction_receipt(tx_hash)
+        if self.reputation_cache is not None:
+            self.reputation_cache.invalidate(agent_address)
+        return receipt
 
-    def get_agent_reputation(self, agent_address: str) -> dict:
+    @timed('blockchain.submit_reputation_update')
+    def submit_reputation_update(self, agent_address: str,
+                                 task_success: bool,
+                                 response_time: int,
+                                 validation_score: int,
+                                 peer_rating: int = 0) -> Future:
         """
-        Retrieve agent reputation from blockchain
+        Non-blocking variant of update_agent_reputation
+        Updates are batched and pipelined; the Future resolves to the receipt
         """
-        contract = SmartContract(
-            self.reputation_contract,
-            self._load_reputation_abi()
+        if self.reputation_submitter is None:
+            from src.blockchain.submission import ReputationSubmitter
+
+            self.reputation_submitter = ReputationSubmitter(
+                self._reputation_contract(),
+                on_confirmed=self._on_reputation_confirmed
+            )
+        return self.reputation_submitter.submit(
+            agent_address, task_success, response_time, validation_score, peer_rating
         )
+
+    def _on_reputation_confirmed(self, agent_addresses: List[str]) -> None:
+        if self.reputation_cache is not None:
+            for agent_address in agent_addresses:
+                self.reputation_cache.invalidate(agent_address)
+
+    @timed('blockchain.get_agent_reputation')
+    def get_agent_reputation(self, agent_address: str, strict: bool = False) -> dict:
+        """
+        Retrieve agent reputation from blockchain
+        strict=True bypasses the reputation cache for high-value checks
+        """
+        if self.reputation_cache is None:
+            return self._fetch_agent_reputation(agent_address)
+        if strict:
+            reputation = self._fetch_agent_reputation(agent_address)
+            self.reputation_cache.put(agent_address, reputation)
+            return reputation
+        return self.reputation_cache.get(agent_address, self._fetch_agent_reputation)
+
+    def _fetch_agent_reputation(self, agent_address: str) -> dict:
+        contract = self._reputation_contract()
         
         score = contract.contract.functions.calculateReputationScore(agent_address).call()
         raw_rep = contract.contract.functions.reputations(agent_address).call()
         
+        return self._reputation_record(score, raw_rep)
+
+    @staticmethod
+    def _reputation_record(score: int, raw_rep) -> dict:
         return {
             'score': score,
             'total_tasks': raw_rep[0],
@@ -48,4 +298,34 @@ class Blockchain:
             'avg_response_time': raw_rep[3],
             'peer_reviews': raw_rep[4],
             'peer_score': raw_rep[5]
-        }
\ No newline at end of file
+        }
+
+    @timed('blockchain.get_agent_reputations')
+    def get_agent_reputations(self, agent_addresses: List[str],
+                              chunk_size: int = 500) -> Dict[str, dict]:
+        """
+        Retrieve many reputations with one getReputationsBatch call per
+        chunk of addresses; returns {address: get_agent_reputation(address)}
+        Cached entries are used when the reputation cache is enabled
+        """
+        addresses = list(dict.fromkeys(agent_addresses))
+        result = {}
+        missing = addresses
+        if self.reputation_cache is not None:
+            missing = []
+            for address in addresses:
+                cached = self.reputation_cache.peek(address)
+                if cached is None:
+                    missing.append(address)
+                else:
+                    result[address] = cached
+
+        functions = self._reputation_contract().contract.functions
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start:start + chunk_size]
+            scores, raw_reps = functions.getReputationsBatch(chunk).call()
+            for address, score, raw_rep in zip(chunk, scores, raw_reps):
+                result[address] = self._reputation_record(score, raw_rep)
+                if self.reputation_cache is not None:
+                    self.reputation_cache.put(address, result[address])
+        return {address: result[address] for address in addresses}
\ No newline at end of file
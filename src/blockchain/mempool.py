@@ -0,0 +1,176 @@
+import bisect
+import hashlib
+import heapq
+import itertools
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.blockchain.records import Transaction
+from src.utils.crypto import canonical_encode, signer_key
+
+def fee_priority(transaction: Dict) -> float:
+    return float(transaction.get('fee', 0))
+
+class Mempool:
+    """
+    Pending transaction pool that replaces the plain pending list.
+
+    - transactions are de-duplicated by hash
+    - each sender has a nonce-ordered queue; a (sender, nonce) slot can
+      only be replaced by a higher-priority transaction. Senders are
+      told apart by signing key (sender_public_key / public_key): the
+      sender name is shared by every agent of a class. Unsigned
+      transactions fall back to the name
+    - select(k) returns the top-k ready transactions (highest priority
+      first, never ahead of a lower nonce from the same sender) in
+      O(senders + k log senders) without copying the pool
+    - gaps between a sender's nonces do not hold it back: agent nonces
+      are strictly increasing millisecond-clock values (see
+      ChainSecAgent._generate_nonce), not sequence numbers, so a gap is
+      the normal case and cannot signal a missing transaction
+    - when max_transactions / max_bytes is exceeded the lowest-priority
+      transaction is evicted
+    len() and byte counts are O(1). Iteration yields transactions in
+    arrival order, so list-style consumers keep working.
+    """
+
+    def __init__(
+        self,
+        priority: Callable[[Dict], float] = fee_priority,
+        max_transactions: int = 100000,
+        max_bytes: int = 256 * 1024 * 1024
+    ):
+        self.priority = priority
+        self.max_transactions = max_transactions
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._lock = threading.RLock()
+        self._seq = itertools.count()
+        self._txs: Dict[str, Dict] = {}
+        # tx hash -> (priority, size, sender, nonce)
+        self._meta: Dict[str, Tuple[float, int, str, int]] = {}
+        # sender key -> sorted [(nonce, tx hash)]
+        self._queues: Dict[str, List[Tuple[int, str]]] = {}
+        # min-heap of (priority, -seq, tx hash); stale entries skipped lazily
+        self._eviction: List[Tuple[float, int, str]] = []
+
+    def add(self, transaction: Dict) -> Optional[str]:
+        """Insert a transaction; returns its hash, or None if it was rejected"""
+        if isinstance(transaction, Transaction):
+            size = transaction.seal()
+            tx_hash = transaction.digest
+        else:
+            encoded = canonical_encode(transaction)
+            tx_hash, size = hashlib.sha256(encoded).hexdigest(), len(encoded)
+        priority = self.priority(transaction)
+        sender = signer_key(transaction) or transaction.get('sender', '')
+        nonce = transaction.get('nonce', 0)
+
+        with self._lock:
+            if tx_hash in self._txs:
+                return None
+            queue = self._queues.setdefault(sender, [])
+            slot = bisect.bisect_left(queue, (nonce, ''))
+            if slot < len(queue) and queue[slot][0] == nonce:
+                existing = queue[slot][1]
+                if self._meta[existing][0] >= priority:
+                    return None
+                self._remove(existing)
+                queue = self._queues.setdefault(sender, [])
+
+            if self._full(size) and not self._make_room(size, priority):
+                if not self._queues.get(sender):
+                    self._queues.pop(sender, None)
+                return None
+
+            # Eviction may have emptied and dropped this sender's queue
+            queue = self._queues.setdefault(sender, [])
+            bisect.insort(queue, (nonce, tx_hash))
+            self._txs[tx_hash] = transaction
+            self._meta[tx_hash] = (priority, size, sender, nonce)
+            self.total_bytes += size
+            heapq.heappush(self._eviction, (priority, -next(self._seq), tx_hash))
+            return tx_hash
+
+    def _full(self, incoming: int) -> bool:
+        return (
+            len(self._txs) + 1 > self.max_transactions
+            or self.total_bytes + incoming > self.max_bytes
+        )
+
+    def _make_room(self, incoming: int, priority: float) -> bool:
+        while self._full(incoming):
+            while self._eviction and self._eviction[0][2] not in self._txs:
+                heapq.heappop(self._eviction)
+            if not self._eviction or self._eviction[0][0] >= priority:
+                return False
+            self._remove(heapq.heappop(self._eviction)[2])
+        return True
+
+    def _remove(self, tx_hash: str) -> Optional[Dict]:
+        transaction = self._txs.pop(tx_hash, None)
+        if transaction is None:
+            return None
+        _, size, sender, nonce = self._meta.pop(tx_hash)
+        self.total_bytes -= size
+        queue = self._queues[sender]
+        queue.pop(bisect.bisect_left(queue, (nonce, tx_hash)))
+        if not queue:
+            del self._queues[sender]
+        if len(self._eviction) > 2 * len(self._txs) + 64:
+            self._eviction = [entry for entry in self._eviction if entry[2] in self._txs]
+            heapq.heapify(self._eviction)
+        return transaction
+
+    def remove(self, tx_hashes: Iterable[str]) -> int:
+        """Drop transactions, e.g. once validators finalized them"""
+        with self._lock:
+            return sum(self._remove(tx_hash) is not None for tx_hash in tx_hashes)
+
+    def select(self, k: int, max_bytes: Optional[int] = None) -> List[Tuple[str, Dict]]:
+        """
+        Top-k ready (tx hash, transaction) pairs, without removing them
+        A sender's lowest queued nonce is ready, whatever its value
+        Stops early once max_bytes of encoded transactions are selected
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            heads = [
+                (-self._meta[queue[0][1]][0], queue[0][0], sender, 0)
+                for sender, queue in self._queues.items()
+            ]
+            heapq.heapify(heads)
+            selected = []
+            while heads and len(selected) < k:
+                _, _, sender, position = heapq.heappop(heads)
+                queue = self._queues[sender]
+                tx_hash = queue[position][1]
+                size = self._meta[tx_hash][1]
+                if size > budget and selected:
+                    break
+                budget -= size
+                selected.append((tx_hash, self._txs[tx_hash]))
+                if position + 1 < len(queue):
+                    nonce, next_hash = queue[position + 1]
+                    heapq.heappush(heads, (-self._meta[next_hash][0], nonce, sender, position + 1))
+            return selected
+
+    def pop_ready(self, k: int, max_bytes: Optional[int] = None) -> List[Tuple[str, Dict]]:
+        with self._lock:
+            selected = self.select(k, max_bytes)
+            self.remove(tx_hash for tx_hash, _ in selected)
+            return selected
+
+    def sender_count(self, sender: str) -> int:
+        """Queued transactions of a sender key (signing key, or name if unsigned)"""
+        return len(self._queues.get(sender, ()))
+
+    def __contains__(self, tx_hash: str) -> bool:
+        return tx_hash in self._txs
+
+    def __len__(self) -> int:
+        return len(self._txs)
+
+    def __iter__(self) -> Iterator[Dict]:
+        with self._lock:
+            snapshot = list(self._txs.values())
+        return iter(snapshot)
@@ -0,0 +1,50 @@
+import hashlib
+from typing import List, Tuple
+
+# Proof step: (sibling hash, 'L' if the sibling is on the left else 'R')
+ProofStep = Tuple[str, str]
+
+EMPTY_ROOT = hashlib.sha256(b'').hexdigest()
+
+def _node(left: str, right: str) -> str:
+    # 0x01 prefix keeps interior nodes distinct from transaction hashes
+    return hashlib.sha256(b'\x01' + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+def _next_level(level: List[str]) -> List[str]:
+    # An unpaired last node is promoted unchanged rather than duplicated
+    paired = [_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        paired.append(level[-1])
+    return paired
+
+def merkle_root(leaves: List[str]) -> str:
+    """Root over a list of hex transaction hashes"""
+    if not leaves:
+        return EMPTY_ROOT
+    level = list(leaves)
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0]
+
+def merkle_proof(leaves: List[str], index: int) -> List[ProofStep]:
+    """Sibling path from leaves[index] up to the root, O(log n) steps"""
+    if not 0 <= index < len(leaves):
+        raise IndexError("Leaf index out of range")
+    proof = []
+    level = list(leaves)
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append((level[sibling], 'L' if sibling < index else 'R'))
+        level = _next_level(level)
+        index //= 2
+    return proof
+
+def verify_proof(leaf: str, proof: List[ProofStep], root: str) -> bool:
+    node = leaf
+    try:
+        for sibling, side in proof:
+            node = _node(sibling, node) if side == 'L' else _node(node, sibling)
+    except (ValueError, TypeError):
+        return False
+    return node == root
@@ -0,0 +1,131 @@
+import hashlib
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+from src.utils.crypto import canonical_encode, hash_data
+
+_MISSING = object()
+
+class _Record(MutableMapping):
+    """
+    Dict-compatible record with one slot per well-known field.
+
+    Unknown keys go to a small overflow dict, so any transaction or block
+    dict round-trips unchanged. The canonical encoding is the same one
+    hash_data uses for plain dicts, so a record and its to_dict() have
+    the same digest; the digest is computed once and cached until the
+    record is modified through item assignment. Nested values (such as
+    tx['data']) are not tracked and must not be mutated after hashing.
+    """
+    __slots__ = ('_extra', '_digest')
+    _FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self, fields: Optional[Dict[str, Any]] = None, **kwargs):
+        for name in self._FIELDS:
+            setattr(self, name, _MISSING)
+        self._extra: Optional[Dict[str, Any]] = None
+        # Raw sha256 digest; hex is produced on access to keep records small
+        self._digest: Optional[bytes] = None
+        for source in (fields or {}, kwargs):
+            for key, value in source.items():
+                self[key] = value
+
+    @classmethod
+    def from_dict(cls, fields: Dict[str, Any]):
+        return fields if isinstance(fields, cls) else cls(fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def _invalidate(self) -> None:
+        self._digest = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELDS:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        self._invalidate()
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._FIELDS and getattr(self, key) is not _MISSING:
+            setattr(self, key, _MISSING)
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+        self._invalidate()
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._FIELDS:
+            if getattr(self, name) is not _MISSING:
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        present = sum(getattr(self, name) is not _MISSING for name in self._FIELDS)
+        return present + (len(self._extra) if self._extra else 0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return type(self).from_dict, (self.to_dict(),)
+
+    def seal(self) -> int:
+        """Encode once and cache the digest; returns the encoded length"""
+        encoded = canonical_encode(self)
+        self._digest = hashlib.sha256(encoded).digest()
+        return len(encoded)
+
+    @property
+    def digest(self) -> str:
+        """hash_data() of the record, computed once"""
+        if self._digest is None:
+            self.seal()
+        return self._digest.hex()
+
+class Transaction(_Record):
+    """Signed transaction as produced by ChainSecAgent.sign_transaction"""
+    _FIELDS = (
+        'sender', 'receiver', 'data', 'public_key', 'sender_public_key',
+        'scheme', 'signature', 'timestamp', 'nonce', 'previous_hash', 'fee'
+    )
+    __slots__ = _FIELDS
+
+class Block(_Record):
+    """
+    Chain block; `transactions` holds Transaction records or dicts.
+    block_hash caches Blockchain.hash(block).
+    """
+    _FIELDS = ('index', 'timestamp', 'transactions', 'previous_hash', 'merkle_root')
+    __slots__ = _FIELDS + ('_hash',)
+
+    def __init__(self, fields: Optional[Dict[str, Any]] = None, **kwargs):
+        self._hash: Optional[str] = None
+        super().__init__(fields, **kwargs)
+
+    def _invalidate(self) -> None:
+        self._digest = None
+        self._hash = None
+
+    @property
+    def block_hash(self) -> str:
+        """Header hash once merkle_root is set, full hash before"""
+        if self._hash is None:
+            if self.merkle_root is _MISSING:
+                self._hash = self.digest
+            else:
+                self._hash = hash_data({key: self[key] for key in self if key != 'transactions'})
+        return self._hash
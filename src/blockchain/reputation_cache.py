@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from web3 import Web3
+from src.blockchain.smart_contracts import (
+    REPUTATION_UPDATED_TOPIC, SmartContract, decode_reputation_updated
+)
+
+class ReputationCache:
+    """
+    Per-address LRU cache for get_agent_reputation results.
+    Entries expire after `ttl` seconds and are invalidated as soon as a
+    ReputationUpdated event for the address is seen. Events are read
+    by following a block cursor over the contract logs, at most once
+    per `poll_interval`.
+    """
+
+    def __init__(
+        self,
+        contract: SmartContract,
+        ttl: float = 30.0,
+        max_entries: int = 10000,
+        poll_interval: float = 1.0,
+        start_block: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.contract = contract
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_block = (
+            start_block if start_block is not None
+            else contract.w3.eth.block_number + 1
+        )
+        self._last_poll = clock()
+
+    @staticmethod
+    def _key(address: str) -> str:
+        try:
+            return Web3.to_checksum_address(address)
+        except ValueError:
+            return address
+
+    def get(self, address: str, loader: Callable[[str], Dict]) -> Dict:
+        """Return the cached reputation or load it through `loader`"""
+        reputation = self.peek(address)
+        if reputation is None:
+            reputation = loader(address)
+            self.put(address, reputation)
+        return reputation
+
+    def peek(self, address: str) -> Optional[Dict]:
+        """Return the cached reputation, or None on a miss"""
+        key = self._key(address)
+        if self.clock() - self._last_poll >= self.poll_interval:
+            self.sync()
+
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def put(self, address: str, reputation: Dict) -> None:
+        key = self._key(address)
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, reputation)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, address: str) -> None:
+        with self._lock:
+            self._entries.pop(self._key(address), None)
+
+    def sync(self) -> int:
+        """
+        Consume ReputationUpdated logs since the cursor and drop the
+        affected entries. Returns the number of events processed.
+        """
+        self._last_poll = self.clock()
+        latest = self.contract.w3.eth.block_number
+        if latest < self._next_block:
+            return 0
+
+        logs = self.contract.w3.eth.get_logs({
+            'address': self.contract.contract.address,
+            'topics': [REPUTATION_UPDATED_TOPIC],
+            'fromBlock': self._next_block,
+            'toBlock': latest
+        })
+        with self._lock:
+            for log in logs:
+                agent, _ = decode_reputation_updated(log)
+                self._entries.pop(agent, None)
+            self._next_block = latest + 1
+        return len(logs)
+
+    def __len__(self) -> int:
+        return len(self._entries)
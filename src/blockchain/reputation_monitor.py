@@ -0,0 +1,107 @@
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional
+from src.blockchain.smart_contracts import (
+    REPUTATION_UPDATED_TOPIC, SmartContract, decode_reputation_updated
+)
+
+class ReputationMonitor:
+    """
+    Follows ReputationUpdated logs from a persisted block cursor and
+    keeps running aggregates per agent (latest/min score, update count).
+
+    When an agent's score drops below `threshold` (from at or above it,
+    or on first sight) `on_breach` is called with the newly breaching
+    agents, once per poll. The cursor and aggregates are written to
+    `state_path` after every processed range, so a restarted monitor
+    resumes where it stopped instead of re-reading history.
+    """
+
+    def __init__(
+        self,
+        contract: SmartContract,
+        on_breach: Callable[[List[str]], None],
+        threshold: int = 50,
+        state_path: Optional[str] = None,
+        start_block: int = 0,
+        confirmations: int = 0,
+        max_range: int = 5000
+    ):
+        self.contract = contract
+        self.on_breach = on_breach
+        self.threshold = threshold
+        self.state_path = state_path
+        self.confirmations = confirmations
+        self.max_range = max_range
+        self.next_block = start_block
+        self.agents: Dict[str, Dict] = {}
+        self._running = False
+        self._load_state()
+
+    def _load_state(self) -> None:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        with open(self.state_path) as f:
+            state = json.load(f)
+        self.next_block = state['next_block']
+        self.agents = state['agents']
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'next_block': self.next_block, 'agents': self.agents}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _apply(self, agent: str, score: int, block: int) -> bool:
+        """Fold one event into the aggregates; True if it crossed the threshold"""
+        stats = self.agents.get(agent)
+        was_ok = stats is None or stats['score'] >= self.threshold
+        if stats is None:
+            stats = self.agents[agent] = {'score': score, 'min_score': score, 'updates': 0}
+        stats['score'] = score
+        stats['min_score'] = min(stats['min_score'], score)
+        stats['updates'] += 1
+        stats['last_block'] = block
+        return was_ok and score < self.threshold
+
+    def poll(self) -> List[str]:
+        """Process all new confirmed events; returns agents that crossed the threshold"""
+        head = self.contract.w3.eth.block_number - self.confirmations
+        breached = []
+        while self.next_block <= head:
+            to_block = min(head, self.next_block + self.max_range - 1)
+            logs = self.contract.w3.eth.get_logs({
+                'address': self.contract.contract.address,
+                'topics': [REPUTATION_UPDATED_TOPIC],
+                'fromBlock': self.next_block,
+                'toBlock': to_block
+            })
+            range_breached = []
+            for log in logs:
+                agent, score = decode_reputation_updated(log)
+                if self._apply(agent, score, log['blockNumber']):
+                    range_breached.append(agent)
+                elif agent in range_breached and self.agents[agent]['score'] >= self.threshold:
+                    range_breached.remove(agent)
+            if range_breached:
+                self.on_breach(range_breached)
+                breached.extend(range_breached)
+            self.next_block = to_block + 1
+            self._save_state()
+        return breached
+
+    def run(self, poll_interval: float = 2.0) -> None:
+        """Poll until stop() is called"""
+        self._running = True
+        while self._running:
+            self.poll()
+            time.sleep(poll_interval)
+
+    def stop(self) -> None:
+        self._running = False
+
+    def below_threshold(self) -> List[str]:
+        return [agent for agent, stats in self.agents.items() if stats['score'] < self.threshold]
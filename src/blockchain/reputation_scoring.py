@@ -0,0 +1,203 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from src.blockchain.smart_contracts import REPUTATION_UPDATED_TOPIC
+
+WAD = 10 ** 18
+SCALE = 10 ** 16
+# Weights of calculateReputationScore: success rate, validation accuracy,
+# response time, peer score
+CONTRACT_WEIGHTS = (40, 30, 20, 10)
+# Columns are int64; rows with any value at or above this bound are scored
+# with Python integers so intermediate products can never overflow
+_SAFE_BOUND = 2 ** 31
+_SAFE_WEIGHT = 2 ** 8
+
+FIELDS = (
+    'total_tasks', 'successful_tasks', 'validation_accuracy',
+    'avg_response_time', 'peer_reviews', 'peer_score'
+)
+
+def contract_score(rep: Sequence[int], weights: Tuple[int, int, int, int] = CONTRACT_WEIGHTS) -> int:
+    """Reference integer implementation of AgentReputation.calculateReputationScore"""
+    total, successful, accuracy, response_time, _, peer_score = (int(v) for v in rep)
+    w_success, w_accuracy, w_time, w_peer = weights
+    return (
+        (successful * w_success * WAD) // (total if total > 0 else 1)
+        + (accuracy * w_accuracy) // 100
+        + ((WAD - response_time) * w_time) // WAD
+        + (peer_score * w_peer) // 5
+    ) // SCALE
+
+@dataclass
+class ReputationTable:
+    """
+    Column store of AgentReputation.reputations for many agents, in the
+    same field order as the contract struct.
+    """
+    agents: List[str]
+    total_tasks: np.ndarray
+    successful_tasks: np.ndarray
+    validation_accuracy: np.ndarray
+    avg_response_time: np.ndarray
+    peer_reviews: np.ndarray
+    peer_score: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Dict[str, Sequence[int]]) -> "ReputationTable":
+        """Build from {agent: reputations(agent) tuple}"""
+        agents = list(records)
+        matrix = np.array([list(records[a]) for a in agents], dtype=object).reshape(len(agents), 6)
+        return cls(agents, *(cls._column(matrix[:, i]) for i in range(6)))
+
+    @staticmethod
+    def _column(values) -> np.ndarray:
+        # Values beyond int64 stay exact as Python ints (object dtype)
+        try:
+            return np.asarray(values, dtype=np.int64)
+        except OverflowError:
+            return np.asarray(values, dtype=object)
+
+    @classmethod
+    def from_contract(cls, contract, agents: Iterable[str]) -> "ReputationTable":
+        """Bulk-load reputations(agent) storage for the given agents"""
+        functions = contract.contract.functions
+        return cls.from_records({
+            agent: functions.reputations(agent).call() for agent in agents
+        })
+
+    @classmethod
+    def from_events(cls, contract, from_block: int = 0,
+                    to_block: Optional[int] = None) -> "ReputationTable":
+        """
+        Rebuild every agent's reputation by replaying the transactions
+        behind ReputationUpdated events through the contract's update rule
+        """
+        return ReputationReplay(contract, from_block).advance(to_block)
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    def columns(self) -> List[np.ndarray]:
+        return [getattr(self, name) for name in FIELDS]
+
+    def scores(self, weights: Tuple[int, int, int, int] = CONTRACT_WEIGHTS) -> np.ndarray:
+        """
+        calculateReputationScore for every agent, bit-exact with the
+        contract for the default weights. Other integer weights give
+        what-if scores under the same fixed-point rules.
+        """
+        total, successful, accuracy, response_time, _, peer = self.columns()
+        columns = (total, successful, accuracy, response_time, peer)
+        result = np.zeros(len(self), dtype=np.int64)
+        safe = np.ones(len(self), dtype=bool)
+        if max(weights) >= _SAFE_WEIGHT:
+            safe[:] = False
+        for column in columns:
+            safe &= np.asarray(column < _SAFE_BOUND, dtype=bool)
+
+        if safe.any():
+            rows = np.flatnonzero(safe)
+            t, s, v, rt, p = (c[rows].astype(np.int64) for c in columns)
+            scores, ambiguous = _vector_score(t, s, v, rt, p, weights)
+            result[rows] = scores
+            safe[rows[ambiguous]] = False
+        for i in np.flatnonzero(~safe):
+            result[i] = contract_score([c[i] for c in self.columns()], weights)
+        return result
+
+    def below(self, threshold: int, weights: Tuple[int, int, int, int] = CONTRACT_WEIGHTS) -> List[str]:
+        """Agents whose score is strictly below threshold"""
+        return [self.agents[i] for i in np.flatnonzero(self.scores(weights) < threshold)]
+
+    def top_k(self, k: int, weights: Tuple[int, int, int, int] = CONTRACT_WEIGHTS) -> List[Tuple[str, int]]:
+        """Best k (agent, score) pairs, highest score first"""
+        scores = self.scores(weights)
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(self.agents[i], int(scores[i])) for i in best]
+
+class ReputationReplay:
+    """
+    ReputationTable.from_events kept up to date: each advance() replays
+    only the events after the last block it processed.
+    """
+
+    def __init__(self, contract, from_block: int = 0):
+        self.contract = contract
+        self.next_block = from_block
+        self.records: Dict[str, List[int]] = {}
+
+    def advance(self, to_block: Optional[int] = None) -> ReputationTable:
+        w3 = self.contract.w3
+        to_block = to_block if to_block is not None else w3.eth.block_number
+        if to_block >= self.next_block:
+            logs = w3.eth.get_logs({
+                'address': self.contract.contract.address,
+                'topics': [REPUTATION_UPDATED_TOPIC],
+                'fromBlock': self.next_block,
+                'toBlock': to_block
+            })
+            seen = set()
+            for log in logs:
+                tx_hash = bytes(log['transactionHash'])
+                if tx_hash in seen:
+                    continue  # a batch emits one event per agent
+                seen.add(tx_hash)
+                self._replay(w3.eth.get_transaction(tx_hash)['input'])
+            self.next_block = to_block + 1
+        return ReputationTable.from_records(self.records)
+
+    def _replay(self, tx_input) -> None:
+        call, args = self.contract.contract.decode_function_input(tx_input)
+        if call.fn_name == 'updateReputationBatch':
+            updates = zip(*args.values())
+        else:
+            updates = [tuple(args.values())]
+        for agent, success, response_time, validation_score, peer_rating in updates:
+            apply_update(self.records.setdefault(agent, [0] * 6),
+                         success, response_time, validation_score, peer_rating)
+
+def _vector_score(t, s, v, rt, p, weights) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    int64 evaluation of the contract formula for values < 2**31.
+
+    The success term successful * w * 1e18 / total does not fit in 64
+    bits, so it is split as q * 1e18 + r * 1e18 / total with
+    q, r = divmod(successful * w, total), and the remainder is split
+    again around the final / 1e16. What is left is a single carry bit,
+    carry_r * total >= 1e16 * (total - r2), which is decided in float64;
+    rows too close to call are flagged for the exact integer path.
+    """
+    w_success, w_accuracy, w_time, w_peer = weights
+    t = np.where(t > 0, t, 1)
+    q, r = np.divmod(s * w_success, t)
+    q2, r2 = np.divmod(r * (WAD // SCALE), t)
+    # ((1e18 - rt) * w) / 1e18 == w - ceil(rt * w / 1e18)
+    small = (
+        (v * w_accuracy) // 100
+        + (w_time - (rt * w_time + WAD - 1) // WAD)
+        + (p * w_peer) // 5
+    )
+    carry_q, carry_r = np.divmod(small, SCALE)
+    lhs = carry_r.astype(np.float64) * t
+    rhs = float(SCALE) * (t - r2)
+    carry = lhs >= rhs
+    ambiguous = np.abs(lhs - rhs) <= rhs * 1e-9
+    score = q * (WAD // SCALE) + q2 + carry_q + carry.astype(np.int64)
+    return score, ambiguous
+
+def apply_update(rep: List[int], task_success: bool, response_time: int,
+                 validation_score: int, peer_rating: int) -> None:
+    """In-place mirror of AgentReputation._updateReputation"""
+    rep[0] += 1
+    if task_success:
+        rep[1] += 1
+    rep[2] = (rep[2] + validation_score) // 2
+    rep[3] = (rep[3] + response_time) // 2
+    if peer_rating > 0:
+        rep[4] += 1
+        rep[5] = (rep[5] * (rep[4] - 1) + peer_rating) // rep[4]
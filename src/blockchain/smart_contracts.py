@@ -1,8 +1,18 @@
-from web3 import Web3
+import hashlib
+import json
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from src.utils.config import WEB3_POOL_SIZE, WEB3_PROVIDER_URI, WEB3_REQUEST_TIMEOUT
+
+# web3 takes most of a validator's startup time and memory, so it is
+# imported on first use; everything here type-checks against it
+if TYPE_CHECKING:
+    from web3 import Web3
 
 class SmartContract:
-    def __init__(self, contract_address: str, abi: dict):
-        self.w3 = Web3(Web3.HTTPProvider('http://localhost:8545'))
+    def __init__(self, contract_address: str, abi: dict,
+                 w3: Optional["Web3"] = None):
+        self.w3 = w3 or ContractRegistry.default().web3()
         self.contract = self.w3.eth.contract(
             address=contract_address,
             abi=abi
@@ -21,4 +31,217 @@ class SmartContract:
             tx_data['receiver'],
             tx_data['data']
         ).transact()
-        return self.w3.eth.wait_for_transaction_receipt(tx_hash)
\ No newline at end of file
+        return self.w3.eth.wait_for_transaction_receipt(tx_hash)
+
+class ContractRegistry:
+    """
+    Process-wide cache of Web3 connections and contract clients.
+    Each provider URI gets one Web3 instance backed by a keep-alive
+    HTTP session pool; contract clients are keyed by
+    (provider URI, address, ABI hash) and built once.
+    """
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, pool_size: int = WEB3_POOL_SIZE,
+                 timeout: int = WEB3_REQUEST_TIMEOUT):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._lock = threading.RLock()
+        self._web3: Dict[str, "Web3"] = {}
+        self._contracts: Dict[Tuple[str, str, str], SmartContract] = {}
+
+    @classmethod
+    def default(cls) -> "ContractRegistry":
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def abi_hash(abi) -> str:
+        return hashlib.sha256(
+            json.dumps(abi, sort_keys=True, separators=(',', ':')).encode()
+        ).hexdigest()
+
+    def web3(self, provider_uri: Optional[str] = None) -> "Web3":
+        """Return the shared Web3 instance for an endpoint"""
+        uri = provider_uri or WEB3_PROVIDER_URI
+        w3 = self._web3.get(uri)
+        if w3 is None:
+            with self._lock:
+                w3 = self._web3.get(uri)
+                if w3 is None:
+                    from web3 import Web3
+
+                    w3 = self._web3[uri] = Web3(self._create_provider(uri))
+        return w3
+
+    def register_web3(self, provider_uri: str, w3: "Web3") -> None:
+        """Bind a pre-built Web3 (e.g. an in-process test backend) to a URI"""
+        with self._lock:
+            self._web3[provider_uri] = w3
+            self._contracts = {
+                key: client for key, client in self._contracts.items()
+                if key[0] != provider_uri
+            }
+
+    def _create_provider(self, uri: str):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from web3 import Web3
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return Web3.HTTPProvider(
+            uri,
+            request_kwargs={'timeout': self.timeout},
+            session=session
+        )
+
+    def contract(self, contract_address: str, abi,
+                 provider_uri: Optional[str] = None) -> SmartContract:
+        """Return the cached contract client, creating it on first use"""
+        uri = provider_uri or WEB3_PROVIDER_URI
+        key = (uri, contract_address, self.abi_hash(abi))
+        client = self._contracts.get(key)
+        if client is None:
+            with self._lock:
+                client = self._contracts.get(key)
+                if client is None:
+                    client = self._contracts[key] = SmartContract(
+                        contract_address, abi, w3=self.web3(uri)
+                    )
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._contracts.clear()
+            self._web3.clear()
+
+def get_contract(contract_address: str, abi,
+                 provider_uri: Optional[str] = None) -> SmartContract:
+    """Shorthand for ContractRegistry.default().contract(...)"""
+    return ContractRegistry.default().contract(contract_address, abi, provider_uri)
+
+def _uint(name: str) -> dict:
+    return {"name": name, "type": "uint256"}
+
+AGENT_REPUTATION_ABI = [
+    {
+        "type": "function",
+        "name": "updateReputation",
+        "inputs": [
+            {"name": "agent", "type": "address"},
+            {"name": "taskSuccess", "type": "bool"},
+            _uint("responseTime"),
+            _uint("validationScore"),
+            _uint("peerRating")
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "function",
+        "name": "updateReputationBatch",
+        "inputs": [
+            {"name": "agents", "type": "address[]"},
+            {"name": "taskSuccess", "type": "bool[]"},
+            {"name": "responseTimes", "type": "uint256[]"},
+            {"name": "validationScores", "type": "uint256[]"},
+            {"name": "peerRatings", "type": "uint256[]"}
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "function",
+        "name": "calculateReputationScore",
+        "inputs": [{"name": "agent", "type": "address"}],
+        "outputs": [_uint("")],
+        "stateMutability": "view"
+    },
+    {
+        "type": "function",
+        "name": "reputations",
+        "inputs": [{"name": "", "type": "address"}],
+        "outputs": [
+            _uint("totalTasks"),
+            _uint("successfulTasks"),
+            _uint("validationAccuracy"),
+            _uint("averageResponseTime"),
+            _uint("peerReviewsCount"),
+            _uint("peerReviewScore")
+        ],
+        "stateMutability": "view"
+    },
+    {
+        "type": "function",
+        "name": "getReputationsBatch",
+        "inputs": [{"name": "agents", "type": "address[]"}],
+        "outputs": [
+            {"name": "scores", "type": "uint256[]"},
+            {
+                "name": "reps",
+                "type": "tuple[]",
+                "components": [
+                    _uint("totalTasks"),
+                    _uint("successfulTasks"),
+                    _uint("validationAccuracy"),
+                    _uint("averageResponseTime"),
+                    _uint("peerReviewsCount"),
+                    _uint("peerReviewScore")
+                ]
+            }
+        ],
+        "stateMutability": "view"
+    },
+    {
+        "type": "function",
+        "name": "validators",
+        "inputs": [{"name": "", "type": "address"}],
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "view"
+    },
+    {
+        "type": "function",
+        "name": "addValidator",
+        "inputs": [{"name": "validator", "type": "address"}],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "event",
+        "name": "ReputationUpdated",
+        "anonymous": False,
+        "inputs": [
+            {"name": "agent", "type": "address", "indexed": True},
+            {"name": "newScore", "type": "uint256", "indexed": False}
+        ]
+    }
+]
+
+# keccak256("ReputationUpdated(address,uint256)"), precomputed so importing
+# this module does not load web3
+REPUTATION_UPDATED_TOPIC = "0xfc577563f1b9a0461e24abef1e1fcc0d33d3d881f20b5df6dda59de4aae2c821"
+
+def decode_reputation_updated(log) -> Tuple[str, int]:
+    """(agent, newScore) from a raw ReputationUpdated log"""
+    from web3 import Web3
+
+    agent = Web3.to_checksum_address(bytes(log['topics'][1])[-20:])
+    return agent, int.from_bytes(bytes(log['data'])[:32], 'big')
+
+def is_agent_address(value) -> bool:
+    """Whether value can be passed to the contracts as an address (checksummed)"""
+    if not isinstance(value, str) or len(value) != 42:
+        return False
+    from web3 import Web3
+
+    return Web3.is_checksum_address(value)
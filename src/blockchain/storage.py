@@ -0,0 +1,237 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.utils.crypto import hash_data, json_default
+
+# Index entry per block height: segment number, record offset, record length
+INDEX_ENTRY = struct.Struct('<IQI')
+# Record header: payload length, crc32 of payload
+RECORD_HEADER = struct.Struct('<II')
+# Transaction index entry: sha256 tx hash, block height, position in block
+TX_INDEX_ENTRY = struct.Struct('<32sII')
+
+RAW, DEFLATE = b'\x00', b'\x01'
+
+def encode_block(block: Dict) -> bytes:
+    """Compact JSON, deflated when that makes it smaller"""
+    raw = json.dumps(block, separators=(',', ':'), default=json_default).encode()
+    if len(raw) > 256:
+        packed = zlib.compress(raw, 1)
+        if len(packed) < len(raw):
+            return DEFLATE + packed
+    return RAW + raw
+
+def decode_block(payload: bytes) -> Dict:
+    body = payload[1:]
+    if payload[:1] == DEFLATE:
+        body = zlib.decompress(body)
+    return json.loads(body)
+
+class ChainStore:
+    """
+    Append-only block store used as Blockchain.chain.
+
+    Blocks are written to numbered segment files and located through a
+    fixed-width offset index (index.dat), so opening a store only reads
+    the index tail. Segments are read through mmap and decoded on
+    access; a small LRU keeps recently used blocks such as the tip.
+    Supports len(), iteration, integer/negative indexing, slicing and
+    append(), which is all the agents rely on from a list.
+
+    Transaction hashes are appended to txindex.dat with each block, so
+    a reopened store can locate transactions without decoding blocks.
+    """
+
+    def __init__(self, path: str, segment_size: int = 64 * 1024 * 1024,
+                 cache_size: int = 256, sync: bool = False):
+        self.path = path
+        self.segment_size = segment_size
+        self.cache_size = cache_size
+        self.sync = sync
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[int, Dict]" = OrderedDict()
+        self._maps: Dict[int, mmap.mmap] = {}
+        os.makedirs(path, exist_ok=True)
+        self._index = open(os.path.join(path, 'index.dat'), 'a+b')
+        tx_index_path = os.path.join(path, 'txindex.dat')
+        tx_index_missing = not os.path.exists(tx_index_path)
+        self._tx_index = open(tx_index_path, 'a+b')
+        self._count = 0
+        self._segment = 0
+        self._segment_end = 0
+        self._writer = None
+        self._recover()
+        if tx_index_missing and self._count:
+            self._rebuild_tx_index()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.path, f'segment-{segment:05d}.dat')
+
+    def _entry(self, height: int):
+        raw = os.pread(self._index.fileno(), INDEX_ENTRY.size, height * INDEX_ENTRY.size)
+        return INDEX_ENTRY.unpack(raw)
+
+    def _recover(self) -> None:
+        """Drop a torn index tail and unindexed records (and segments) after a crash"""
+        index_size = os.fstat(self._index.fileno()).st_size
+        count = index_size // INDEX_ENTRY.size
+        while count:
+            segment, offset, length = self._entry(count - 1)
+            path = self._segment_path(segment)
+            if os.path.exists(path) and os.path.getsize(path) >= offset + length:
+                break
+            count -= 1
+        if count * INDEX_ENTRY.size != index_size:
+            self._index.truncate(count * INDEX_ENTRY.size)
+
+        self._count = count
+        if count:
+            segment, offset, length = self._entry(count - 1)
+            self._segment, self._segment_end = segment, offset + length
+        self._writer = open(self._segment_path(self._segment), 'a+b')
+        if os.fstat(self._writer.fileno()).st_size != self._segment_end:
+            self._writer.truncate(self._segment_end)
+        # Segments after the last indexed one only hold unindexed records
+        for name in os.listdir(self.path):
+            if (name.startswith('segment-') and name.endswith('.dat')
+                    and int(name[8:-4]) > self._segment):
+                os.remove(os.path.join(self.path, name))
+        self._recover_tx_index()
+
+    def _recover_tx_index(self) -> None:
+        """Drop entries of blocks that never made it into index.dat"""
+        fd = self._tx_index.fileno()
+        size = os.fstat(fd).st_size
+        end = size - size % TX_INDEX_ENTRY.size
+        # Entries are in height order, so only the tail can be ahead
+        while end:
+            _, height, _ = TX_INDEX_ENTRY.unpack(
+                os.pread(fd, TX_INDEX_ENTRY.size, end - TX_INDEX_ENTRY.size)
+            )
+            if height < self._count:
+                break
+            end -= TX_INDEX_ENTRY.size
+        if end != size:
+            self._tx_index.truncate(end)
+
+    def _rebuild_tx_index(self) -> None:
+        """One-off replay for stores written before txindex.dat existed"""
+        for height in range(self._count):
+            block = self._read(height)
+            self._write_tx_index(height, [hash_data(tx) for tx in block.get('transactions', [])])
+        self._tx_index.flush()
+
+    def _write_tx_index(self, height: int, leaves: List[str]) -> None:
+        self._tx_index.write(b''.join(
+            TX_INDEX_ENTRY.pack(bytes.fromhex(tx_hash), height, position)
+            for position, tx_hash in enumerate(leaves)
+        ))
+
+    def load_tx_index(self) -> Dict[str, Tuple[int, int]]:
+        """tx hash -> (block height, position), as kept by Blockchain.tx_index"""
+        with self._lock:
+            self._tx_index.flush()
+            with open(self._tx_index.name, 'rb') as f:
+                raw = f.read()
+        raw = raw[:len(raw) - len(raw) % TX_INDEX_ENTRY.size]
+        return {
+            tx_hash.hex(): (height, position)
+            for tx_hash, height, position in TX_INDEX_ENTRY.iter_unpack(raw)
+        }
+
+    def append(self, block: Dict, leaves: Optional[List[str]] = None) -> None:
+        """leaves: precomputed transaction hashes, in block order"""
+        if leaves is None:
+            leaves = [hash_data(tx) for tx in block.get('transactions', [])]
+        payload = encode_block(block)
+        record = RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if self._segment_end and self._segment_end + len(record) > self.segment_size:
+                self._writer.close()
+                self._segment += 1
+                self._segment_end = 0
+                # Truncating: the index is the only record of what a segment holds
+                self._writer = open(self._segment_path(self._segment), 'w+b')
+
+            offset = self._segment_end
+            self._writer.write(record)
+            self._writer.flush()
+            if self.sync:
+                os.fsync(self._writer.fileno())
+            # Transaction entries go before the block's index entry, so an
+            # indexed block always has them (extra ones are dropped on open)
+            self._write_tx_index(self._count, leaves)
+            self._tx_index.flush()
+            if self.sync:
+                os.fsync(self._tx_index.fileno())
+            # Index entry is written last so a crash never indexes a torn record
+            self._index.write(INDEX_ENTRY.pack(self._segment, offset, len(record)))
+            self._index.flush()
+            if self.sync:
+                os.fsync(self._index.fileno())
+
+            self._segment_end += len(record)
+            self._count += 1
+            self._remember(self._count - 1, block)
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            with open(self._segment_path(segment), 'rb') as f:
+                mapped = self._maps[segment] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return mapped
+
+    def _remember(self, height: int, block: Dict) -> None:
+        self._cache[height] = block
+        self._cache.move_to_end(height)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _read(self, height: int) -> Dict:
+        with self._lock:
+            block = self._cache.get(height)
+            if block is not None:
+                self._cache.move_to_end(height)
+                return block
+            segment, offset, length = self._entry(height)
+            mapped = self._map(segment, offset + length)
+            size, crc = RECORD_HEADER.unpack_from(mapped, offset)
+            start = offset + RECORD_HEADER.size
+            payload = mapped[start:start + size]
+            if zlib.crc32(payload) != crc:
+                raise ValueError(f"Corrupt block record at height {height}")
+            block = decode_block(payload)
+            self._remember(height, block)
+            return block
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._read(i) for i in range(*item.indices(self._count))]
+        if item < 0:
+            item += self._count
+        if not 0 <= item < self._count:
+            raise IndexError("chain index out of range")
+        return self._read(item)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for height in range(self._count):
+            yield self._read(height)
+
+    def close(self) -> None:
+        with self._lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+            self._writer.close()
+            self._index.close()
+            self._tx_index.close()
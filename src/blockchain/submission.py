@@ -0,0 +1,188 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+from web3.exceptions import TransactionNotFound
+from src.blockchain.smart_contracts import SmartContract
+
+logger = logging.getLogger(__name__)
+
+class ReputationSubmitter:
+    """
+    Asynchronous pipeline for AgentReputation updates.
+
+    submit() queues an update and returns a Future for its receipt. A
+    background thread packs queued updates into updateReputationBatch
+    transactions (flushing on `batch_size` or `max_delay`), assigns
+    nonces locally so many transactions can be in flight at once, and
+    resolves every pending hash from a single receipt polling loop.
+    A failing send fails only that batch's futures. A failing receipt
+    lookup keeps the hash in flight, since the transaction may still be
+    mined, and fails its futures only after `max_receipt_errors`
+    consecutive errors. The worker thread keeps running either way.
+    """
+
+    def __init__(
+        self,
+        contract: SmartContract,
+        account: Optional[str] = None,
+        batch_size: int = 50,
+        max_delay: float = 0.05,
+        poll_interval: float = 0.5,
+        max_receipt_errors: int = 10,
+        on_confirmed=None
+    ):
+        self.contract = contract
+        self.w3 = contract.w3
+        self.account = account or self.w3.eth.default_account or self.w3.eth.accounts[0]
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.max_receipt_errors = max_receipt_errors
+        # Called with the list of agent addresses of each confirmed batch
+        self.on_confirmed = on_confirmed
+        self._queue: List[Tuple[tuple, Future]] = []
+        self._queued_at = 0.0
+        self._in_flight: Dict[bytes, Tuple[List[tuple], List[Future]]] = {}
+        # Consecutive receipt lookup errors per in-flight hash
+        self._receipt_errors: Dict[bytes, int] = {}
+        self._nonce: Optional[int] = None
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="reputation-submitter", daemon=True)
+        self._thread.start()
+
+    def submit(self, agent_address: str, task_success: bool, response_time: int,
+               validation_score: int, peer_rating: int = 0) -> Future:
+        """Queue a reputation update; the Future resolves to its receipt"""
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ReputationSubmitter is closed")
+            if not self._queue:
+                self._queued_at = time.monotonic()
+            self._queue.append((
+                (agent_address, task_success, response_time, validation_score, peer_rating),
+                future
+            ))
+            if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                self._cond.notify()
+        return future
+
+    def flush(self) -> None:
+        """Send queued updates without waiting for the batch to fill"""
+        with self._cond:
+            self._queued_at = 0.0
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._queue) + sum(len(f) for _, f in self._in_flight.values())
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush, wait for all receipts and stop the worker thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _next_nonce(self) -> int:
+        if self._nonce is None:
+            self._nonce = self.w3.eth.get_transaction_count(self.account, 'pending')
+        nonce = self._nonce
+        self._nonce += 1
+        return nonce
+
+    def _run(self) -> None:
+        last_poll = 0.0
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    flush_due = self._queue and (
+                        self._closed or len(self._queue) >= self.batch_size
+                        or now - self._queued_at >= self.max_delay
+                    )
+                    poll_due = self._in_flight and now - last_poll >= self.poll_interval
+                    if flush_due or poll_due:
+                        break
+                    if self._closed and not self._in_flight:
+                        return
+                    timeouts = []
+                    if self._queue:
+                        timeouts.append(self._queued_at + self.max_delay - now)
+                    if self._in_flight:
+                        timeouts.append(last_poll + self.poll_interval - now)
+                    self._cond.wait(max(min(timeouts), 0) if timeouts else None)
+                batches = []
+                while flush_due and self._queue:
+                    batches.append(self._queue[:self.batch_size])
+                    del self._queue[:self.batch_size]
+
+            for batch in batches:
+                self._send(batch)
+            if self._in_flight and time.monotonic() - last_poll >= self.poll_interval:
+                last_poll = time.monotonic()
+                self._poll_receipts()
+
+    def _send(self, batch: List[Tuple[tuple, Future]]) -> None:
+        updates = [update for update, _ in batch]
+        futures = [future for _, future in batch]
+        functions = self.contract.contract.functions
+        try:
+            if len(updates) == 1:
+                call = functions.updateReputation(*updates[0])
+            else:
+                call = functions.updateReputationBatch(*[list(column) for column in zip(*updates)])
+            tx_hash = call.transact({'from': self.account, 'nonce': self._next_nonce()})
+        except Exception as exc:
+            # Nonce may not have been consumed; resync on the next send
+            self._nonce = None
+            for future in futures:
+                future.set_exception(exc)
+            return
+        with self._cond:
+            self._in_flight[bytes(tx_hash)] = (updates, futures)
+
+    def _poll_receipts(self) -> None:
+        with self._cond:
+            pending = list(self._in_flight.items())
+
+        for tx_hash, (updates, futures) in pending:
+            try:
+                receipt = self.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                self._receipt_errors.pop(tx_hash, None)
+                continue
+            except Exception as exc:
+                errors = self._receipt_errors.get(tx_hash, 0) + 1
+                if errors < self.max_receipt_errors:
+                    # Transient RPC error; the transaction may still be mined
+                    self._receipt_errors[tx_hash] = errors
+                    logger.warning("Receipt lookup for %s failed (%d/%d): %s",
+                                   tx_hash.hex(), errors, self.max_receipt_errors, exc)
+                    continue
+                self._receipt_errors.pop(tx_hash, None)
+                with self._cond:
+                    del self._in_flight[tx_hash]
+                for future in futures:
+                    future.set_exception(exc)
+                continue
+            self._receipt_errors.pop(tx_hash, None)
+            if receipt is None:
+                continue
+            with self._cond:
+                del self._in_flight[tx_hash]
+            if receipt['status'] != 1:
+                for future in futures:
+                    future.set_exception(ValueError(f"Reputation update reverted: {tx_hash.hex()}"))
+                continue
+            if self.on_confirmed is not None:
+                try:
+                    self.on_confirmed([update[0] for update in updates])
+                except Exception:
+                    # The update is on-chain either way
+                    logger.exception("Reputation on_confirmed callback failed")
+            for future in futures:
+                future.set_result(receipt)
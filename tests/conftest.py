@@ -0,0 +1,16 @@
+import pytest
+
+@pytest.fixture
+def reputation_chain():
+    """AgentReputation deployed on an in-process EVM, wired into a Blockchain"""
+    evm = pytest.importorskip('benchmarks.evm')
+    from src.blockchain.core import Blockchain
+    from src.blockchain.smart_contracts import ContractRegistry
+
+    try:
+        w3, contract = evm.deploy_reputation_contract()
+    except ImportError as exc:
+        pytest.skip(str(exc))
+    ContractRegistry.default().register_web3('tester', w3)
+    blockchain = Blockchain(contract.address, provider_uri='tester')
+    return blockchain, contract
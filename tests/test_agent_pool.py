@@ -0,0 +1,123 @@
+import asyncio
+import time
+from src.agents.base_agent import ChainSecAgent
+from src.agents.batch_validation import validate_local
+from src.agents.runtime import AgentPool, FakeLLM
+from src.blockchain.core import Blockchain
+from src.utils import metrics
+from src.utils.crypto import hash_data
+from src.utils.signatures import get_backend
+
+class _Agent:
+    """arun_task / alog_transaction / aexecute as provided by ChainSecAgent"""
+
+    def __init__(self, name, blockchain, llm):
+        self.name = name
+        self.blockchain = blockchain
+        self.llm = llm
+        self.in_flight = self.peak = self.nonce = 0
+
+    async def arun_task(self, task):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            return await self.llm.ainvoke(task)
+        finally:
+            self.in_flight -= 1
+
+    async def alog_transaction(self, receiver, data):
+        self.nonce += 1
+        tx = {'sender': self.name, 'receiver': receiver, 'data': data, 'nonce': self.nonce}
+        await asyncio.to_thread(self.blockchain.add_transaction, **tx)
+        return hash_data(tx)
+
+    async def aexecute(self, task, llm_done=None):
+        result = await self.arun_task(task)
+        if llm_done is not None:
+            await llm_done(result)
+        return {'result': result, 'tx_hash': await self.alog_transaction("Network", {'task': task})}
+
+class _FakeLLMAgent(ChainSecAgent):
+    """ChainSecAgent whose executor is the FakeLLM itself (run / arun)"""
+
+    def _create_agent_executor(self):
+        return self.llm
+
+    def _create_output_parser(self):
+        return None
+
+def test_pool_runs_tasks_concurrently_within_limits():
+    blockchain = Blockchain()
+    llm = FakeLLM(delay=0.05)
+    agents = [_Agent(f"agent-{i}", blockchain, llm) for i in range(2)]
+    pool = AgentPool(agents, per_agent=3)
+
+    start = time.perf_counter()
+    results = pool.run_sync([f"task-{i}" for i in range(12)])
+    elapsed = time.perf_counter() - start
+
+    # 12 tasks over 2 x 3 slots: two LLM rounds instead of twelve
+    assert elapsed < 12 * 0.05 / 2
+    assert [r.task for r in results] == [f"task-{i}" for i in range(12)]
+    assert all(r.ok and r.tx_hash and r.llm >= 0.05 for r in results)
+    assert max(agent.peak for agent in agents) == 3
+    assert len(blockchain.pending_transactions) == 12 and llm.calls == 12
+
+    summary = AgentPool.summarize(results)
+    assert summary['tasks'] == 12 and summary['failed'] == 0
+    assert summary['p50'] <= summary['p95'] <= summary['max']
+
+def test_failed_task_is_reported():
+    class Broken(_Agent):
+        async def arun_task(self, task):
+            raise RuntimeError("model unavailable")
+
+    pool = AgentPool([Broken("broken", Blockchain(), FakeLLM(delay=0))], per_agent=1)
+    results = pool.run_sync(["a", "b"])
+    assert [r.error for r in results] == ["RuntimeError: model unavailable"] * 2
+
+def _make_agents(blockchain, llm, count):
+    return [
+        _FakeLLMAgent(f"agent-{i}", "test", [], blockchain, llm,
+                      private_key=get_backend('rsa').generate_private_key(), scheme='rsa')
+        for i in range(count)
+    ]
+
+def test_pool_uses_result_cache_and_execute_timer():
+    blockchain = Blockchain()
+    blockchain.add_block({'index': 0, 'timestamp': 0.0, 'transactions': [], 'previous_hash': ''})
+    llm = FakeLLM(delay=0.01)
+    agent, = _make_agents(blockchain, llm, 1)
+    agent.enable_result_cache()
+    pool = AgentPool([agent], per_agent=2)
+
+    sink = metrics.InMemorySink()
+    previous = metrics.set_sink(sink)
+    try:
+        first = pool.run_sync(["a", "b"])
+        second = pool.run_sync(["a", "b"])
+    finally:
+        metrics.set_sink(previous)
+
+    assert llm.calls == 2
+    assert [r.cached_from for r in second] == [r.tx_hash for r in first]
+    assert all(r.ok and r.result == llm.response for r in first + second)
+    assert sink.snapshot()['agent.execute']['count'] == 4
+    assert len(blockchain.pending_transactions) == 4
+
+def test_pool_with_chain_sec_agents_signs_every_result():
+    blockchain = Blockchain()
+    blockchain.add_block({'index': 0, 'timestamp': 0.0, 'transactions': [], 'previous_hash': ''})
+    llm = FakeLLM(delay=0.01)
+    agents = _make_agents(blockchain, llm, 2)
+    results = AgentPool(agents, per_agent=4).run_sync([f"task-{i}" for i in range(16)])
+    assert all(r.ok and r.result == llm.response for r in results)
+
+    pending = list(blockchain.pending_transactions)
+    assert len(pending) == 16 and llm.calls == 16
+    assert {hash_data(tx) for tx in pending} == {r.tx_hash for r in results}
+    for agent in agents:
+        nonces = [tx['nonce'] for tx in pending if tx['sender'] == agent.name]
+        # Concurrent signing within one millisecond must not reuse a nonce
+        assert len(nonces) == len(set(nonces)) == 8
+    assert all(validate_local(tx)['valid'] for tx in pending)
@@ -0,0 +1,32 @@
+from Crypto.PublicKey import RSA
+from src.agents.batch_validation import BatchValidationEngine, validate_local
+from src.utils.crypto import sign_data
+
+def test_batch_reports_match_serial_order():
+    key = RSA.generate(2048)
+    private_pem = key.export_key().decode()
+    public_pem = key.publickey().export_key().decode()
+
+    transactions = []
+    for i in range(40):
+        data = {'value': i}
+        transactions.append({
+            'sender': 'agent',
+            'receiver': 'Network',
+            'data': data,
+            'timestamp': i,
+            'sender_public_key': public_pem,
+            'signature': sign_data(private_pem, {'receiver': 'Network', 'data': data})
+        })
+    transactions[7]['data'] = {'value': -1}  # tampered
+    del transactions[21]['receiver']
+
+    engine = BatchValidationEngine(workers=2, chunk_size=8)
+    try:
+        reports = engine.validate(transactions)
+    finally:
+        engine.close()
+
+    assert reports == [validate_local(tx) for tx in transactions]
+    assert [i for i, r in enumerate(reports) if not r['valid']] == [7, 21]
+    assert reports[7]['errors'] == ["Crypto error: Invalid cryptographic signature"]
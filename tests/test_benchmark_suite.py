@@ -0,0 +1,31 @@
+import pytest
+
+from benchmarks.suite import compare, run_benchmark
+
+def _run(params, **metrics):
+    return {'results': {'execute': {'params': params, 'metrics': metrics}}}
+
+def test_compare_only_checks_metrics_of_matching_runs():
+    params = {'tasks': 200, 'llm_delay_ms': 5.0}
+    baseline = _run(params, execute_p50_ms=10.0, pool_tasks_per_s=100.0, cold_start_speedup=4.0)
+
+    current = _run(params, execute_p50_ms=10.5, pool_tasks_per_s=50.0, cold_start_speedup=2.0)
+    assert sorted(r['metric'] for r in compare(current, baseline)) == [
+        'cold_start_speedup', 'pool_tasks_per_s'
+    ]
+
+    # A slower fake LLM is a different input, not a regression
+    slower = _run(dict(params, llm_delay_ms=50.0), execute_p50_ms=55.0, pool_tasks_per_s=10.0,
+                  cold_start_speedup=4.0)
+    assert compare(slower, baseline) == []
+
+def test_missing_solc_skips_instead_of_downloading(monkeypatch):
+    solcx = pytest.importorskip('solcx')
+    evm = pytest.importorskip('benchmarks.evm')
+    monkeypatch.setattr(solcx, 'get_installed_solc_versions', lambda: [])
+    monkeypatch.setattr(solcx, 'import_installed_solc', lambda: [])
+    monkeypatch.setattr(solcx, 'install_solc', lambda *a, **k: pytest.fail('solc download'))
+
+    with pytest.raises(evm.SolcUnavailable):
+        evm.compile_reputation_contract()
+    assert 'SolcUnavailable' in run_benchmark('reputation', quick=True)['skipped']
@@ -0,0 +1,26 @@
+from src.blockchain.core import Blockchain
+from src.blockchain.merkle import merkle_root
+from src.utils.crypto import hash_data
+
+def test_seals_on_count_and_latency():
+    blockchain = Blockchain()
+    builder = blockchain.start_block_builder(max_transactions=10, max_latency=0.2)
+    sealed = []
+    builder.subscribe(sealed.append)
+    try:
+        for i in range(10):
+            blockchain.add_transaction(sender='a', nonce=i, data={'n': i})
+        first = builder.wait_for_block(0, timeout=5)
+        assert len(first['transactions']) == 10
+
+        blockchain.add_transaction(sender='b', nonce=0, data={})
+        second = builder.wait_for_block(1, timeout=5)
+        assert len(second['transactions']) == 1
+        assert second['previous_hash'] == blockchain.hash(first)
+    finally:
+        builder.stop()
+
+    assert [block['index'] for block in sealed] == [0, 1]
+    assert len(blockchain.pending_transactions) == 0
+    assert first['merkle_root'] == merkle_root([hash_data(tx) for tx in first['transactions']])
+    assert blockchain.get_transaction(hash_data(second['transactions'][0]))[0] is second
@@ -0,0 +1,26 @@
+from src.blockchain.core import Blockchain
+from src.utils.crypto import hash_data
+
+def _block(index, transactions):
+    return {'index': index, 'transactions': transactions, 'previous_hash': ''}
+
+def test_tx_index_lookup():
+    blockchain = Blockchain()
+    tx_a = {'sender': 'a', 'receiver': 'b', 'data': {'n': 1}, 'timestamp': 1}
+    tx_b = {'sender': 'b', 'receiver': 'a', 'data': {'n': 2}, 'timestamp': 2}
+    blockchain.add_block(_block(0, [tx_a]))
+    blockchain.add_block(_block(1, [tx_a, tx_b]))
+
+    block, tx = blockchain.get_transaction(hash_data(tx_b))
+    assert block['index'] == 1
+    assert tx == tx_b
+    assert blockchain.get_transaction('unknown') is None
+
+def test_tx_index_rebuild():
+    blockchain = Blockchain()
+    tx = {'sender': 'a', 'receiver': 'b', 'data': {}, 'timestamp': 1}
+    blockchain.chain = [_block(0, []), _block(1, [tx])]
+    assert blockchain.get_transaction(hash_data(tx)) is None
+
+    blockchain.rebuild_tx_index()
+    assert blockchain.tx_index[hash_data(tx)] == (1, 0)
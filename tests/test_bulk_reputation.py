@@ -0,0 +1,55 @@
+def test_bulk_reads_match_single_reads(reputation_chain):
+    blockchain, contract = reputation_chain
+    agents = contract.w3.eth.accounts[1:6]
+    for i, agent in enumerate(agents):
+        contract.functions.updateReputation(agent, i % 2 == 0, 100 * i, 20 * i, i).transact()
+
+    bulk = blockchain.get_agent_reputations(agents + agents[:2], chunk_size=2)
+    assert list(bulk) == agents
+    assert bulk == {agent: blockchain.get_agent_reputation(agent) for agent in agents}
+
+def test_bulk_reads_fill_the_cache(reputation_chain):
+    blockchain, contract = reputation_chain
+    cache = blockchain.enable_reputation_cache(poll_interval=3600)
+    agents = contract.w3.eth.accounts[1:4]
+
+    blockchain.get_agent_reputations(agents)
+    blockchain.get_agent_reputation(agents[0])
+    assert cache.hits == 1 and len(cache) == 3
+
+def test_one_bad_sender_key_does_not_stall_the_validator(reputation_chain, monkeypatch):
+    from src.agents import validator_agent
+    from src.agents.batch_validation import validate_local
+
+    class Validator(validator_agent.ValidatorAgent):
+        def validate_via_smart_contract(self, transaction):
+            return True
+
+    blockchain, contract = reputation_chain
+    agents = contract.w3.eth.accounts[1:4]
+    for agent in agents:
+        contract.functions.updateReputation(agent, True, 100, 90, 4).transact()
+    senders = agents + ["-----BEGIN PUBLIC KEY-----\n...", agents[0].lower()]
+    for i, sender in enumerate(senders):
+        blockchain.add_transaction(sender=f'agent-{i}', receiver='Network', data={'value': i},
+                                   timestamp=i, nonce=i, sender_public_key=sender, signature='00')
+    # Senders are accounts, not signing keys, so the signature verdict is given
+    monkeypatch.setattr(validator_agent, 'validate_batch',
+                        lambda txs: [validate_local(tx, signature_valid=True) for tx in txs])
+    bulk = []
+    read_many = blockchain.get_agent_reputations
+    monkeypatch.setattr(blockchain, 'get_agent_reputations',
+                        lambda addresses: bulk.append(list(addresses)) or read_many(addresses))
+
+    validator = Validator(blockchain, "0xValidation")
+    outcomes = {}
+    monkeypatch.setattr(validator, '_finalize_transaction',
+                        lambda tx: outcomes.__setitem__(tx['data']['value'], 'approved'))
+    monkeypatch.setattr(validator, '_reject_transaction',
+                        lambda tx, report: outcomes.__setitem__(tx['data']['value'], report['errors']))
+    validator.process_pending_transactions()
+
+    assert sorted(bulk[0]) == sorted(agents) and len(bulk) == 1
+    assert [outcomes[i] for i in range(3)] == ['approved'] * 3
+    assert all("Reputation lookup failed" in outcomes[i][0] for i in (3, 4))
+    assert len(blockchain.pending_transactions) == 0
@@ -0,0 +1,86 @@
+import asyncio
+from src.blockchain.consensus import ConsensusClient, LocalPeer, Peer
+from src.blockchain.core import Blockchain
+from src.utils.crypto import hash_data
+
+class FailingPeer(Peer):
+    async def query(self, tx_hash):
+        raise ConnectionError("node down")
+
+def _chain_with(tx):
+    blockchain = Blockchain()
+    blockchain.add_block({'index': 0, 'transactions': [tx]})
+    return blockchain
+
+def test_quorum_returns_before_slow_peers():
+    tx = {'sender': 'a', 'data': {}}
+    blockchain = _chain_with(tx)
+    peers = [LocalPeer(blockchain, latency=0.01) for _ in range(3)]
+    peers += [LocalPeer(blockchain, latency=5.0) for _ in range(2)]
+    client = ConsensusClient(peers, timeout=10)
+
+    result = asyncio.run(client.check(hash_data(tx)))
+    assert result.agreed
+    assert result.block_hash == blockchain.hash(blockchain.last_block)
+    assert result.elapsed < 1.0
+
+def test_failures_and_disagreement():
+    tx = {'sender': 'a', 'data': {}}
+    honest = _chain_with(tx)
+    peers = [FailingPeer(), FailingPeer(), LocalPeer(honest), LocalPeer(Blockchain())]
+    client = ConsensusClient(peers, quorum=2, timeout=1)
+
+    result = asyncio.run(client.check(hash_data(tx)))
+    assert not result.agreed
+    assert not asyncio.run(client.check_transaction(tx))
+    # Failing peers drop to the back of the order
+    assert isinstance(client._ranked()[-1], FailingPeer)
+
+def test_http_peers_across_repeated_checks():
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from src.blockchain.consensus import HttpPeer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps({'block_hash': 'abc'}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    peers = [HttpPeer(url) for _ in range(3)]
+    client = ConsensusClient(peers, timeout=5)
+    tx = {'sender': 'a', 'data': {}, 'block_hash': 'abc'}
+    try:
+        # Sync path: one background loop, sessions reused
+        assert all(client.check_transaction_sync(tx) for _ in range(3))
+
+        # Separate asyncio.run loops each get their own sessions
+        async def check_and_close():
+            try:
+                return await client.check('abc')
+            finally:
+                for peer in peers:
+                    await peer.close()
+        for _ in range(2):
+            result = asyncio.run(check_and_close())
+            assert result.agreed and result.block_hash == 'abc' and set(result.votes) == {'abc'}
+
+        # Sync path from inside a running loop
+        async def nested():
+            return client.check_transaction_sync(tx)
+        assert asyncio.run(nested())
+        assert all(health.failures == 0 for health in client.health.values())
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
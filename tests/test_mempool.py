@@ -0,0 +1,84 @@
+import pytest
+from src.blockchain.core import Blockchain
+from src.blockchain.mempool import Mempool
+from src.blockchain.records import Transaction
+
+def _tx(sender, nonce, fee, payload=''):
+    return {'sender': sender, 'nonce': nonce, 'fee': fee, 'data': payload}
+
+def test_dedup_and_sender_nonce_order():
+    pool = Mempool()
+    assert pool.add(_tx('a', 2, 50)) is not None
+    assert pool.add(_tx('a', 1, 1)) is not None
+    assert pool.add(_tx('b', 1, 10)) is not None
+    assert pool.add(_tx('b', 1, 10)) is None
+    assert len(pool) == 3
+
+    # a's nonce 2 pays more, but cannot run ahead of a's nonce 1
+    selected = [tx for _, tx in pool.select(3)]
+    assert [(tx['sender'], tx['nonce']) for tx in selected] == [('b', 1), ('a', 1), ('a', 2)]
+
+    pool.pop_ready(1)
+    assert len(pool) == 2 and pool.sender_count('b') == 0
+
+def test_replacement_and_eviction():
+    pool = Mempool(max_transactions=3)
+    pool.add(_tx('a', 1, 5))
+    assert pool.add(_tx('a', 1, 3, 'cheaper')) is None
+    assert pool.add(_tx('a', 1, 8, 'bump')) is not None
+    assert len(pool) == 1
+
+    pool.add(_tx('b', 1, 1))
+    pool.add(_tx('c', 1, 4))
+    assert pool.add(_tx('d', 1, 0)) is None
+    assert pool.add(_tx('d', 1, 9)) is not None
+    assert len(pool) == 3
+    assert pool.sender_count('b') == 0
+
+def test_eviction_of_the_senders_own_queue():
+    pool = Mempool(max_transactions=1)
+    pool.add(_tx('a', 1, 1))
+    tx_hash = pool.add(_tx('a', 2, 5))
+    assert tx_hash is not None
+    assert len(pool) == 1 and pool.sender_count('a') == 1
+    assert [h for h, _ in pool.select(10)] == [tx_hash]
+    assert pool.remove([tx_hash]) == 1 and len(pool) == 0
+
+def test_nonce_gaps_do_not_block_a_sender():
+    pool = Mempool()
+    pool.add(_tx('a', 1700000000005, 1))
+    pool.add(_tx('a', 1700000000042, 1))
+    assert [tx['nonce'] for _, tx in pool.select(2)] == [1700000000005, 1700000000042]
+
+def test_agents_sharing_a_name_are_queued_by_key():
+    pool = Mempool()
+    first = dict(_tx('TaskAgent-v1', 1700000000000, 1), public_key='key-1')
+    second = dict(_tx('TaskAgent-v1', 1700000000000, 1), public_key='key-2')
+    assert pool.add(first) is not None and pool.add(second) is not None
+    assert pool.sender_count('key-1') == pool.sender_count('key-2') == 1
+
+def test_rejected_transactions_raise():
+    blockchain = Blockchain()
+    blockchain.queue_transaction(Transaction(_tx('a', 1, 5)))
+    with pytest.raises(ValueError):
+        blockchain.queue_transaction(Transaction(_tx('a', 1, 5)))  # duplicate
+    with pytest.raises(ValueError):
+        blockchain.add_transaction(**_tx('a', 1, 3, 'cheaper'))
+    assert len(blockchain.pending_transactions) == 1
+
+def test_same_class_agents_logging_in_one_millisecond(monkeypatch):
+    from src.agents import base_agent
+    from src.utils.signatures import get_backend
+
+    class Agent(base_agent.ChainSecAgent):
+        def _create_output_parser(self):
+            return None
+
+    blockchain = Blockchain()
+    blockchain.add_block({'index': 0, 'timestamp': 0.0, 'transactions': [], 'previous_hash': ''})
+    agents = [Agent("TaskAgent-v1", "test", [], blockchain,
+                    private_key=get_backend('ed25519').generate_private_key(), scheme='ed25519')
+              for _ in range(2)]
+    monkeypatch.setattr(base_agent, 'time', lambda: 1700000000.0)
+    hashes = {agent.log_transaction("Network", {'n': 1}) for agent in agents}
+    assert len(hashes) == 2 and len(blockchain.pending_transactions) == 2
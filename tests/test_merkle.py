@@ -0,0 +1,56 @@
+import pytest
+import src.blockchain.core as core
+from src.blockchain.core import Blockchain
+from src.blockchain.merkle import merkle_proof, merkle_root, verify_proof
+from src.utils.crypto import hash_data
+
+def test_proofs_for_every_leaf():
+    for size in (1, 2, 3, 7, 8, 33):
+        leaves = [hash_data({'n': i}) for i in range(size)]
+        root = merkle_root(leaves)
+        for index, leaf in enumerate(leaves):
+            proof = merkle_proof(leaves, index)
+            assert len(proof) <= size.bit_length()
+            assert verify_proof(leaf, proof, root)
+        assert not verify_proof(hash_data({'n': -1}), merkle_proof(leaves, 0), root)
+
+def test_blockchain_inclusion_proof():
+    blockchain = Blockchain()
+    transactions = [{'sender': 'a', 'data': {'n': i}} for i in range(5)]
+    blockchain.add_block({'index': 0, 'transactions': transactions})
+
+    proof = blockchain.get_inclusion_proof(hash_data(transactions[3]))
+    assert proof['merkle_root'] == blockchain.last_block['merkle_root']
+    assert blockchain.verify_inclusion_proof(proof)
+
+    proof['transaction'] = {'sender': 'a', 'data': {'n': 99}}
+    assert not blockchain.verify_inclusion_proof(proof)
+
+def test_proofs_reuse_block_leaves(monkeypatch):
+    blockchain = Blockchain()
+    transactions = [{'sender': 'a', 'data': {'n': i}} for i in range(8)]
+    blockchain.add_block({'index': 0, 'transactions': transactions})
+
+    monkeypatch.setattr(core, 'hash_data', None)  # no transaction is rehashed
+    proofs = [blockchain.get_inclusion_proof(h) for h in map(hash_data, transactions)]
+    monkeypatch.undo()
+    assert all(blockchain.verify_inclusion_proof(proof) for proof in proofs)
+
+    blockchain.leaves_cache_size = 0
+    blockchain.add_block({'index': 1, 'transactions': transactions[:3]})
+    assert blockchain.get_inclusion_proof(hash_data(transactions[1]))['block'] == 1
+
+def test_transaction_validator_rejects_malformed_proofs():
+    pytest.importorskip('langchain')
+    from src.agents.task_agent import BlockchainTools
+
+    blockchain = Blockchain()
+    tx = {'sender': 'a', 'data': {'n': 1}}
+    blockchain.add_block({'index': 0, 'transactions': [tx]})
+    validator = BlockchainTools.TransactionValidator()
+    tx_hash = hash_data(tx)
+    for proof in ({}, {'transaction': 'x'}, {'transaction': tx}, ['not', 'a', 'proof']):
+        report = validator._run(tx_hash, blockchain, proof)
+        assert report['valid'] is False and report['error']
+    report = validator._run(tx_hash, blockchain, blockchain.get_inclusion_proof(tx_hash))
+    assert report == {'valid': False, 'error': "Transaction is not signed", 'block': 0}
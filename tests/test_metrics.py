@@ -0,0 +1,60 @@
+import asyncio
+import pytest
+from src.utils import metrics
+from src.utils.metrics import InMemorySink, PrometheusSink, stage, timed
+
+@pytest.fixture
+def sink():
+    sink = PrometheusSink(buckets=(0.01, 1.0))
+    previous = metrics.set_sink(sink)
+    yield sink
+    metrics.set_sink(previous)
+
+@timed('test.work')
+def _work(fail=False):
+    if fail:
+        raise RuntimeError("boom")
+    return 42
+
+def test_disabled_layer_records_nothing():
+    assert metrics.get_sink() is None
+    observer = InMemorySink()
+    assert _work() == 42
+    with stage('test.block'):
+        pass
+    assert observer.snapshot() == {}
+
+def test_timers_counters_and_gauges(sink):
+    assert _work() == 42
+    with pytest.raises(RuntimeError):
+        _work(fail=True)
+    with stage('test.block'):
+        assert sink.snapshot()['test.block']['in_flight'] == 1
+
+    @timed('test.async')
+    async def coroutine():
+        await asyncio.sleep(0)
+        return 'done'
+
+    assert asyncio.run(coroutine()) == 'done'
+
+    snapshot = sink.snapshot()
+    assert snapshot['test.work']['count'] == 2 and snapshot['test.work']['errors'] == 1
+    assert snapshot['test.block']['in_flight'] == 0
+    assert sum(snapshot['test.async']['buckets']) == 1
+    assert sink.stages() == ['test.async', 'test.block', 'test.work']
+
+    text = sink.render()
+    assert 'chainsec_stage_seconds_bucket{stage="test.work",le="+Inf"} 2' in text
+    assert 'chainsec_stage_seconds_count{stage="test.work"} 2' in text
+    assert 'chainsec_stage_errors_total{stage="test.work"} 1' in text
+    assert '# TYPE chainsec_stage_in_flight gauge' in text
+
+def test_blockchain_reputation_calls_are_instrumented(sink, reputation_chain):
+    blockchain, contract = reputation_chain
+    agent = contract.w3.eth.accounts[1]
+    blockchain.get_agent_reputation(agent)
+    blockchain.get_agent_reputations([agent])
+    snapshot = sink.snapshot()
+    assert snapshot['blockchain.get_agent_reputation']['count'] == 1
+    assert snapshot['blockchain.get_agent_reputations']['count'] == 1
@@ -0,0 +1,40 @@
+import pickle
+from src.blockchain.core import Blockchain
+from src.blockchain.records import Block, Transaction
+from src.blockchain.storage import ChainStore
+from src.utils.crypto import hash_data
+
+def _payload():
+    return {
+        'sender': 'agent-1', 'receiver': 'Network', 'data': {'task': 't', 'result': 1},
+        'signature': 'ab', 'timestamp': 1.5, 'nonce': 7, 'amount': 3
+    }
+
+def test_transaction_behaves_like_its_dict():
+    payload = _payload()
+    tx = Transaction(payload)
+    assert tx == payload and dict(tx) == payload and len(tx) == len(payload)
+    assert tx['amount'] == 3 and tx.get('fee') is None and 'fee' not in tx
+    assert hash_data(tx) == hash_data(payload) == tx.digest
+    assert pickle.loads(pickle.dumps(tx)) == tx
+
+    tx['nonce'] = 8
+    del tx['amount']
+    payload['nonce'] = 8
+    del payload['amount']
+    assert 'amount' not in tx and tx.digest == hash_data(payload)
+
+def test_block_hash_matches_dict_blocks(tmp_path):
+    txs = [Transaction(_payload()), _payload()]
+    block = Block(index=0, timestamp=1.0, transactions=txs, previous_hash='0' * 64)
+    as_dict = {'index': 0, 'timestamp': 1.0, 'transactions': [_payload(), _payload()],
+               'previous_hash': '0' * 64}
+    assert Blockchain.hash(block) == Blockchain.hash(as_dict)
+
+    chain = Blockchain(storage_dir=str(tmp_path))
+    chain.add_block(block)
+    chain.add_block(as_dict)
+    assert Blockchain.hash(block) == Blockchain.hash(as_dict)
+    chain.chain.close()
+    reopened = ChainStore(str(tmp_path))
+    assert Blockchain.hash(reopened[0]) == Blockchain.hash(block)
@@ -1,22 +1,53 @@
-def test_reputation_flow():
-    blockchain = Blockchain()
-    agent = TaskAgent(blockchain, ...)
-    validator = ValidatorAgent(blockchain, ...)
-    
+from src.agents.batch_validation import validate_local
+from src.agents.validator_agent import ValidatorAgent
+from src.blockchain.reputation_scoring import FIELDS, contract_score
+
+def _update(blockchain, agent, success, times=1):
+    for _ in range(times):
+        blockchain.update_agent_reputation(agent, success, 200, 90 if success else 20, 4)
+
+class _Validator(ValidatorAgent):
+    def validate_via_smart_contract(self, transaction):
+        return True
+
+def _validate(validator, agent):
+    # The sender is identified by its account, so the signature verdict is given
+    tx = {'sender': agent, 'receiver': 'Network', 'data': {'value': 1},
+          'timestamp': 0, 'sender_public_key': agent, 'signature': '00'}
+    return validator.validate_transaction(tx, local_report=validate_local(tx, signature_valid=True))
+
+def test_reputation_flow(reputation_chain, monkeypatch):
+    blockchain, contract = reputation_chain
+    agent = contract.w3.eth.accounts[1]
+    blockchain.enable_reputation_cache(poll_interval=0)
+
     # Initial reputation check
-    assert agent.reputation['score'] == 0
-    
-    # Execute successful task
-    agent.execute("Simple data processing")
-    rep = blockchain.get_agent_reputation(agent.public_key)
-    assert rep['score'] > 50
-    
-    # Test validation with low reputation
-    agent.reputation['score'] = 45  # Force low score
-    validation_report = validator.validate_transaction(...)
-    assert "Low reputation" in validation_report['warnings']
-    
-    # Test reputation recovery
-    for _ in range(5):
-        agent.execute("Valid task")
-    assert blockchain.get_agent_reputation(agent.public_key)['score'] > 75
\ No newline at end of file
+    assert blockchain.get_agent_reputation(agent)['score'] == 0
+
+    # Successful task
+    _update(blockchain, agent, True)
+    rep = blockchain.get_agent_reputation(agent)
+    assert (rep['total_tasks'], rep['successful_tasks']) == (1, 1)
+    assert rep['score'] == contract_score([rep[field] for field in FIELDS])
+    high = rep['score']
+
+    # Failures pull the score down; the cache must not serve the old value
+    _update(blockchain, agent, False, times=3)
+    low = blockchain.get_agent_reputation(agent)['score']
+    assert low < high
+
+    # Validation with low reputation
+    validator = _Validator(blockchain, "0xValidation")
+    forced = dict(blockchain.get_agent_reputation(agent), score=45)  # Force low score
+    with monkeypatch.context() as m:
+        m.setattr(blockchain, 'get_agent_reputation', lambda address, strict=False: forced)
+        report = _validate(validator, agent)
+    assert not report['valid']
+    assert "Low reputation" in report['warnings'][-1]
+
+    # Recovery
+    _update(blockchain, agent, True, times=5)
+    recovered = blockchain.get_agent_reputation(agent, strict=True)
+    assert low < recovered['score'] <= high
+    assert recovered['total_tasks'] == 9
+    assert not any("Low reputation" in w for w in _validate(validator, agent)['warnings'])
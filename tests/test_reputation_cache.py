@@ -0,0 +1,42 @@
+def test_cache_invalidated_by_reputation_event(reputation_chain):
+    blockchain, contract = reputation_chain
+    cache = blockchain.enable_reputation_cache(poll_interval=0)
+    agent = contract.w3.eth.accounts[1]
+
+    first = blockchain.get_agent_reputation(agent)
+    assert blockchain.get_agent_reputation(agent) is first
+    assert cache.hits == 1
+
+    # Update outside of this Blockchain instance; only the event reveals it
+    contract.functions.updateReputation(agent, True, 100, 90, 0).transact()
+    updated = blockchain.get_agent_reputation(agent)
+    assert updated['total_tasks'] == first['total_tasks'] + 1
+
+def test_strict_mode_skips_cache(reputation_chain):
+    blockchain, contract = reputation_chain
+    cache = blockchain.enable_reputation_cache(poll_interval=3600)
+    agent = contract.w3.eth.accounts[1]
+
+    blockchain.get_agent_reputation(agent)
+    contract.functions.updateReputation(agent, True, 100, 90, 0).transact()
+    assert blockchain.get_agent_reputation(agent)['total_tasks'] == 0
+    assert blockchain.get_agent_reputation(agent, strict=True)['total_tasks'] == 1
+    assert cache.hits == 1
+
+def test_lru_eviction_and_ttl(reputation_chain):
+    blockchain, contract = reputation_chain
+    now = [0.0]
+    cache = blockchain.enable_reputation_cache(
+        ttl=10, max_entries=2, poll_interval=3600, clock=lambda: now[0]
+    )
+    a, b, c = contract.w3.eth.accounts[1:4]
+
+    for agent in (a, b, c):
+        blockchain.get_agent_reputation(agent)
+    assert len(cache) == 2
+    blockchain.get_agent_reputation(a)
+    assert cache.misses == 4
+
+    now[0] = 11
+    blockchain.get_agent_reputation(c)
+    assert cache.misses == 5
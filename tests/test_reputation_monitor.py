@@ -0,0 +1,62 @@
+def test_monitor_fires_on_crossing_and_resumes(reputation_chain, tmp_path):
+    blockchain, contract = reputation_chain
+    good, bad = contract.w3.eth.accounts[1:3]
+    state_path = str(tmp_path / 'monitor.json')
+    breaches = []
+
+    def monitor():
+        from src.blockchain.reputation_monitor import ReputationMonitor
+        return ReputationMonitor(
+            blockchain._reputation_contract(), breaches.append,
+            threshold=2000, state_path=state_path
+        )
+
+    first = monitor()
+    contract.functions.updateReputation(good, True, 100, 100, 5).transact()
+    contract.functions.updateReputation(bad, False, 100, 0, 0).transact()
+    assert first.poll() == [bad]
+    assert first.agents[good]['updates'] == 1
+
+    # Restart: history is not replayed, only new events are seen
+    second = monitor()
+    assert second.poll() == []
+    contract.functions.updateReputation(good, False, 100, 0, 0).transact()
+    contract.functions.updateReputation(good, False, 100, 0, 0).transact()
+    assert second.poll() == [good]
+    assert second.agents[good]['updates'] == 3
+    assert breaches == [[bad], [good]]
+
+def test_reputation_agent_monitors_the_network(reputation_chain, tmp_path, monkeypatch):
+    import threading
+    import time
+    from src.agents import reputation_agent
+    from src.utils.signatures import get_backend
+
+    blockchain, contract = reputation_chain
+    blockchain.add_block({'index': 0, 'timestamp': 0.0, 'transactions': [], 'previous_hash': ''})
+    bad = contract.w3.eth.accounts[1]
+    monkeypatch.setattr(reputation_agent, 'DATA_DIR', str(tmp_path / 'data'))
+    agent = reputation_agent.ReputationAgent(
+        blockchain, private_key=get_backend('rsa').generate_private_key(), scheme='rsa'
+    )
+    assert agent.headless and agent.tools == []
+
+    contract.functions.updateReputation(bad, False, 100, 0, 0).transact()
+    thread = threading.Thread(target=agent.monitor_network,
+                              kwargs={'threshold': 2000, 'poll_interval': 0.01})
+    thread.start()
+    try:
+        deadline = time.time() + 10
+        while not len(blockchain.pending_transactions) and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        while agent.monitor is None and thread.is_alive():
+            time.sleep(0.01)
+        if agent.monitor is not None:
+            agent.monitor.stop()
+        thread.join(5)
+
+    [policy] = list(blockchain.pending_transactions)
+    assert policy['sender'] == agent.name
+    assert policy['data'] == {'type': 'reputation_policy', 'action': 'restrict', 'agents': [bad]}
+    assert (tmp_path / 'data' / 'reputation_monitor.json').exists()
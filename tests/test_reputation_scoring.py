@@ -0,0 +1,59 @@
+import random
+from src.blockchain.reputation_scoring import ReputationReplay, ReputationTable, contract_score
+
+def test_scores_match_contract(reputation_chain):
+    blockchain, contract = reputation_chain
+    agents = contract.w3.eth.accounts[1:8]
+    rng = random.Random(3)
+    for _ in range(40):
+        contract.functions.updateReputation(
+            rng.choice(agents), rng.random() < 0.6,
+            rng.randint(0, 10 ** 6), rng.randint(0, 100), rng.choice([0, rng.randint(1, 5)])
+        ).transact()
+
+    reputation = blockchain._reputation_contract()
+    onchain = [contract.functions.calculateReputationScore(a).call() for a in agents]
+    assert list(ReputationTable.from_contract(reputation, agents).scores()) == onchain
+
+    replayed = ReputationTable.from_events(reputation)
+    assert dict(zip(replayed.agents, replayed.scores())) == dict(zip(agents, onchain))
+
+def test_replay_advances_from_the_last_block(reputation_chain, monkeypatch):
+    blockchain, contract = reputation_chain
+    agents = contract.w3.eth.accounts[1:4]
+    reputation = blockchain._reputation_contract()
+    replay = ReputationReplay(reputation)
+    contract.functions.updateReputation(agents[0], True, 100, 90, 4).transact()
+    contract.functions.updateReputation(agents[1], False, 100, 10, 1).transact()
+    assert set(replay.advance().agents) == set(agents[:2])
+
+    fetched = []
+    get_transaction = reputation.w3.eth.get_transaction
+    monkeypatch.setattr(reputation.w3.eth, 'get_transaction',
+                        lambda tx_hash: fetched.append(tx_hash) or get_transaction(tx_hash))
+    assert len(replay.advance()) == 2 and fetched == []
+    contract.functions.updateReputation(agents[2], True, 100, 90, 4).transact()
+    contract.functions.updateReputation(agents[0], False, 100, 10, 0).transact()
+    table = replay.advance()
+    assert len(fetched) == 2
+
+    full = ReputationTable.from_events(reputation)
+    assert dict(zip(table.agents, table.scores())) == dict(zip(full.agents, full.scores()))
+
+def test_vector_path_matches_reference():
+    rng = random.Random(11)
+    records = {}
+    for i in range(5000):
+        total = rng.randint(0, 2 ** 31 - 1)
+        records[f"agent-{i}"] = (
+            total, rng.randint(0, total), rng.randint(0, 2 ** 31 - 1),
+            rng.randint(0, 2 ** 31 - 1), rng.randint(0, 9), rng.randint(0, 2 ** 31 - 1)
+        )
+    records["huge"] = (2 ** 70, 2 ** 69, 10 ** 30, 10 ** 17, 1, 10 ** 25)
+    table = ReputationTable.from_records(records)
+    for weights in ((40, 30, 20, 10), (10, 10, 70, 10)):
+        expected = [contract_score(rep, weights) for rep in records.values()]
+        assert list(table.scores(weights)) == expected
+
+    top = table.top_k(3)
+    assert [score for _, score in top] == sorted(table.scores(), reverse=True)[:3]
@@ -0,0 +1,83 @@
+def test_batched_updates_resolve_futures(reputation_chain):
+    blockchain, contract = reputation_chain
+    agents = contract.w3.eth.accounts[1:6]
+
+    futures = [
+        blockchain.submit_reputation_update(agent, True, 100, 90)
+        for agent in agents
+    ]
+    blockchain.reputation_submitter.flush()
+    receipts = [future.result(timeout=30) for future in futures]
+
+    assert all(receipt['status'] == 1 for receipt in receipts)
+    for agent in agents:
+        assert blockchain.get_agent_reputation(agent)['total_tasks'] == 1
+    blockchain.reputation_submitter.close()
+
+def test_transient_receipt_errors_are_retried(reputation_chain, monkeypatch):
+    from src.blockchain.submission import ReputationSubmitter
+
+    blockchain, contract = reputation_chain
+    agent = contract.w3.eth.accounts[1]
+    eth = contract.w3.eth
+    get_receipt = eth.get_transaction_receipt
+    calls = []
+
+    def flaky_receipt(tx_hash):
+        calls.append(tx_hash)
+        if len(calls) <= 2:
+            raise ConnectionError("node unavailable")
+        return get_receipt(tx_hash)
+
+    monkeypatch.setattr(eth, 'get_transaction_receipt', flaky_receipt)
+    submitter = ReputationSubmitter(
+        blockchain._reputation_contract(), poll_interval=0.01, max_receipt_errors=3
+    )
+    future = submitter.submit(agent, True, 100, 90)
+    submitter.flush()
+
+    # The transaction was mined once; the errors did not fail or resend it
+    assert future.result(timeout=30)['status'] == 1
+    assert len(calls) == 3 and len(set(calls)) == 1
+    assert blockchain.get_agent_reputation(agent)['total_tasks'] == 1
+    submitter.close()
+
+def test_provider_and_callback_errors_fail_only_their_batch(reputation_chain, monkeypatch):
+    import pytest
+    from src.blockchain.submission import ReputationSubmitter
+
+    blockchain, contract = reputation_chain
+    agents = contract.w3.eth.accounts[1:3]
+    eth = contract.w3.eth
+    get_receipt = eth.get_transaction_receipt
+    failing = [True]
+
+    def flaky_receipt(tx_hash):
+        if failing[0]:
+            raise ConnectionError("node unavailable")
+        return get_receipt(tx_hash)
+
+    monkeypatch.setattr(eth, 'get_transaction_receipt', flaky_receipt)
+    blockchain.reputation_submitter = ReputationSubmitter(
+        blockchain._reputation_contract(), poll_interval=0.01, max_receipt_errors=3,
+        on_confirmed=blockchain._on_reputation_confirmed
+    )
+    first = blockchain.submit_reputation_update(agents[0], True, 100, 90)
+    blockchain.reputation_submitter.flush()
+    with pytest.raises(ConnectionError):
+        first.result(timeout=30)
+    failing[0] = False
+
+    def broken_callback(addresses):
+        raise RuntimeError("subscriber bug")
+
+    blockchain.reputation_submitter.on_confirmed = broken_callback
+    second = blockchain.submit_reputation_update(agents[1], True, 100, 90)
+    blockchain.reputation_submitter.flush()
+    assert second.result(timeout=30)['status'] == 1
+
+    # The worker thread survived both errors
+    third = blockchain.submit_reputation_update(agents[1], False, 100, 20)
+    blockchain.reputation_submitter.flush()
+    assert third.result(timeout=30)['status'] == 1
+    blockchain.reputation_submitter.close()
@@ -0,0 +1,29 @@
+from src.agents.result_cache import ResultCache, result_key
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_key_normalizes_task_and_tool_order():
+    key = result_key("TaskAgent-v1", "purpose", ["b", "a"], "Process  this\ndata")
+    assert key == result_key("TaskAgent-v1", "purpose", ["a", "b"], " Process this\ndata ")
+    assert key != result_key("TaskAgent-v1", "purpose", ["a"], "Process this\ndata")
+
+def test_memory_lru_disk_tier_and_ttl(tmp_path):
+    clock = _Clock()
+    cache = ResultCache(path=str(tmp_path), ttl=60, max_entries=1, clock=clock)
+    assert cache.get("k1") is None
+    cache.put("k1", "result-1", "tx-1")
+    cache.put("k2", "result-2", "tx-2")  # evicts k1 from memory
+    assert len(cache) == 1
+
+    assert cache.get("k1")['tx_hash'] == "tx-1"
+    assert (cache.hits, cache.disk_hits, cache.misses) == (1, 1, 1)
+
+    restarted = ResultCache(path=str(tmp_path), ttl=60, clock=clock)
+    assert restarted.get("k2")['result'] == "result-2"
+    clock.now += 61
+    assert restarted.get("k2") is None and cache.get("k1") is None
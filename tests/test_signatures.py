@@ -0,0 +1,77 @@
+import pytest
+from src.agents.base_agent import ChainSecAgent
+from src.agents.batch_validation import check_signature, validate_batch, validate_local
+from src.blockchain.core import Blockchain
+from src.utils.crypto import hash_data, sign_data, validate_signature
+from src.utils.signatures import get_backend, schemes
+
+@pytest.mark.parametrize('scheme', ['rsa', 'ed25519', 'secp256k1'])
+def test_sign_and_verify_roundtrip(scheme):
+    backend = get_backend(scheme)
+    private_key = backend.generate_private_key()
+    public_key = backend.public_key(private_key)
+    data = {'task': 'classify', 'result': 3}
+
+    signature = sign_data(private_key, data, scheme)
+    assert validate_signature(public_key, hash_data(data), signature, scheme)
+    assert not validate_signature(public_key, hash_data({'task': 'other'}), signature, scheme)
+    assert not validate_signature(public_key, hash_data(data), '00' * 8, scheme)
+
+def test_mixed_schemes_in_one_batch():
+    transactions = []
+    for i, scheme in enumerate(schemes() * 2):
+        backend = get_backend(scheme)
+        private_key = backend.generate_private_key()
+        data = {'value': i}
+        transactions.append({
+            'sender': f'agent-{i}', 'receiver': 'Network', 'data': data, 'timestamp': i,
+            'scheme': scheme,
+            'sender_public_key': backend.public_key(private_key),
+            'signature': sign_data(private_key, {'receiver': 'Network', 'data': data}, scheme)
+        })
+    transactions[0].pop('scheme')  # legacy RSA transaction
+    transactions[1]['data'] = {'value': -1}
+    transactions[2]['scheme'] = 'dsa'
+
+    reports = validate_batch(transactions)
+    assert reports == [validate_local(tx) for tx in transactions]
+    assert [i for i, r in enumerate(reports) if not r['valid']] == [1, 2]
+    assert reports[2]['errors'] == ["Crypto error: Unsupported signature scheme"]
+
+class _Signer(ChainSecAgent):
+    def _create_output_parser(self):
+        return None
+
+@pytest.fixture(params=['rsa', 'ed25519'])
+def agent_transaction(request):
+    """A transaction as queued by ChainSecAgent.log_transaction, and its chain"""
+    blockchain = Blockchain()
+    blockchain.add_block({'index': 0, 'timestamp': 0.0, 'transactions': [], 'previous_hash': ''})
+    backend = get_backend(request.param)
+    agent = _Signer("signer", "test", [], blockchain,
+                    private_key=backend.generate_private_key(), scheme=request.param)
+    agent.log_transaction("Network", {'task': 'classify', 'result': 3})
+    [tx] = list(blockchain.pending_transactions)
+    return blockchain, tx
+
+def test_agent_transactions_validate(agent_transaction):
+    _, tx = agent_transaction
+    assert check_signature(tx, tx['public_key']) == (True, "Cryptographic validation passed")
+    assert validate_local(tx)['valid'] and validate_batch([tx])[0]['valid']
+
+    for field, value in (('data', {'task': 'classify', 'result': 4}),
+                         ('receiver', 'Attacker'), ('previous_hash', '0' * 64)):
+        tampered = dict(tx, **{field: value})
+        assert not validate_local(tampered)['valid']
+        assert not validate_batch([tampered])[0]['valid']
+
+def test_transaction_validator_accepts_agent_transactions(agent_transaction):
+    pytest.importorskip('langchain')
+    from src.agents.task_agent import BlockchainTools
+
+    blockchain, tx = agent_transaction
+    blockchain.add_block({'index': 1, 'timestamp': 1.0, 'transactions': [tx], 'previous_hash': ''})
+    tx_hash = hash_data(tx)
+    validator = BlockchainTools.TransactionValidator()
+    assert validator._run(tx_hash, blockchain)['valid']
+    assert validator._run(tx_hash, blockchain, blockchain.get_inclusion_proof(tx_hash))['valid']
@@ -0,0 +1,99 @@
+import os
+from src.blockchain.core import Blockchain
+from src.blockchain.storage import ChainStore
+from src.utils.crypto import hash_data
+
+def _block(index):
+    return {
+        'index': index,
+        'transactions': [{'sender': 'a', 'data': {'n': index, 'pad': 'x' * 100}}],
+        'previous_hash': ''
+    }
+
+def test_chain_survives_restart(tmp_path):
+    blockchain = Blockchain(storage_dir=str(tmp_path))
+    for i in range(50):
+        blockchain.add_block(_block(i))
+    tip_hash = blockchain.hash(blockchain.last_block)
+    blockchain.chain.close()
+
+    reopened = Blockchain(storage_dir=str(tmp_path))
+    assert len(reopened.chain) == 50
+    assert reopened.hash(reopened.last_block) == tip_hash
+    assert reopened.chain[10]['index'] == 10
+    assert [block['index'] for block in reopened.chain[-3:]] == [47, 48, 49]
+
+    block, tx = reopened.get_transaction(hash_data(_block(20)['transactions'][0]))
+    assert block['index'] == 20
+
+def test_segment_rollover_and_torn_tail(tmp_path):
+    store = ChainStore(str(tmp_path), segment_size=1024)
+    for i in range(30):
+        store.append(_block(i))
+    store.close()
+    assert len([f for f in os.listdir(tmp_path) if f.startswith('segment-')]) > 1
+
+    # Simulate a crash that left half an index entry behind
+    with open(tmp_path / 'index.dat', 'ab') as f:
+        f.write(b'\x00' * 7)
+
+    store = ChainStore(str(tmp_path), segment_size=1024, cache_size=1)
+    assert len(store) == 30
+    assert store[-1]['index'] == 29
+    store.append(_block(30))
+    assert [block['index'] for block in store][-2:] == [29, 30]
+    store.close()
+
+def test_transaction_index_is_persisted(tmp_path, monkeypatch):
+    blockchain = Blockchain(storage_dir=str(tmp_path))
+    for i in range(20):
+        blockchain.add_block(_block(i))
+    blockchain.chain.close()
+
+    # Crash between a block's transaction entries and its index entry
+    store = ChainStore(str(tmp_path))
+    store.append(_block(20))
+    store.close()
+    with open(tmp_path / 'index.dat', 'r+b') as f:
+        f.truncate(20 * 16)
+
+    reopened = Blockchain(storage_dir=str(tmp_path))
+    monkeypatch.setattr(reopened, 'rebuild_tx_index', None)
+    reads = []
+    read = reopened.chain._read
+    monkeypatch.setattr(reopened.chain, '_read', lambda h: reads.append(h) or read(h))
+
+    block, _ = reopened.get_transaction(hash_data(_block(7)['transactions'][0]))
+    assert block['index'] == 7 and reads == [7]
+    assert reopened.get_transaction(hash_data(_block(20)['transactions'][0])) is None
+    reopened.add_block(_block(20))
+    assert reopened.get_inclusion_proof(hash_data(_block(20)['transactions'][0]))['block'] == 20
+    reopened.chain.close()
+
+    # Stores written before txindex.dat existed are indexed once on open
+    os.remove(tmp_path / 'txindex.dat')
+    migrated = ChainStore(str(tmp_path))
+    assert migrated.load_tx_index()[hash_data(_block(20)['transactions'][0])] == (20, 0)
+    assert len(migrated.load_tx_index()) == 21
+    migrated.close()
+
+def test_unindexed_rolled_segment_is_discarded(tmp_path):
+    store = ChainStore(str(tmp_path), segment_size=1024)
+    while store._segment == 0:
+        store.append(_block(len(store)))
+    stale = len(store) - 1  # first record of segment 1
+    store.close()
+    # Crash after the rollover wrote that record, before it was indexed
+    with open(tmp_path / 'index.dat', 'r+b') as f:
+        f.truncate(stale * 16)
+
+    store = ChainStore(str(tmp_path), segment_size=1024)
+    assert len(store) == stale
+    while store._segment == 0:
+        store.append(_block(99))
+    store.close()
+
+    store = ChainStore(str(tmp_path), segment_size=1024)
+    assert store[-1]['index'] == 99
+    assert [block['index'] for block in store][:stale] == list(range(stale))
+    store.close()
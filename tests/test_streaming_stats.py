@@ -0,0 +1,51 @@
+import json
+import numpy as np
+import pytest
+from src.utils.streaming_stats import RunningStats, confine_source, stream_stats
+
+def _expected(values):
+    values = np.asarray(values, dtype=np.float64)
+    return {'count': values.size, 'mean': values.mean(), 'total': values.sum(),
+            'min': values.min(), 'max': values.max(), 'variance': values.var()}
+
+def _check(stats, values):
+    for key, value in _expected(values).items():
+        assert stats[key] == pytest.approx(value), key
+
+def test_chunked_matches_numpy_for_all_sources(tmp_path):
+    values = np.random.default_rng(0).normal(1e6, 3.0, size=10007)
+
+    np.save(tmp_path / 'values.npy', values)
+    (tmp_path / 'values.csv').write_text(
+        "id,value\n" + "".join(f"{i},{v!r}\n" for i, v in enumerate(values.tolist()))
+    )
+    (tmp_path / 'values.ndjson').write_text(
+        "".join(json.dumps({'value': v}) + "\n" for v in values.tolist())
+    )
+
+    _check(stream_stats(values.tolist(), chunk_size=1000), values)
+    _check(stream_stats(iter(values.tolist()), chunk_size=999), values)
+    _check(stream_stats(str(tmp_path / 'values.npy'), chunk_size=1024), values)
+    _check(stream_stats(str(tmp_path / 'values.csv'), column='value', chunk_size=1000), values)
+    _check(stream_stats(str(tmp_path / 'values.ndjson'), chunk_size=1000), values)
+
+def test_empty_input():
+    stats = RunningStats()
+    stats.update([])
+    assert stats.as_dict() == {'count': 0, 'mean': 0.0, 'total': 0.0, 'min': None,
+                               'max': None, 'variance': 0.0, 'std': 0.0}
+    assert stream_stats([]) == stats.as_dict()
+
+def test_sources_are_confined_to_the_data_dir(tmp_path):
+    root = tmp_path / 'sources'
+    root.mkdir()
+    np.save(root / 'values.npy', np.arange(4.0))
+    (tmp_path / 'secret.csv').write_text("1\n2\n")
+    (root / 'link.csv').symlink_to(tmp_path / 'secret.csv')
+
+    assert confine_source('values.npy', str(root)) == str((root / 'values.npy').resolve())
+    assert stream_stats(confine_source(str(root / 'values.npy'), str(root)))['count'] == 4
+    assert confine_source([1.0, 2.0], str(root)) == [1.0, 2.0]
+    for escape in ('../secret.csv', str(tmp_path / 'secret.csv'), 'link.csv', '/etc/passwd'):
+        with pytest.raises(ValueError):
+            confine_source(escape, str(root))
@@ -0,0 +1,194 @@
+import functools
+import multiprocessing
+import os
+import pytest
+from Crypto.PublicKey import RSA
+from src.agents.validator_agent import ValidatorAgent
+from src.agents.validator_cluster import ValidatorCluster, cluster_for, shard_key, shard_of
+from src.agents.validator_worker import ValidationWorker
+from src.blockchain.core import Blockchain
+from src.utils.crypto import sign_data
+
+class _ScoreTable(Blockchain):
+    """
+    Reputations from a fixed table instead of the contract
+    Senders are PEM keys, not addresses, so they are read one by one
+    """
+
+    def __init__(self, low):
+        super().__init__()
+        self.low = low
+
+    def get_agent_reputation(self, address, strict=False):
+        return {'score': 10 if address in self.low else 90}
+
+class _ShardValidator(ValidatorAgent):
+    def validate_via_smart_contract(self, transaction):
+        return True
+
+class _TaggingWorker(ValidationWorker):
+    def validate(self, transactions):
+        reports = super().validate(transactions)
+        for transaction, report in zip(transactions, reports):
+            report['worker'] = os.getpid()
+            report['value'] = transaction['data']['value']
+        return reports
+
+class _CrashingWorker(_TaggingWorker):
+    def validate(self, transactions):
+        if any(tx['data']['value'] == -99 for tx in transactions):
+            os._exit(1)
+        return super().validate(transactions)
+
+def _build_worker(low, worker=_TaggingWorker):
+    return worker(_ShardValidator(_ScoreTable(low), "0xValidation"), consensus=False)
+
+def _coordinator(low):
+    """Serial reference: same checks, a chain with one block, consensus run here"""
+    agent = _ShardValidator(_ScoreTable(low), "0xValidation")
+    agent.blockchain.add_block({'index': 0, 'timestamp': 0.0, 'transactions': [], 'previous_hash': ''})
+    return agent
+
+def _strip(reports):
+    return [{k: v for k, v in r.items() if k not in ('worker', 'value', 'tx_hash')} for r in reports]
+
+@pytest.fixture(scope='module')
+def senders():
+    keys = [RSA.generate(1024) for _ in range(6)]
+    return [(k.export_key().decode(), k.publickey().export_key().decode()) for k in keys]
+
+def _transactions(senders, per_sender=4):
+    transactions = []
+    for nonce in range(per_sender):
+        for i, (private_pem, public_pem) in enumerate(senders):
+            data = {'value': i * 100 + nonce}
+            transactions.append({
+                'sender': f'agent-{i}', 'receiver': 'Network', 'data': data,
+                'timestamp': nonce, 'nonce': nonce, 'sender_public_key': public_pem,
+                'signature': sign_data(private_pem, {'receiver': 'Network', 'data': data})
+            })
+    return transactions
+
+def test_shards_are_stable_and_keep_senders_together(senders):
+    transactions = _transactions(senders)
+    cluster = ValidatorCluster(lambda: None, shards=3)
+    parts = cluster.partition(transactions)
+    assert sorted(p for part in parts for p in part) == list(range(len(transactions)))
+    assert all(part == sorted(part) for part in parts)
+    shards_by_sender = {}
+    for shard, part in enumerate(parts):
+        for position in part:
+            shards_by_sender.setdefault(shard_key(transactions[position]), set()).add(shard)
+    assert all(len(shards) == 1 for shards in shards_by_sender.values())
+    assert shard_of(transactions[0], 3) == shard_of(dict(transactions[0]), 3)
+
+def test_cluster_matches_serial_validation(senders):
+    low = frozenset({senders[1][1]})
+    coordinator = _coordinator(low)
+    tip = coordinator.blockchain.hash(coordinator.blockchain.last_block)
+    transactions = _transactions(senders)
+    transactions[5]['data'] = {'value': -1}  # tampered
+    for tx in transactions[::2]:
+        tx['block_hash'] = tip  # consensus agrees only against the coordinator's chain
+    serial = coordinator.validate_pending([dict(tx) for tx in transactions])
+
+    with ValidatorCluster(functools.partial(_build_worker, low), shards=3) as cluster:
+        first = cluster.validate(transactions)
+        second = cluster.validate(transactions)
+    assert [r['value'] for r in first] == [tx['data']['value'] for tx in transactions]
+    first, second = ([coordinator.apply_consensus(tx, r) for tx, r in zip(transactions, reports)]
+                     for reports in (first, second))
+
+    assert _strip(first) == _strip(serial) == _strip(second)
+    assert sum(r['valid'] for r in serial) == len(transactions) - 1 - 4  # tampered, low sender
+    assert "Consensus verification pending" not in serial[0]['warnings']
+    assert "Consensus verification pending" in serial[1]['warnings']
+
+    # One long-lived worker per sender, reused across batches
+    workers = {}
+    for tx, report in zip(transactions + transactions, first + second):
+        workers.setdefault(shard_key(tx), set()).add(report['worker'])
+    assert all(len(pids) == 1 for pids in workers.values())
+    assert os.getpid() not in {pid for pids in workers.values() for pid in pids}
+
+def test_coordinator_finalizes_in_mempool_order(senders, monkeypatch):
+    low = frozenset({senders[2][1]})
+    agent = ValidatorAgent(Blockchain(), "0xValidation")
+    for tx in _transactions(senders, per_sender=3):
+        agent.blockchain.add_transaction(**tx)
+    selected = [tx for _, tx in agent.blockchain.pending_transactions.select(1000)]
+
+    outcomes = []
+    monkeypatch.setattr(agent, '_finalize_transaction',
+                        lambda tx: outcomes.append(('approved', tx['data']['value'])))
+    monkeypatch.setattr(agent, '_reject_transaction',
+                        lambda tx, report: outcomes.append(('rejected', tx['data']['value'])))
+    agent.enable_cluster(shards=2, build_worker=functools.partial(_build_worker, low))
+    try:
+        agent.process_pending_transactions()
+    finally:
+        agent.close()
+
+    assert [value for _, value in outcomes] == [tx['data']['value'] for tx in selected]
+    assert {value for status, value in outcomes if status == 'rejected'} == {200, 201, 202}
+    assert len(agent.blockchain.pending_transactions) == 0
+
+def test_dead_worker_fails_the_batch_and_is_restarted(senders):
+    transactions = _transactions(senders, per_sender=2)
+    crash = dict(transactions[0], data={'value': -99})
+    build = functools.partial(_build_worker, frozenset(), _CrashingWorker)
+    with ValidatorCluster(build, shards=2) as cluster:
+        with pytest.raises(RuntimeError):
+            cluster.validate([crash] + transactions[1:])
+        assert cluster.restarts == 1
+
+        # The surviving shard's reply to the failed batch must not leak into this one
+        reports = cluster.validate(transactions)
+    assert [r['value'] for r in reports] == [tx['data']['value'] for tx in transactions]
+    assert all(r['valid'] for r in reports)
+
+def test_default_workers_use_the_coordinators_contracts(reputation_chain):
+    blockchain, contract = reputation_chain
+    accounts = contract.w3.eth.accounts[1:5]
+    contract.functions.updateReputation(accounts[0], True, 100, 90, 4).transact()
+    agent = ValidatorAgent(blockchain, "0xValidation")
+    agent.high_value_threshold = 5
+    # Invalid signatures: only the reputation prefetch reaches the contract
+    transactions = [
+        {'sender': a, 'receiver': 'Network', 'data': {'value': i}, 'timestamp': i,
+         'sender_public_key': a, 'signature': '00'}
+        for i, a in enumerate(accounts)
+    ]
+
+    cluster = cluster_for(agent, shards=2, mp_context=multiprocessing.get_context('fork'))
+    worker = cluster.build_worker()
+    assert worker.consensus is False and worker.agent.headless
+    assert worker.agent.blockchain.reputation_contract == contract.address
+    assert worker.agent.blockchain.provider_uri == 'tester'
+    assert worker.agent.blockchain.reputation_cache is not None
+    assert worker.agent.high_value_threshold == 5
+
+    # Forked workers inherit the in-process EVM
+    serial = agent.validate_pending([dict(tx) for tx in transactions])
+    with cluster:
+        reports = [agent.apply_consensus(tx, r)
+                   for tx, r in zip(transactions, cluster.validate(transactions))]
+    assert _strip(reports) == _strip(serial)
+    assert not any(r['valid'] for r in reports)
+
+def test_enable_cluster_replaces_and_close_stops_workers(senders):
+    agent = ValidatorAgent(Blockchain(), "0xValidation")
+    build = functools.partial(_build_worker, frozenset())
+    first = agent.enable_cluster(shards=2, build_worker=build)
+    first.start()
+    processes = [process for process, _ in first._workers]
+
+    second = agent.enable_cluster(shards=2, build_worker=build)
+    assert agent.cluster is second
+    assert not any(process.is_alive() for process in processes)
+
+    second.start()
+    processes = [process for process, _ in second._workers]
+    agent.close()
+    assert agent.cluster is None
+    assert not any(process.is_alive() for process in processes)
@@ -0,0 +1,60 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import pytest
+from Crypto.PublicKey import RSA
+from src.agents.validator_agent import ValidatorAgent
+from src.agents.validator_worker import ValidationWorker
+from src.blockchain.core import Blockchain
+from src.utils.crypto import sign_data
+
+@pytest.fixture(scope='module')
+def signed():
+    keys = [RSA.generate(2048) for _ in range(2)]
+
+    def make(i, signer=0):
+        data = {'value': i}
+        return {
+            'sender': f'agent-{signer}', 'receiver': 'Network', 'data': data, 'timestamp': i,
+            'sender_public_key': keys[signer].publickey().export_key().decode(),
+            'signature': sign_data(keys[signer].export_key().decode(), {'receiver': 'Network', 'data': data})
+        }
+    return make
+
+def test_validator_modules_import_without_langchain_or_web3():
+    code = (
+        "import sys, src.agents.validator_agent, src.agents.validator_worker;"
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'langchain', 'web3'}))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    out = subprocess.check_output([sys.executable, '-c', code], env=env, text=True)
+    assert out.strip() == '[]'
+
+def test_worker_local_only_reports_in_order(signed):
+    transactions = [signed(i) for i in range(5)]
+    transactions[2]['data'] = {'value': -1}  # tampered
+    source = io.StringIO("".join(json.dumps(tx) + "\n" for tx in transactions))
+    sink = io.StringIO()
+
+    assert ValidationWorker().run(source, sink, batch_size=2) == 5
+    reports = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [r['valid'] for r in reports] == [True, True, False, True, True]
+    assert len({r['tx_hash'] for r in reports}) == 5
+
+def test_headless_validator_applies_reputation(signed, monkeypatch):
+    agent = ValidatorAgent(Blockchain(), "0xValidation")
+    assert agent.headless and agent.tools == []
+    with pytest.raises(ValueError):
+        agent.execute("anything")
+
+    low = signed(1, signer=1)
+    scores = {low['sender_public_key']: {'score': 10}}
+    monkeypatch.setattr(agent, 'validate_via_smart_contract', lambda tx: True)
+    monkeypatch.setattr(agent.blockchain, 'get_agent_reputation',
+                        lambda sender, strict=False: scores.get(sender, {'score': 90}))
+
+    reports = agent.validate_pending([signed(2), low, signed(3)])
+    assert [r['valid'] for r in reports] == [True, False, True]
+    assert reports[1]['errors'] == [] and "Low reputation" in reports[1]['warnings'][-1]
@@ -0,0 +1,12 @@
+import os
+
+WEB3_PROVIDER_URI = os.getenv('WEB3_PROVIDER_URI', 'http://localhost:8545')
+# Keep-alive connections held per provider endpoint
+WEB3_POOL_SIZE = int(os.getenv('WEB3_POOL_SIZE', '32'))
+WEB3_REQUEST_TIMEOUT = int(os.getenv('WEB3_REQUEST_TIMEOUT', '30'))
+# Local state kept by long-running agents (monitor cursors, caches)
+DATA_DIR = os.path.expanduser(os.getenv('CHAINSEC_DATA_DIR', '~/.chainsec'))
+# Files the Data Processor tool may read; model-supplied paths are confined here
+DATA_SOURCE_DIR = os.path.expanduser(
+    os.getenv('CHAINSEC_DATA_SOURCE_DIR', os.path.join(DATA_DIR, 'sources'))
+)
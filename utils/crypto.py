@@ -0,0 +1,56 @@
+import hashlib
+import json
+from typing import Dict, List, Mapping, Sequence, Tuple
+from src.utils.signatures import (
+    DEFAULT_SCHEME, get_backend, load_private_key, load_public_key  # noqa: F401
+)
+
+def json_default(value):
+    """Encode records (Transaction, Block) as their dict form, anything else as str"""
+    to_dict = getattr(value, 'to_dict', None)
+    return to_dict() if to_dict is not None else str(value)
+
+def canonical_encode(data) -> bytes:
+    """Deterministic JSON encoding used for hashing and size accounting"""
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), default=json_default).encode()
+
+def hash_data(data) -> str:
+    """
+    SHA-256 hex digest of the canonical JSON encoding of data
+    Records that cache their digest are not re-encoded
+    """
+    digest = getattr(data, 'digest', None)
+    if isinstance(digest, str):
+        return digest
+    return hashlib.sha256(canonical_encode(data)).hexdigest()
+
+# Transaction fields covered by the sender's signature
+SIGNED_FIELDS = ('receiver', 'data', 'previous_hash')
+
+def signed_payload(transaction: Mapping) -> Dict:
+    """
+    What a transaction's signature is over: its SIGNED_FIELDS
+    Signers (ChainSecAgent.sign_transaction) and verifiers both use this
+    """
+    return {field: transaction[field] for field in SIGNED_FIELDS if field in transaction}
+
+def signer_key(transaction: Mapping) -> str:
+    """sender_public_key, or public_key as set by ChainSecAgent.sign_transaction"""
+    return transaction.get('sender_public_key') or transaction.get('public_key', '')
+
+def sign_data(private_key: str, data, scheme: str = DEFAULT_SCHEME) -> str:
+    """Sign the hash of data, returns hex-encoded signature"""
+    return get_backend(scheme).sign(private_key, hash_data(data).encode())
+
+def validate_signature(public_key: str, data_hash: str, signature: str,
+                       scheme: str = DEFAULT_SCHEME) -> bool:
+    """Check a hex signature produced by sign_data against a data hash"""
+    return get_backend(scheme).verify(public_key, data_hash.encode(), signature)
+
+def validate_signatures(items: Sequence[Tuple[str, str, str]],
+                        scheme: str = DEFAULT_SCHEME) -> List[bool]:
+    """validate_signature over (public_key, data_hash, signature) triples of one scheme"""
+    return get_backend(scheme).verify_batch([
+        (public_key, data_hash.encode(), signature)
+        for public_key, data_hash, signature in items
+    ])
@@ -0,0 +1,205 @@
+import bisect
+import functools
+import inspect
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Sequence
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+class MetricsSink:
+    """Receives stage timings from stage() / timed(); see set_sink()"""
+
+    def enter(self, stage: str) -> None:
+        """A call to `stage` started (in-flight gauge +1)"""
+
+    def exit(self, stage: str, seconds: float, error: bool) -> None:
+        """A call to `stage` finished after `seconds` (in-flight gauge -1)"""
+
+class _StageStats:
+    __slots__ = ('count', 'errors', 'total', 'max', 'in_flight', 'buckets')
+
+    def __init__(self, bucket_count: int):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.in_flight = 0
+        self.buckets = [0] * (bucket_count + 1)  # last one is +Inf
+
+class InMemorySink(MetricsSink):
+    """Per-stage counters, latency histograms and in-flight gauges"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.bucket_bounds = tuple(buckets)
+        self._stages: Dict[str, _StageStats] = {}
+        self._lock = threading.Lock()
+
+    def _stage(self, stage: str) -> _StageStats:
+        stats = self._stages.get(stage)
+        if stats is None:
+            stats = self._stages.setdefault(stage, _StageStats(len(self.bucket_bounds)))
+        return stats
+
+    def enter(self, stage: str) -> None:
+        with self._lock:
+            self._stage(stage).in_flight += 1
+
+    def exit(self, stage: str, seconds: float, error: bool) -> None:
+        bucket = bisect.bisect_left(self.bucket_bounds, seconds)
+        with self._lock:
+            stats = self._stage(stage)
+            stats.in_flight -= 1
+            stats.count += 1
+            stats.errors += error
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+            stats.buckets[bucket] += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """{stage: {count, errors, total, mean, max, in_flight, buckets}}"""
+        with self._lock:
+            return {
+                stage: {
+                    'count': s.count,
+                    'errors': s.errors,
+                    'total': s.total,
+                    'mean': s.total / s.count if s.count else 0.0,
+                    'max': s.max,
+                    'in_flight': s.in_flight,
+                    'buckets': list(s.buckets)
+                }
+                for stage, s in self._stages.items()
+            }
+
+    def stages(self) -> List[str]:
+        return sorted(self._stages)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+class PrometheusSink(InMemorySink):
+    """InMemorySink that renders the Prometheus text exposition format"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "chainsec"):
+        super().__init__(buckets)
+        self.prefix = prefix
+        self._server = None
+
+    def render(self) -> str:
+        p = self.prefix
+        lines = [
+            f"# HELP {p}_stage_seconds Latency of instrumented stages",
+            f"# TYPE {p}_stage_seconds histogram"
+        ]
+        snapshot = self.snapshot()
+        for stage in sorted(snapshot):
+            stats = snapshot[stage]
+            cumulative = 0
+            bounds = [repr(float(b)) for b in self.bucket_bounds] + ['+Inf']
+            for bound, count in zip(bounds, stats['buckets']):
+                cumulative += count
+                lines.append(f'{p}_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{p}_stage_seconds_sum{{stage="{stage}"}} {stats["total"]!r}')
+            lines.append(f'{p}_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+        lines += [f"# HELP {p}_stage_errors_total Stage calls that raised",
+                  f"# TYPE {p}_stage_errors_total counter"]
+        lines += [f'{p}_stage_errors_total{{stage="{stage}"}} {snapshot[stage]["errors"]}'
+                  for stage in sorted(snapshot)]
+        lines += [f"# HELP {p}_stage_in_flight Stage calls currently running",
+                  f"# TYPE {p}_stage_in_flight gauge"]
+        lines += [f'{p}_stage_in_flight{{stage="{stage}"}} {snapshot[stage]["in_flight"]}'
+                  for stage in sorted(snapshot)]
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, host: str = "0.0.0.0"):
+        """Expose render() at http://host:port/metrics from a daemon thread"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = sink.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True).start()
+        return self._server
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+# Instrumentation is disabled until a sink is installed
+_sink: Optional[MetricsSink] = None
+_DISABLED = nullcontext()
+
+def set_sink(sink: Optional[MetricsSink]) -> Optional[MetricsSink]:
+    """Install the process-wide sink (None disables); returns the previous one"""
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+def get_sink() -> Optional[MetricsSink]:
+    return _sink
+
+class _Timer:
+    __slots__ = ('sink', 'name', 'start')
+
+    def __init__(self, sink: MetricsSink, name: str):
+        self.sink = sink
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.sink.enter(self.name)
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.sink.exit(self.name, time.perf_counter() - self.start, exc_type is not None)
+        return False
+
+def stage(name: str):
+    """Context manager timing a block as `name`; a shared no-op when disabled"""
+    sink = _sink
+    return _DISABLED if sink is None else _Timer(sink, name)
+
+def timed(name: str):
+    """Decorator timing every call of a function or coroutine function as `name`"""
+    def decorate(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                sink = _sink
+                if sink is None:
+                    return await fn(*args, **kwargs)
+                with _Timer(sink, name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            sink = _sink
+            if sink is None:
+                return fn(*args, **kwargs)
+            with _Timer(sink, name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
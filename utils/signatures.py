@@ -0,0 +1,200 @@
+import hashlib
+import os
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import pkcs1_15
+
+# Transactions without a 'scheme' field predate pluggable backends
+DEFAULT_SCHEME = 'rsa'
+
+class SignatureBackend:
+    """
+    One signature scheme. Keys and signatures are exchanged as strings
+    (PEM for RSA, hex otherwise) so they can be embedded in transactions.
+    """
+    scheme: str = ''
+    # True when verify_batch checks many signatures faster than one by one
+    supports_batch: bool = False
+
+    def generate_private_key(self) -> str:
+        raise NotImplementedError
+
+    def public_key(self, private_key: str) -> str:
+        raise NotImplementedError
+
+    def sign(self, private_key: str, message: bytes) -> str:
+        raise NotImplementedError
+
+    def verify(self, public_key: str, message: bytes, signature: str) -> bool:
+        raise NotImplementedError
+
+    def verify_batch(self, items: Sequence[Tuple[str, bytes, str]]) -> List[bool]:
+        """Verify (public_key, message, signature) triples; one result per item"""
+        return [self.verify(*item) for item in items]
+
+@lru_cache(maxsize=4096)
+def load_public_key(public_key: str) -> RSA.RsaKey:
+    """Parse a PEM public key once per process"""
+    return RSA.import_key(public_key)
+
+@lru_cache(maxsize=64)
+def load_private_key(private_key: str) -> RSA.RsaKey:
+    return RSA.import_key(private_key)
+
+class RSABackend(SignatureBackend):
+    """PKCS#1 v1.5 over SHA-256, the original transaction signature"""
+    scheme = 'rsa'
+
+    def __init__(self, bits: int = 2048):
+        self.bits = bits
+
+    def generate_private_key(self) -> str:
+        return RSA.generate(self.bits).export_key().decode()
+
+    def public_key(self, private_key: str) -> str:
+        return load_private_key(private_key).publickey().export_key().decode()
+
+    def sign(self, private_key: str, message: bytes) -> str:
+        return pkcs1_15.new(load_private_key(private_key)).sign(SHA256.new(message)).hex()
+
+    def verify(self, public_key: str, message: bytes, signature: str) -> bool:
+        try:
+            pkcs1_15.new(load_public_key(public_key)).verify(
+                SHA256.new(message), bytes.fromhex(signature)
+            )
+            return True
+        except (ValueError, TypeError):
+            return False
+
+class Ed25519Backend(SignatureBackend):
+    """
+    RFC 8032 Ed25519 with 32-byte keys and 64-byte signatures.
+    Uses libsodium through PyNaCl when installed, pycryptodome otherwise.
+    """
+    scheme = 'ed25519'
+
+    def __init__(self):
+        try:
+            import nacl.signing  # noqa: F401
+            self._nacl = True
+        except ImportError:
+            self._nacl = False
+
+    def generate_private_key(self) -> str:
+        return os.urandom(32).hex()
+
+    def public_key(self, private_key: str) -> str:
+        if self._nacl:
+            return bytes(_nacl_signing_key(private_key).verify_key).hex()
+        return _eddsa_private_key(private_key).public_key().export_key(format='raw').hex()
+
+    def sign(self, private_key: str, message: bytes) -> str:
+        if self._nacl:
+            return _nacl_signing_key(private_key).sign(message).signature.hex()
+        from Crypto.Signature import eddsa
+
+        return eddsa.new(_eddsa_private_key(private_key), 'rfc8032').sign(message).hex()
+
+    def verify(self, public_key: str, message: bytes, signature: str) -> bool:
+        try:
+            if self._nacl:
+                from nacl.exceptions import BadSignatureError
+
+                try:
+                    _nacl_verify_key(public_key).verify(message, bytes.fromhex(signature))
+                except BadSignatureError:
+                    return False
+                return True
+            from Crypto.Signature import eddsa
+
+            eddsa.new(_eddsa_public_key(public_key), 'rfc8032').verify(
+                message, bytes.fromhex(signature)
+            )
+            return True
+        except (ValueError, TypeError):
+            return False
+
+@lru_cache(maxsize=64)
+def _nacl_signing_key(private_key: str):
+    import nacl.signing
+
+    return nacl.signing.SigningKey(bytes.fromhex(private_key))
+
+@lru_cache(maxsize=4096)
+def _nacl_verify_key(public_key: str):
+    import nacl.signing
+
+    return nacl.signing.VerifyKey(bytes.fromhex(public_key))
+
+@lru_cache(maxsize=64)
+def _eddsa_private_key(private_key: str):
+    from Crypto.PublicKey import ECC
+
+    return ECC.construct(curve='Ed25519', seed=bytes.fromhex(private_key))
+
+@lru_cache(maxsize=4096)
+def _eddsa_public_key(public_key: str):
+    from Crypto.Signature import eddsa
+
+    return eddsa.import_public_key(bytes.fromhex(public_key))
+
+class Secp256k1Backend(SignatureBackend):
+    """
+    ECDSA over secp256k1 (as used by Ethereum accounts) with 33-byte
+    compressed public keys and 65-byte recoverable signatures.
+    Uses eth_keys, which picks up coincurve (libsecp256k1) when installed.
+    """
+    scheme = 'secp256k1'
+
+    def generate_private_key(self) -> str:
+        return os.urandom(32).hex()
+
+    def public_key(self, private_key: str) -> str:
+        return _secp256k1_private_key(private_key).public_key.to_compressed_bytes().hex()
+
+    def sign(self, private_key: str, message: bytes) -> str:
+        digest = hashlib.sha256(message).digest()
+        return _secp256k1_private_key(private_key).sign_msg_hash(digest).to_bytes().hex()
+
+    def verify(self, public_key: str, message: bytes, signature: str) -> bool:
+        from eth_keys import keys
+        from eth_keys.exceptions import BadSignature, ValidationError
+
+        try:
+            return keys.Signature(bytes.fromhex(signature)).verify_msg_hash(
+                hashlib.sha256(message).digest(), _secp256k1_public_key(public_key)
+            )
+        except (BadSignature, ValidationError, ValueError, TypeError):
+            return False
+
+@lru_cache(maxsize=64)
+def _secp256k1_private_key(private_key: str):
+    from eth_keys import keys
+
+    return keys.PrivateKey(bytes.fromhex(private_key))
+
+@lru_cache(maxsize=4096)
+def _secp256k1_public_key(public_key: str):
+    from eth_keys import keys
+
+    return keys.PublicKey.from_compressed_bytes(bytes.fromhex(public_key))
+
+_BACKENDS: Dict[str, SignatureBackend] = {}
+
+def register_backend(backend: SignatureBackend) -> None:
+    """Make a scheme available to sign_data / validate_signature"""
+    _BACKENDS[backend.scheme] = backend
+
+def get_backend(scheme: str = DEFAULT_SCHEME) -> SignatureBackend:
+    try:
+        return _BACKENDS[scheme]
+    except KeyError:
+        raise ValueError(f"Unknown signature scheme: {scheme}") from None
+
+def schemes() -> List[str]:
+    return list(_BACKENDS)
+
+for _backend in (RSABackend(), Ed25519Backend(), Secp256k1Backend()):
+    register_backend(_backend)
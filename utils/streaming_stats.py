@@ -0,0 +1,150 @@
+import itertools
+import json
+import math
+import os
+from typing import Dict, Iterable, Iterator, Optional, Union
+import numpy as np
+
+CHUNK_SIZE = 1 << 20
+
+class RunningStats:
+    """
+    Single-pass count / total / mean / min / max / variance over chunks.
+    Chunks are reduced with NumPy and merged with Chan's parallel update,
+    so memory is bounded by the chunk size and the variance stays stable
+    for large inputs.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def update(self, chunk) -> None:
+        chunk = np.asarray(chunk, dtype=np.float64).ravel()
+        n = chunk.size
+        if n == 0:
+            return
+        chunk_total = float(chunk.sum())
+        chunk_mean = chunk_total / n
+        deviations = chunk - chunk_mean
+        chunk_m2 = float(np.dot(deviations, deviations))
+        chunk_min, chunk_max = float(chunk.min()), float(chunk.max())
+
+        count = self.count + n
+        delta = chunk_mean - self.mean
+        self._m2 += chunk_m2 + delta * delta * self.count * n / count
+        self.mean += delta * n / count
+        self.count = count
+        self.total += chunk_total
+        self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+        self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+
+    @property
+    def variance(self) -> float:
+        """Population variance; 0.0 for empty input"""
+        return self._m2 / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'variance': self.variance,
+            'std': math.sqrt(self.variance)
+        }
+
+def _csv_chunks(path: str, column: Union[int, str, None], chunk_size: int) -> Iterator[np.ndarray]:
+    with open(path) as f:
+        first = f.readline()
+        if not first:
+            return
+        header = [name.strip() for name in first.split(',')]
+        if isinstance(column, str):
+            index = header.index(column)
+            pending = []
+        else:
+            index = column or 0
+            try:
+                float(header[index])
+                pending = [first]  # no header row
+            except ValueError:
+                pending = []
+        lines = itertools.chain(pending, f)
+        while True:
+            batch = list(itertools.islice(lines, chunk_size))
+            if not batch:
+                return
+            yield np.loadtxt(batch, delimiter=',', usecols=index, dtype=np.float64, ndmin=1)
+
+def _ndjson_chunks(path: str, field: Optional[str], chunk_size: int) -> Iterator[np.ndarray]:
+    def values():
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record[field or 'value'] if isinstance(record, dict) else record
+    yield from _iterable_chunks(values(), chunk_size)
+
+def _array_chunks(array: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    if array.ndim > 1:
+        array = array.reshape(-1)
+    for start in range(0, array.size, chunk_size):
+        yield array[start:start + chunk_size]
+
+def _iterable_chunks(values: Iterable, chunk_size: int) -> Iterator[np.ndarray]:
+    iterator = iter(values)
+    while True:
+        chunk = np.fromiter(itertools.islice(iterator, chunk_size), dtype=np.float64)
+        if not chunk.size:
+            return
+        yield chunk
+
+def iter_chunks(source, column: Union[int, str, None] = None,
+                chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    float64 chunks of at most chunk_size values from
+    - a path to a .csv (column by header name or index), .ndjson/.jsonl
+      (field name, default 'value') or .npy file (memory-mapped)
+    - a NumPy array, or any iterable of numbers
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.npy':
+            return _array_chunks(np.load(path, mmap_mode='r'), chunk_size)
+        if extension == '.csv':
+            return _csv_chunks(path, column, chunk_size)
+        if extension in ('.ndjson', '.jsonl'):
+            return _ndjson_chunks(path, column, chunk_size)
+        raise ValueError(f"Unsupported data file: {path}")
+    if isinstance(source, np.ndarray):
+        return _array_chunks(source, chunk_size)
+    return _iterable_chunks(source, chunk_size)
+
+def confine_source(source, root: str):
+    """
+    source itself unless it is a path; a path (relative ones are taken
+    from root) resolves to a real path that must lie under root, so
+    untrusted input cannot read arbitrary files
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        return source
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, os.fspath(source)))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"Data source is outside {root}: {os.fspath(source)}")
+    return path
+
+def stream_stats(source, column: Union[int, str, None] = None,
+                 chunk_size: int = CHUNK_SIZE) -> Dict[str, Optional[float]]:
+    """RunningStats over iter_chunks(source, ...)"""
+    stats = RunningStats()
+    for chunk in iter_chunks(source, column, chunk_size):
+        stats.update(chunk)
+    return stats.as_dict()